@@ -0,0 +1,26 @@
+from enum import Enum
+
+
+class MazeAlgorithm(Enum):
+    """An enum for the algorithm a maze generator carves a maze with
+
+    Args:
+        Enum ([type]): Automatically provided by the enum module.
+
+    Example usage:
+        `MazeAlgorithm.recursiveBacktracker` – long, winding corridors with few dead ends
+        `MazeAlgorithm.kruskal` – lots of short dead ends
+        `MazeAlgorithm.wilson` – an unbiased pick from every possible maze
+
+    Check MazeAlgorithm initializes properly
+    >>> print(MazeAlgorithm.recursiveBacktracker)
+    MazeAlgorithm.recursiveBacktracker
+    >>> print(MazeAlgorithm.kruskal)
+    MazeAlgorithm.kruskal
+    >>> print(MazeAlgorithm.wilson)
+    MazeAlgorithm.wilson
+    """
+
+    recursiveBacktracker = 0
+    kruskal = 1
+    wilson = 2
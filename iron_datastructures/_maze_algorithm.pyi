@@ -0,0 +1,6 @@
+from enum import Enum
+
+class MazeAlgorithm(Enum):
+    recursiveBacktracker: int = ...
+    kruskal: int = ...
+    wilson: int = ...
@@ -0,0 +1,30 @@
+class SearchCheckpoint:
+    """Where a long search stops to let something else run: after every `chunkSize` nodes it processes, the search yields
+    this checkpoint, with `nodesProcessed` brought up to date, and carries on from where it was when it's next resumed.
+
+    >>> checkpoint = SearchCheckpoint(1024)
+    >>> checkpoint.chunkSize, checkpoint.nodesProcessed
+    (1024, 0)
+    >>> SearchCheckpoint(0)
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid chunk size `0` given.
+    """
+
+    chunkSize: int  # the number of nodes to process between checkpoints
+    nodesProcessed: int  # the number of nodes processed so far
+
+    def __init__(self, chunkSize: int) -> None:
+        """Constructor for a search checkpoint.
+
+        Args:
+            chunkSize (int): The number of nodes to process between checkpoints.
+
+        Raises:
+            ValueError: The chunk size isn't positive.
+        """
+        if chunkSize < 1:
+            raise ValueError(f"Invalid chunk size `{chunkSize}` given.")
+
+        self.chunkSize = chunkSize
+        self.nodesProcessed = 0
@@ -0,0 +1,4 @@
+class SearchCheckpoint:
+    chunkSize: int
+    nodesProcessed: int
+    def __init__(self, chunkSize: int) -> None: ...
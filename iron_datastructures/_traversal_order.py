@@ -0,0 +1,24 @@
+from enum import Enum
+
+
+class TraversalOrder(Enum):
+    """An enum for when a depth first traversal visits a node: before or after its connections
+
+    Args:
+        Enum ([type]): Automatically provided by the enum module.
+
+    Example usage:
+        `TraversalOrder.preOrder`
+        `TraversalOrder.postOrder`
+
+    Check TraversalOrder initializes properly
+    >>> preOrder = TraversalOrder.preOrder
+    >>> print(preOrder)
+    TraversalOrder.preOrder
+    >>> postOrder = TraversalOrder.postOrder
+    >>> print(postOrder)
+    TraversalOrder.postOrder
+    """
+
+    preOrder = 0
+    postOrder = 1
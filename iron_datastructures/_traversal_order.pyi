@@ -0,0 +1,5 @@
+from enum import Enum
+
+class TraversalOrder(Enum):
+    preOrder: int = ...
+    postOrder: int = ...
@@ -0,0 +1,44 @@
+from typing import List, Tuple
+
+
+class Biconnectivity:
+    """The places a graph can be cut in two: its articulation points (nodes) and bridges (links) whose removal would
+    disconnect it, and its biconnected components, the pieces that no single node's removal would disconnect.
+
+    >>> Biconnectivity([1], [(0, 1), (1, 2)], [[1, 2], [0, 1]])
+    Biconnectivity(articulationPoints=[1], bridges=[(0, 1), (1, 2)], components=[[1, 2], [0, 1]])
+    """
+
+    articulationPoints: List[int]  # the indices of the nodes whose removal would disconnect the graph, in ascending order
+    bridges: List[Tuple[int, int]]  # the links whose removal would disconnect the graph, each as (lower index, higher index)
+    components: List[List[int]]  # the indices of the nodes of each biconnected component; articulation points are in several
+
+    def __init__(
+        self,
+        articulationPoints: List[int],
+        bridges: List[Tuple[int, int]],
+        components: List[List[int]],
+    ) -> None:
+        """Constructor for a biconnectivity result.
+
+        Args:
+            articulationPoints (List[int]): The indices of the nodes whose removal would disconnect the graph.
+            bridges (List[Tuple[int, int]]): The links whose removal would disconnect the graph.
+            components (List[List[int]]): The indices of the nodes of each biconnected component.
+        """
+        self.articulationPoints = articulationPoints
+        self.bridges = bridges
+        self.components = components
+
+    def __repr__(self) -> str:
+        """Return a string representation of this object
+
+        Returns:
+            str: The string representation of the object, for example:
+        ```
+        "Biconnectivity(articulationPoints=[1], bridges=[(0, 1), (1, 2)], components=[[1, 2], [0, 1]])"
+        ```
+        """
+        return "Biconnectivity(articulationPoints={}, bridges={}, components={})".format(
+            str(self.articulationPoints), str(self.bridges), str(self.components)
+        )
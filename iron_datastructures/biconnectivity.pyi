@@ -0,0 +1,7 @@
+from typing import List, Tuple
+
+class Biconnectivity:
+    articulationPoints: List[int]
+    bridges: List[Tuple[int, int]]
+    components: List[List[int]]
+    def __init__(self, articulationPoints: List[int], bridges: List[Tuple[int, int]], components: List[List[int]]) -> None: ...
@@ -3,11 +3,8 @@
 # queue position enum for specifying the position in the queue
 from _queue_position import QueuePosition
 
-# linked list for enhanced queue
-from linked_list import LinkedList
-
 # type hinting and some safety
-from typing import Optional, TypeVar, Generic
+from typing import List, Optional, TypeVar, Generic
 
 T = TypeVar("T")
 
@@ -28,8 +25,9 @@ class CircularQueue(Generic[T]):
     100
     """
 
-    # this is a circular queue. It is implemented as such
-    __queue: LinkedList[Optional[T]]
+    # this is a circular queue. It is implemented as such, on top of a preallocated
+    # list of slots so that reading or writing any slot is O(1)
+    __queue: List[Optional[T]]
     __maxSize: int
     __length: int
     __tail: int
@@ -51,8 +49,9 @@ class CircularQueue(Generic[T]):
         >>> myQueue._CircularQueue__maxSize     # accessing private attr for testing
         6
         """
-        # initialize `self.queue` to an array of `-1` repeating `maxSize` number of times
-        self.__queue = LinkedList[Optional[T]]([None] * maxSize)  # type: ignore     # for type hinting to work correctly
+        # initialize `self.queue` to a contiguous array of `None` repeating `maxSize` number of times
+        # the slots are allocated once, up front, so enqueueing and dequeueing never allocate
+        self.__queue = [None] * maxSize
         # set `self._maxSize` to provided `maxSize` argument
         self.__maxSize = maxSize
         # set `self.__length` to 0, because there are no elements in our queue just yet
@@ -154,6 +153,8 @@ class CircularQueue(Generic[T]):
 
         # store in a temporary variable because if we return the value here, the rest of the function does not execute
         _dataToReturn = self.__queue[self.__head]
+        # empty the slot so the queue doesn't keep the dequeued item alive
+        self.__queue[self.__head] = None
 
         self.__head = (self.__head + 1) % self.__maxSize
         # decrement `self.__length` by 1
@@ -1,5 +1,4 @@
 from _queue_position import QueuePosition as QueuePosition
-from linked_list import LinkedList as LinkedList
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
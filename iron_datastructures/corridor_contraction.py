@@ -0,0 +1,400 @@
+#!python3.9
+
+# infinite costs for shortest path searches
+import math
+
+# flat arrays for the mappings between the full and reduced graphs
+from array import array
+
+# support type hinting in editor and code
+from typing import Dict, Generic, List, Sequence, Tuple, TypeVar
+
+# the graph being contracted, and the results of searching it
+from graph import Graph
+from indexed_heap import IndexedHeap
+from path_result import PathResult
+
+T = TypeVar("T")
+
+
+class CorridorContraction(Generic[T]):
+    """A graph with its corridors contracted: a reduced graph of just the junctions and dead ends, where each connection
+    stands for a whole corridor and costs as much as going all the way along it.
+
+    A node is part of a corridor if it has exactly two connections, to two other nodes that both connect back to it and
+    nothing else connects to it. Every other node is kept. Mazes are mostly corridors, so searching the reduced graph
+    touches far fewer nodes than searching the full one, and paths through it expand back into full paths.
+
+    If two corridors join the same pair of nodes, only the cheaper one is kept, and corridors that lead straight back to
+    where they started are left out, as neither can be part of a cheapest path. A ring of corridor with no junctions
+    keeps one of its nodes.
+
+    Contract a corridor with a side passage, and find a path through it:
+    >>> #  0 - 1 - 2 - 3 - 4
+    >>> #          |
+    >>> #          5 - 6
+    >>> maze = Graph[None].createGraphFromEdges(7, [(0, 1), (1, 2), (2, 3), (3, 4), (2, 5), (5, 6)], bidirectional=True)
+    >>> contraction = CorridorContraction(maze)
+    >>> [contraction.originalIndexOf(index) for index in range(len(contraction.reduced))]
+    [0, 2, 4, 6]
+    >>> contraction.reduced.getWeight(0, 1)
+    2.0
+    >>> contraction.shortestPath(0, 6)
+    PathResult(path=[0, 1, 2, 5, 6], cost=4.0, nodesExpanded=4)
+    >>> contraction.shortestPath(3, 5)
+    PathResult(path=[3, 2, 5], cost=2.0, nodesExpanded=2)
+    """
+
+    reduced: Graph[T]  # the junctions and dead ends, with a connection for each corridor between them
+    __graph: Graph[T]  # the full graph
+    __version: int  # the full graph's version when it was contracted
+    __originalIndices: "array[int]"  # the index in the full graph of each node of the reduced graph
+    __reducedIndices: "array[int]"  # the index in the reduced graph of each node, or -1 if it's part of a corridor
+    __kept: bytearray  # whether each node is kept, one byte per node
+    # the nodes along the corridor each connection of the reduced graph stands for, not including either end
+    __corridors: Dict[Tuple[int, int], "array[int]"]
+
+    def __init__(self, graph: Graph[T]) -> None:
+        """Constructor for a corridor contraction. Contracts the graph's corridors in `O(V + E)` time.
+
+        The reduced graph's nodes have the same data as the nodes they were kept from. The graph itself isn't changed.
+
+        Args:
+            graph (Graph[T]): The graph to contract.
+        """
+        self.__graph = graph
+        self.__version = graph.getVersion()
+        nodeCount = len(graph)
+
+        # count the connections into each node, to find the nodes that are only connected to by their own two connections
+        inDegrees = array("i", [0]) * nodeCount
+        for index in range(nodeCount):
+            for connection in graph._neighbours(index):
+                inDegrees[connection] += 1
+
+        # which nodes are kept: everything that isn't part of a corridor
+        self.__kept = bytearray(nodeCount)
+        for index in range(nodeCount):
+            self.__kept[index] = not self.__isCorridor(index, inDegrees[index])
+
+        self.__originalIndices = array("i")
+        self.__reducedIndices = array("i", [-1]) * nodeCount
+        # the cheapest corridor found from each kept node to each other, and what it costs
+        corridors: Dict[Tuple[int, int], Tuple[float, "array[int]"]] = {}
+        # which nodes have been walked through, or are kept
+        walked = bytearray(self.__kept)
+
+        def keep(index: int) -> None:
+            # give the node a place in the reduced graph
+            self.__kept[index] = True
+            walked[index] = True
+            self.__reducedIndices[index] = len(self.__originalIndices)
+            self.__originalIndices.append(index)
+
+        def walkCorridorsFrom(index: int) -> None:
+            # walk every corridor out of the node to the kept node at the other end
+            for position in range(len(graph._neighbours(index))):
+                end, cells, cost = self.__walk(index, position)
+                for cell in cells:
+                    walked[cell] = True
+                if end == index:
+                    # it leads straight back here
+                    continue
+                arc = (index, end)
+                if (arc not in corridors) or (cost < corridors[arc][0]):
+                    corridors[arc] = (cost, cells)
+
+        keptIndices = [index for index in range(nodeCount) if self.__kept[index]]
+        for index in keptIndices:
+            keep(index)
+        for index in keptIndices:
+            walkCorridorsFrom(index)
+        # anything not walked through yet is in a ring of corridor with nothing kept on it, so keep one node of each ring
+        for index in range(nodeCount):
+            if not walked[index]:
+                keep(index)
+                walkCorridorsFrom(index)
+
+        # swap the full graph's indices for the reduced graph's
+        self.__corridors = {}
+        weights: List[float] = []
+        for (indexFrom, indexTo), (cost, cells) in corridors.items():
+            arc = (self.__reducedIndices[indexFrom], self.__reducedIndices[indexTo])
+            self.__corridors[arc] = cells
+            weights.append(cost)
+        self.reduced = Graph[T].createGraphFromEdges(
+            len(self.__originalIndices),
+            self.__corridors.keys(),
+            [graph._dataAt(index) for index in self.__originalIndices],  # type: ignore
+            weights=weights,
+        )
+
+    def originalIndexOf(self, reducedIndex: int) -> int:
+        """Get the index in the full graph of a node of the reduced graph.
+
+        Args:
+            reducedIndex (int): The node's index in the reduced graph.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            int: Its index in the full graph.
+        """
+        if not (len(self.__originalIndices) > reducedIndex >= 0):
+            raise IndexError(f"Node at index {reducedIndex} is out of range.")
+        return self.__originalIndices[reducedIndex]
+
+    def reducedIndexOf(self, index: int) -> int:
+        """Get the index in the reduced graph of a node of the full graph.
+
+        Args:
+            index (int): The node's index in the full graph.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            int: Its index in the reduced graph, or -1 if it's part of a corridor.
+        """
+        if not (len(self.__reducedIndices) > index >= 0):
+            raise IndexError(f"Node at index {index} is out of range.")
+        return self.__reducedIndices[index]
+
+    def expandPath(self, reducedPath: Sequence[int]) -> List[int]:
+        """Expand a path through the reduced graph into the path through the full graph that it stands for.
+
+        Args:
+            reducedPath (Sequence[int]): The indices of the nodes along the path through the reduced graph.
+
+        Raises:
+            ValueError: Two nodes next to each other on the path aren't connected in the reduced graph.
+
+        Returns:
+            List[int]: The indices of the nodes along the full path.
+
+        >>> corridor = Graph[None].createGraphFromEdges(4, [(0, 1), (1, 2), (2, 3)], bidirectional=True)
+        >>> CorridorContraction(corridor).expandPath([1, 0])
+        [3, 2, 1, 0]
+        """
+        path: List[int] = []
+        for position, reducedIndex in enumerate(reducedPath):
+            if position > 0:
+                arc = (reducedPath[position - 1], reducedIndex)
+                if arc not in self.__corridors:
+                    raise ValueError(
+                        f"Node index {arc[1]} does not exist in node at index {arc[0]}'s connections."
+                    )
+                path.extend(self.__corridors[arc])
+            path.append(self.originalIndexOf(reducedIndex))
+        return path
+
+    def shortestPath(self, indexFrom: int, indexTo: int) -> PathResult:
+        """Find the cheapest path from one node of the full graph to another, by searching the reduced graph with
+        Dijkstra's algorithm. Either node can be part of a corridor, in which case the search starts from (or finishes
+        at) both ends of the corridor at once.
+
+        Args:
+            indexFrom (int): The index in the full graph of the node to start from.
+            indexTo (int): The index in the full graph of the node to find a path to.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The full graph has changed since it was contracted.
+
+        Returns:
+            PathResult: The full path, its cost, and the number of nodes of the reduced graph expanded to find it.
+            If there's no path, the path is empty.
+        """
+        if self.__graph.getVersion() != self.__version:
+            raise ValueError("The graph has changed since it was contracted.")
+        self.reducedIndexOf(indexFrom)
+        self.reducedIndexOf(indexTo)
+        if indexFrom == indexTo:
+            return PathResult([indexFrom], 0, 0)
+
+        # the ways out of the start's corridor, and into the destination's
+        startWays = self.__waysToEnds(indexFrom, False)
+        starts = self.__cheapestByEnd(startWays)
+        ends = self.__cheapestByEnd(self.__waysToEnds(indexTo, True))
+
+        best = PathResult([], math.inf, 0)
+        for _, cells, _ in startWays:
+            if indexTo in cells:
+                # the destination is along the same corridor, so try going straight there
+                path = [indexFrom] + cells[: cells.index(indexTo) + 1]
+                cost = self.__costAlong(path)
+                if cost < best.cost:
+                    best = PathResult(path, cost, 0)
+
+        # Dijkstra's algorithm from every start at once, each starting at the cost of getting to it
+        reduced = self.reduced
+        costs = [math.inf] * len(reduced)
+        predecessors = array("i", [-1]) * len(reduced)
+        toExpand = IndexedHeap(len(reduced))
+        for start, (_, cost) in starts.items():
+            costs[start] = cost
+            toExpand.push(start, cost)
+        nodesExpanded = 0
+        bestEnd = -1
+
+        while len(toExpand) > 0:
+            currentIndex, cost = toExpand.pop()
+            if cost >= best.cost:
+                # nothing left can lead anywhere cheaper
+                break
+            nodesExpanded += 1
+            if currentIndex in ends:
+                # finishing here, along the destination's corridor, may be the cheapest way yet
+                totalCost = cost + ends[currentIndex][1]
+                if totalCost < best.cost:
+                    best = PathResult([], totalCost, 0)
+                    bestEnd = currentIndex
+
+            weights = reduced._neighbourWeights(currentIndex)
+            for position, neighbour in enumerate(reduced._neighbours(currentIndex)):
+                newCost = cost + (1 if weights is None else weights[position])
+                if newCost < costs[neighbour]:
+                    costs[neighbour] = newCost
+                    predecessors[neighbour] = currentIndex
+                    toExpand.push(neighbour, newCost)
+
+        if bestEnd >= 0:
+            # walk back through the reduced graph to the start it came from, then expand it all into the full path
+            reducedPath = [bestEnd]
+            while predecessors[reducedPath[-1]] >= 0:
+                reducedPath.append(predecessors[reducedPath[-1]])
+            reducedPath.reverse()
+
+            startCells = starts[reducedPath[0]][0]
+            endCells = ends[bestEnd][0]
+            path = [indexFrom] + startCells[:-1] if len(startCells) > 0 else []
+            path.extend(self.expandPath(reducedPath))
+            if len(endCells) > 0:
+                path.extend(reversed(endCells[:-1]))
+                path.append(indexTo)
+            best.path = path
+
+        best.nodesExpanded = nodesExpanded
+        return best
+
+    def __isCorridor(self, index: int, inDegree: int) -> bool:
+        """Check whether a node is part of a corridor: it has exactly two connections, to two other nodes that both connect
+        back to it, and nothing else connects to it.
+
+        Args:
+            index (int): The index of the node.
+            inDegree (int): The number of connections into it.
+
+        Returns:
+            bool: Whether it's part of a corridor.
+        """
+        connections = self.__graph._neighbours(index)
+        if (len(connections) != 2) or (inDegree != 2):
+            return False
+        first, second = connections
+        return (
+            (first != second)
+            and (index not in (first, second))
+            and (index in self.__graph._neighbours(first))
+            and (index in self.__graph._neighbours(second))
+        )
+
+    def __stepCost(self, index: int, position: int) -> float:
+        """Get the cost of one of a node's connections.
+
+        Args:
+            index (int): The index of the node.
+            position (int): The position of the connection in its connections.
+
+        Returns:
+            float: The connection's cost, or 1 if it wasn't given one.
+        """
+        weights = self.__graph._neighbourWeights(index)
+        return 1 if weights is None else weights[position]
+
+    def __walk(self, index: int, position: int) -> Tuple[int, "array[int]", float]:
+        """Walk along the corridor that one of a node's connections leads into, until reaching a kept node.
+
+        Args:
+            index (int): The index of the node to walk from.
+            position (int): The position in its connections of the connection to walk along.
+
+        Returns:
+            Tuple[int, array[int], float]: The kept node at the other end, the nodes along the corridor in between, and
+            the cost of walking all the way.
+        """
+        cells = array("i")
+        previous = index
+        current = self.__graph._neighbours(index)[position]
+        cost = self.__stepCost(index, position)
+        while not self.__kept[current]:
+            cells.append(current)
+            # carry on out of the other side
+            connections = self.__graph._neighbours(current)
+            onward = 0 if connections[0] != previous else 1
+            cost += self.__stepCost(current, onward)
+            previous, current = current, connections[onward]
+        return current, cells, cost
+
+    def __waysToEnds(
+        self, index: int, arriving: bool
+    ) -> List[Tuple[int, List[int], float]]:
+        """Find the ways between a node and the ends of its corridor.
+
+        Args:
+            index (int): The index of the node.
+            arriving (bool): Whether the path arrives at the node, so each way's cost is from the end to the node, rather
+            than from the node to the end.
+
+        Returns:
+            List[Tuple[int, List[int], float]]: For each way, the index in the reduced graph of the end it leads to, the
+            nodes from the node to the end (not including the node itself, but including the end), and the cost.
+            Just the node itself, if it's kept.
+        """
+        if self.__kept[index]:
+            return [(self.__reducedIndices[index], [], 0)]
+
+        ways = []
+        for position in range(2):
+            end, cells, cost = self.__walk(index, position)
+            walked = list(cells) + [end]
+            if arriving:
+                cost = self.__costAlong(walked[::-1] + [index])
+            ways.append((self.__reducedIndices[end], walked, cost))
+        return ways
+
+    @staticmethod
+    def __cheapestByEnd(
+        ways: List[Tuple[int, List[int], float]]
+    ) -> Dict[int, Tuple[List[int], float]]:
+        """Pick the cheapest way to each end, as both ways lead to the same end if the corridor leads out of a node and
+        back into it.
+
+        Args:
+            ways (List[Tuple[int, List[int], float]]): The ways from `__waysToEnds`.
+
+        Returns:
+            Dict[int, Tuple[List[int], float]]: The nodes along the cheapest way to each end, and its cost, by the end.
+        """
+        cheapest: Dict[int, Tuple[List[int], float]] = {}
+        for end, cells, cost in ways:
+            if (end not in cheapest) or (cost < cheapest[end][1]):
+                cheapest[end] = (cells, cost)
+        return cheapest
+
+    def __costAlong(self, path: Sequence[int]) -> float:
+        """Get the cost of walking along a path through the full graph.
+
+        Args:
+            path (Sequence[int]): The indices of the nodes along the path.
+
+        Returns:
+            float: The total cost of its connections.
+        """
+        return float(
+            sum(
+                self.__graph.getWeight(path[position], path[position + 1])
+                for position in range(len(path) - 1)
+            )
+        )
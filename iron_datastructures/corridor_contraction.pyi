@@ -0,0 +1,13 @@
+from graph import Graph as Graph
+from path_result import PathResult as PathResult
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+class CorridorContraction(Generic[T]):
+    reduced: Graph[T]
+    def __init__(self, graph: Graph[T]) -> None: ...
+    def originalIndexOf(self, reducedIndex: int) -> int: ...
+    def reducedIndexOf(self, index: int) -> int: ...
+    def expandPath(self, reducedPath: Sequence[int]) -> List[int]: ...
+    def shortestPath(self, indexFrom: int, indexTo: int) -> PathResult: ...
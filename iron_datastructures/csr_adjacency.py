@@ -0,0 +1,415 @@
+#!python3.9
+
+# flat, typed arrays for the offsets and neighbour indices
+from array import array
+
+# support type hinting in editor and code
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+class CSRAdjacency:
+    """The adjacency of a graph in compressed sparse row (CSR) form.
+
+    Rather than every node owning its own list of connections, every connection of every node is stored
+    back to back in one flat `targets` array. A second array, `offsets`, stores where each node's run of
+    connections starts, so the connections of node `i` are `targets[offsets[i]:offsets[i + 1]]`.
+
+    This costs 4 bytes per connection plus 8 bytes per node, and keeps every node's neighbours next to each other in memory.
+
+    Build an adjacency from some lists of connections:
+    >>> adjacency = CSRAdjacency.fromConnections([[1, 4], [0, 4], [4, 3], [2, 4], [0, 1, 2, 3]])
+    >>> len(adjacency)
+    5
+    >>> adjacency.edgeCount()
+    12
+    >>> list(adjacency.neighbours(4))
+    [0, 1, 2, 3]
+    >>> adjacency.toConnections()
+    [[1, 4], [0, 4], [4, 3], [2, 4], [0, 1, 2, 3]]
+    """
+
+    # `offsets` has one more entry than there are nodes: node `i`'s connections end where node `i + 1`'s begin.
+    # both may be `array`s or `memoryview`s (e.g. of a memory-mapped file) of the same typecodes.
+    offsets: Sequence[int]  # typecode "q"
+    targets: Sequence[int]  # typecode "i"
+    # the cost of each connection in `targets`, or None if every connection costs 1
+    weights: Optional[Sequence[float]]  # typecode "d"
+
+    def __init__(
+        self,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Constructor for a CSR adjacency from already-built offset and target arrays.
+
+        Args:
+            offsets (Sequence[int]): The start of each node's connections in `targets`, followed by `len(targets)`.
+            targets (Sequence[int]): The connections of every node, back to back.
+            weights (Optional[Sequence[float]], optional): The cost of each connection in `targets`. Defaults to None,
+            meaning every connection costs 1.
+
+        Raises:
+            ValueError: `offsets` is empty or doesn't end at the end of `targets`, or there isn't one weight per target.
+
+        >>> CSRAdjacency(array("q", [0, 1, 2]), array("i", [1, 0])).toConnections()
+        [[1], [0]]
+
+        >>> CSRAdjacency(array("q"), array("i"))
+        Traceback (most recent call last):
+        ...
+        ValueError: `offsets` must contain at least one entry.
+        """
+        if len(offsets) < 1:
+            raise ValueError("`offsets` must contain at least one entry.")
+        if offsets[-1] != len(targets):
+            raise ValueError("The last offset must be the number of targets.")
+        if (weights is not None) and (len(weights) != len(targets)):
+            raise ValueError("There must be exactly one weight for every target.")
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    def __len__(self) -> int:
+        """The number of nodes in this adjacency."""
+        return len(self.offsets) - 1
+
+    @staticmethod
+    def fromConnections(
+        connectionsPointers: Iterable[Sequence[int]],
+        weightsPointers: Optional[Iterable[Optional[Sequence[float]]]] = None,
+    ) -> "CSRAdjacency":
+        """Pack lists of connections, one list per node, into CSR form.
+
+        Args:
+            connectionsPointers (Iterable[Sequence[int]]): The connections that each node has.
+            weightsPointers (Optional[Iterable[Optional[Sequence[float]]]], optional): The cost of each node's connections,
+            in the same order, or None for a node whose connections all cost 1. Defaults to None, meaning every connection costs 1.
+
+        Returns:
+            CSRAdjacency: The packed adjacency.
+
+        >>> CSRAdjacency.fromConnections([]).toConnections()
+        []
+        >>> CSRAdjacency.fromConnections([[1, 2], [0]], [None, [2.5]]).toWeights()
+        [[1.0, 1.0], [2.5]]
+        """
+        offsets = array("q", [0])
+        targets = array("i")
+
+        for connections in connectionsPointers:
+            # append this node's connections onto the end of everyone else's
+            targets.extend(connections)
+            # and note where they end
+            offsets.append(len(targets))
+
+        if weightsPointers is None:
+            return CSRAdjacency(offsets, targets)
+
+        weights = array("d")
+        for index, nodeWeights in enumerate(weightsPointers):
+            if nodeWeights is None:
+                connectionCount = offsets[index + 1] - offsets[index]
+                weights.extend(array("d", [1.0]) * connectionCount)
+            else:
+                weights.extend(nodeWeights)
+        return CSRAdjacency(offsets, targets, weights)
+
+    @staticmethod
+    def fromEdges(
+        nodeCount: int,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = False,
+        weights: Optional[Iterable[float]] = None,
+    ) -> "CSRAdjacency":
+        """Build an adjacency from a list of `(from, to)` edges.
+
+        The edges are read once into two flat arrays and then bucketed by their `from` node (a counting sort),
+        so each node's connections keep the order that they appear in `edges`.
+
+        Args:
+            nodeCount (int): The number of nodes in the graph.
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of node indices.
+            bidirectional (bool, optional): Whether to also add the `(to, from)` edge for each edge. Defaults to False.
+            weights (Optional[Iterable[float]], optional): The cost of each edge, in the same order as `edges`. Defaults to None,
+            meaning every edge costs 1.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: There isn't exactly one weight for every edge.
+
+        Returns:
+            CSRAdjacency: The adjacency of the edges.
+
+        >>> CSRAdjacency.fromEdges(4, [(0, 1), (1, 2), (0, 3)]).toConnections()
+        [[1, 3], [2], [], []]
+
+        >>> CSRAdjacency.fromEdges(4, [(0, 1), (1, 2), (0, 3)], bidirectional=True).toConnections()
+        [[1, 3], [0, 2], [1], [0]]
+
+        >>> CSRAdjacency.fromEdges(2, [(0, 2)])
+        Traceback (most recent call last):
+        ...
+        IndexError: Node at index 2 is out of range.
+        """
+        if nodeCount < 0:
+            raise ValueError(f"Invalid node count `{nodeCount}` given.")
+
+        sources, destinations = CSRAdjacency.edgeArrays(nodeCount, edges, bidirectional)
+        edgeWeights = None
+        if weights is not None:
+            edgeWeights = CSRAdjacency.weightArray(weights, bidirectional, len(sources))
+        return CSRAdjacency(array("q", [0]) * (nodeCount + 1), array("i")).withEdges(
+            sources, destinations, edgeWeights
+        )
+
+    @staticmethod
+    def edgeArrays(
+        nodeCount: int, edges: Iterable[Tuple[int, int]], bidirectional: bool = False
+    ) -> Tuple["array[int]", "array[int]"]:
+        """Read a list of `(from, to)` edges into two flat arrays, checking every index on the way.
+
+        Args:
+            nodeCount (int): The number of nodes in the graph.
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of node indices.
+            bidirectional (bool, optional): Whether to also add the `(to, from)` edge straight after each edge. Defaults to False.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+
+        Returns:
+            Tuple[array[int], array[int]]: The `from` and the `to` node of each edge.
+
+        >>> CSRAdjacency.edgeArrays(3, [(0, 1), (2, 1)], bidirectional=True)
+        (array('i', [0, 1, 2, 1]), array('i', [1, 0, 1, 2]))
+        """
+        sources = array("i")
+        destinations = array("i")
+        for indexFrom, indexTo in edges:
+            for index in (indexFrom, indexTo):
+                if not (nodeCount > index >= 0):
+                    raise IndexError(f"Node at index {index} is out of range.")
+            sources.append(indexFrom)
+            destinations.append(indexTo)
+            if bidirectional:
+                # and its reverse straight after, just as if the link had been added with `Graph.addLinkBetween`
+                sources.append(indexTo)
+                destinations.append(indexFrom)
+        return sources, destinations
+
+    @staticmethod
+    def weightArray(
+        weights: Iterable[float], bidirectional: bool, edgeCount: int
+    ) -> "array[float]":
+        """Read the weights of some edges into a flat array, to go with the arrays from `edgeArrays`.
+
+        Args:
+            weights (Iterable[float]): The cost of each edge.
+            bidirectional (bool): Whether each edge's reverse comes straight after it, with the same cost.
+            edgeCount (int): The number of edges from `edgeArrays`, including the reversed edges.
+
+        Raises:
+            ValueError: There isn't exactly one weight for every edge.
+
+        Returns:
+            array[float]: The cost of each edge.
+
+        >>> CSRAdjacency.weightArray([2, 3], True, 4)
+        array('d', [2.0, 2.0, 3.0, 3.0])
+        """
+        weightArray = array("d")
+        for weight in weights:
+            weightArray.append(weight)
+            if bidirectional:
+                weightArray.append(weight)
+        if len(weightArray) != edgeCount:
+            raise ValueError("There must be exactly one weight for every edge.")
+        return weightArray
+
+    def withEdges(
+        self,
+        sources: Sequence[int],
+        destinations: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+    ) -> "CSRAdjacency":
+        """Make a new adjacency with some more edges, each added after its `from` node's existing connections.
+        This is a counting sort over the old and new edges together, so it takes linear time however many edges are added.
+
+        Args:
+            sources (Sequence[int]): The `from` node of each new edge. These are not bounds-checked.
+            destinations (Sequence[int]): The `to` node of each new edge.
+            weights (Optional[Sequence[float]], optional): The cost of each new edge. Defaults to None, meaning each costs 1.
+
+        Returns:
+            CSRAdjacency: The new adjacency. It has weights if this adjacency or the new edges do.
+
+        >>> CSRAdjacency.fromConnections([[1], [], [0]]).withEdges([1, 0], [2, 2]).toConnections()
+        [[1, 2], [2], [0]]
+        """
+        nodeCount = len(self)
+
+        # count each node's connections, old and new...
+        offsets = array("q", [0]) * (nodeCount + 1)
+        for index in range(nodeCount):
+            offsets[index + 1] = self.offsets[index + 1] - self.offsets[index]
+        for source in sources:
+            offsets[source + 1] += 1
+        # ...and turn the counts into running totals, i.e. where each node's connections start
+        for index in range(nodeCount):
+            offsets[index + 1] += offsets[index]
+
+        # only keep weights if there are any to keep
+        newWeights: Optional["array[float]"] = None
+        if (self.weights is not None) or (weights is not None):
+            newWeights = array("d", [1.0]) * (len(self.targets) + len(sources))
+
+        # copy each node's old connections to the start of its run...
+        targets = array("i", [0]) * (len(self.targets) + len(sources))
+        nextSlot = offsets[:-1]
+        for index in range(nodeCount):
+            start = self.offsets[index]
+            end = self.offsets[index + 1]
+            targets[nextSlot[index] : nextSlot[index] + end - start] = array(
+                "i", self.targets[start:end]
+            )
+            if (newWeights is not None) and (self.weights is not None):
+                newWeights[nextSlot[index] : nextSlot[index] + end - start] = array(
+                    "d", self.weights[start:end]
+                )
+            nextSlot[index] += end - start
+        # then drop each new edge into the next free slot of its `from` node
+        for edge, (source, destination) in enumerate(zip(sources, destinations)):
+            targets[nextSlot[source]] = destination
+            if (newWeights is not None) and (weights is not None):
+                newWeights[nextSlot[source]] = weights[edge]
+            nextSlot[source] += 1
+
+        return CSRAdjacency(offsets, targets, newWeights)
+
+    def withoutEdges(
+        self, sources: Sequence[int], destinations: Sequence[int]
+    ) -> "CSRAdjacency":
+        """Make a new adjacency without some edges. Only the nodes that lose connections are looked at closely;
+        everyone else's connections are copied across as they are.
+
+        Args:
+            sources (Sequence[int]): The `from` node of each edge to remove. These are not bounds-checked.
+            destinations (Sequence[int]): The `to` node of each edge to remove.
+
+        Returns:
+            CSRAdjacency: The new adjacency.
+
+        >>> CSRAdjacency.fromConnections([[1, 2], [0], [0]]).withoutEdges([0], [2]).toConnections()
+        [[1], [0], [0]]
+        """
+        # the connections to remove from each node
+        removals: Dict[int, Set[int]] = {}
+        for source, destination in zip(sources, destinations):
+            removals.setdefault(source, set()).add(destination)
+
+        offsets = array("q", [0])
+        targets = array("i")
+        weights: Optional["array[float]"] = None if self.weights is None else array("d")
+        for index in range(len(self)):
+            start = self.offsets[index]
+            end = self.offsets[index + 1]
+            if index in removals:
+                removed = removals[index]
+                for position in range(start, end):
+                    if self.targets[position] not in removed:
+                        targets.append(self.targets[position])
+                        if weights is not None:
+                            weights.append(self.weights[position])  # type: ignore
+            else:
+                targets.extend(self.targets[start:end])
+                if weights is not None:
+                    weights.extend(self.weights[start:end])  # type: ignore
+            offsets.append(len(targets))
+
+        return CSRAdjacency(offsets, targets, weights)
+
+    def edgeCount(self) -> int:
+        """The number of (directed) connections in this adjacency.
+
+        Returns:
+            int: The total number of connections of all the nodes.
+        """
+        return len(self.targets)
+
+    def neighbours(self, index: int) -> Sequence[int]:
+        """Get the connections of the node at `index`.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+
+        Returns:
+            Sequence[int]: The indices of the node's connections.
+        """
+        return self.targets[self.offsets[index] : self.offsets[index + 1]]
+
+    def neighbourWeights(self, index: int) -> Optional[Sequence[float]]:
+        """Get the cost of each of the connections of the node at `index`, in the same order as `neighbours`.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+
+        Returns:
+            Optional[Sequence[float]]: The cost of each connection, or None if every connection costs 1.
+        """
+        if self.weights is None:
+            return None
+        return self.weights[self.offsets[index] : self.offsets[index + 1]]
+
+    def hasEdge(self, indexFrom: int, indexTo: int) -> bool:
+        """Check whether the node at `indexFrom` has a connection to `indexTo`.
+
+        Args:
+            indexFrom (int): The index of the `from` node. This is not bounds-checked.
+            indexTo (int): The index of the `to` node.
+
+        Returns:
+            bool: Whether there is a connection.
+
+        >>> adjacency = CSRAdjacency.fromConnections([[1], [0, 2], []])
+        >>> adjacency.hasEdge(1, 2)
+        True
+        >>> adjacency.hasEdge(2, 1)
+        False
+        """
+        return indexTo in self.neighbours(indexFrom)
+
+    def toConnections(self) -> List[List[int]]:
+        """Unpack this adjacency into one list of connections per node.
+
+        Returns:
+            List[List[int]]: The connections of each node.
+        """
+        return [list(self.neighbours(index)) for index in range(len(self))]
+
+    def toWeights(self) -> Optional[List[List[float]]]:
+        """Unpack the costs of this adjacency's connections into one list per node.
+
+        Returns:
+            Optional[List[List[float]]]: The cost of each node's connections, or None if every connection costs 1.
+        """
+        if self.weights is None:
+            return None
+        return [
+            list(self.neighbourWeights(index))  # type: ignore
+            for index in range(len(self))
+        ]
+
+    def nbytes(self) -> int:
+        """The number of bytes taken up by the offset, target and weight arrays.
+
+        Returns:
+            int: The size of the arrays' buffers, in bytes.
+
+        >>> CSRAdjacency.fromConnections([[1, 4], [0, 4], [4, 3], [2, 4], [0, 1, 2, 3]]).nbytes()
+        96
+        """
+        total = memoryview(self.offsets).nbytes + memoryview(self.targets).nbytes  # type: ignore
+        if self.weights is not None:
+            total += memoryview(self.weights).nbytes  # type: ignore
+        return total
@@ -0,0 +1,50 @@
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+class CSRAdjacency:
+    offsets: Sequence[int]
+    targets: Sequence[int]
+    weights: Optional[Sequence[float]]
+    def __init__(
+        self,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Optional[Sequence[float]] = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @staticmethod
+    def fromConnections(
+        connectionsPointers: Iterable[Sequence[int]],
+        weightsPointers: Optional[Iterable[Optional[Sequence[float]]]] = ...,
+    ) -> CSRAdjacency: ...
+    @staticmethod
+    def fromEdges(
+        nodeCount: int,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = ...,
+        weights: Optional[Iterable[float]] = ...,
+    ) -> CSRAdjacency: ...
+    @staticmethod
+    def edgeArrays(
+        nodeCount: int, edges: Iterable[Tuple[int, int]], bidirectional: bool = ...
+    ) -> Tuple[array[int], array[int]]: ...
+    @staticmethod
+    def weightArray(
+        weights: Iterable[float], bidirectional: bool, edgeCount: int
+    ) -> array[float]: ...
+    def withEdges(
+        self,
+        sources: Sequence[int],
+        destinations: Sequence[int],
+        weights: Optional[Sequence[float]] = ...,
+    ) -> CSRAdjacency: ...
+    def withoutEdges(
+        self, sources: Sequence[int], destinations: Sequence[int]
+    ) -> CSRAdjacency: ...
+    def edgeCount(self) -> int: ...
+    def neighbours(self, index: int) -> Sequence[int]: ...
+    def neighbourWeights(self, index: int) -> Optional[Sequence[float]]: ...
+    def hasEdge(self, indexFrom: int, indexTo: int) -> bool: ...
+    def toConnections(self) -> List[List[int]]: ...
+    def toWeights(self) -> Optional[List[List[float]]]: ...
+    def nbytes(self) -> int: ...
@@ -0,0 +1,201 @@
+#!python3.9
+
+# flat arrays for the parents and sizes of the elements
+from array import array
+
+# support type hinting in editor and code
+from typing import TYPE_CHECKING, Any, Iterable, Tuple
+
+if TYPE_CHECKING:
+    # only needed for type hints. Importing it for real would be circular, as the graph uses disjoint sets itself.
+    from graph import Graph
+
+
+class DisjointSet:
+    """A disjoint set (union-find) of the elements `0` to `size - 1`: it keeps track of which elements have been joined
+    together into the same set, and can tell whether two elements are in the same set in near-constant time.
+
+    Each set is a tree of parent pointers, stored in a flat array. Finding an element's set walks up to the root of its tree,
+    and flattens the path on the way by pointing each element it passes at its grandparent (path compression by halving).
+    Joining two sets hangs the smaller tree under the larger one (union by size), which keeps the trees shallow.
+
+    Join some elements and check which are connected:
+    >>> cells = DisjointSet(6)
+    >>> cells.union(0, 1)
+    True
+    >>> cells.union(1, 2)
+    True
+    >>> cells.union(0, 2)       # already in the same set
+    False
+    >>> cells.connected(0, 2), cells.connected(0, 3)
+    (True, False)
+    >>> cells.componentCount()
+    4
+    >>> cells.sizeOf(2)
+    3
+    """
+
+    __parents: "array[int]"  # each element's parent, or itself if it is the root of its set
+    __sizes: "array[int]"  # the number of elements in each root's set
+    __componentCount: int  # the number of separate sets
+
+    def __init__(self, size: int) -> None:
+        """Constructor for a disjoint set of `size` elements, each in a set of its own.
+
+        Args:
+            size (int): The number of elements.
+
+        Raises:
+            ValueError: The size is negative.
+        """
+        if size < 0:
+            raise ValueError(f"Invalid size `{size}` given.")
+
+        self.__parents = array("i", range(size))
+        self.__sizes = array("i", [1]) * size
+        self.__componentCount = size
+
+    def __len__(self) -> int:
+        return len(self.__parents)
+
+    @staticmethod
+    def fromGraph(graph: "Graph[Any]") -> "DisjointSet":
+        """Build a disjoint set with one element per node of a graph, where the nodes that are connected are in the same set.
+        A connection in either direction joins two nodes.
+
+        Args:
+            graph (Graph[Any]): The graph to build the set from.
+
+        Returns:
+            DisjointSet: The disjoint set of the graph's nodes.
+
+        >>> from graph import Graph
+        >>> maze = Graph[None].createGraphFromEdges(5, [(0, 1), (1, 2), (3, 4)])
+        >>> components = DisjointSet.fromGraph(maze)
+        >>> components.componentCount()
+        2
+        >>> components.connected(0, 2), components.connected(2, 3)
+        (True, False)
+        """
+        disjointSet = DisjointSet(len(graph))
+        disjointSet.unionMany(
+            (index, connection)
+            for index in range(len(graph))
+            for connection in graph.getConnectionsOfNodeAtIndex(index)
+        )
+        return disjointSet
+
+    def find(self, index: int) -> int:
+        """Find the root of the set an element is in. Two elements are in the same set if they have the same root.
+
+        Args:
+            index (int): The element.
+
+        Raises:
+            IndexError: The element is out of range.
+
+        Returns:
+            int: The root element of its set.
+
+        >>> DisjointSet(3).find(3)
+        Traceback (most recent call last):
+        ...
+        IndexError: Element 3 is out of range.
+        """
+        if not (len(self.__parents) > index >= 0):
+            raise IndexError(f"Element {index} is out of range.")
+
+        parents = self.__parents
+        # walk up to the root, pointing everything on the way at its grandparent so the next find is quicker
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def union(self, indexA: int, indexB: int) -> bool:
+        """Join the sets of two elements into one.
+
+        Args:
+            indexA (int): An element of one set.
+            indexB (int): An element of the other set.
+
+        Raises:
+            IndexError: Either element is out of range.
+
+        Returns:
+            bool: Whether the sets were separate, i.e. whether anything changed.
+        """
+        rootA = self.find(indexA)
+        rootB = self.find(indexB)
+        if rootA == rootB:
+            # already in the same set
+            return False
+
+        # hang the smaller set under the larger one
+        if self.__sizes[rootA] < self.__sizes[rootB]:
+            rootA, rootB = rootB, rootA
+        self.__parents[rootB] = rootA
+        self.__sizes[rootA] += self.__sizes[rootB]
+        self.__componentCount -= 1
+        return True
+
+    def unionMany(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """Join the sets of each pair of elements, e.g. for each edge of an edge list.
+
+        Args:
+            pairs (Iterable[Tuple[int, int]]): The pairs of elements to join.
+
+        Raises:
+            IndexError: An element is out of range.
+
+        Returns:
+            int: The number of pairs whose sets were separate, i.e. how many joins changed anything.
+
+        >>> cells = DisjointSet(5)
+        >>> cells.unionMany([(0, 1), (1, 2), (2, 0), (3, 4)])
+        3
+        >>> cells.componentCount()
+        2
+        """
+        merged = 0
+        for indexA, indexB in pairs:
+            if self.union(indexA, indexB):
+                merged += 1
+        return merged
+
+    def connected(self, indexA: int, indexB: int) -> bool:
+        """Check whether two elements are in the same set.
+
+        Args:
+            indexA (int): One element.
+            indexB (int): The other element.
+
+        Raises:
+            IndexError: Either element is out of range.
+
+        Returns:
+            bool: Whether they are in the same set.
+        """
+        return self.find(indexA) == self.find(indexB)
+
+    def sizeOf(self, index: int) -> int:
+        """Get the number of elements in the same set as an element, including itself.
+
+        Args:
+            index (int): The element.
+
+        Raises:
+            IndexError: The element is out of range.
+
+        Returns:
+            int: The size of its set.
+        """
+        return self.__sizes[self.find(index)]
+
+    def componentCount(self) -> int:
+        """Get the number of separate sets.
+
+        Returns:
+            int: The number of sets.
+        """
+        return self.__componentCount
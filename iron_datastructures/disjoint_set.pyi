@@ -0,0 +1,14 @@
+from graph import Graph as Graph
+from typing import Any, Iterable, Tuple
+
+class DisjointSet:
+    def __init__(self, size: int) -> None: ...
+    def __len__(self) -> int: ...
+    @staticmethod
+    def fromGraph(graph: Graph[Any]) -> DisjointSet: ...
+    def find(self, index: int) -> int: ...
+    def union(self, indexA: int, indexB: int) -> bool: ...
+    def unionMany(self, pairs: Iterable[Tuple[int, int]]) -> int: ...
+    def connected(self, indexA: int, indexB: int) -> bool: ...
+    def sizeOf(self, index: int) -> int: ...
+    def componentCount(self) -> int: ...
@@ -0,0 +1,446 @@
+#!python3.9
+
+# reading CSV rows, a chunk of rows or lines at a time
+import csv
+from itertools import accumulate, islice
+
+# unpacking weighted binary records and checking the machine's byte order
+import struct
+import sys
+
+# flat arrays for each chunk of edges and for the adjacency being built
+from array import array
+
+# support type hinting in editor and code
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# compact adjacency storage
+from csr_adjacency import CSRAdjacency
+
+# a chunk of edges: the `from` node, the `to` node and (if the edges have costs) the cost of each edge
+EdgeChunk = Tuple["array[int]", "array[int]", Optional["array[float]"]]
+
+
+class EdgeListReader:
+    """Reads graphs from edge list files straight into CSR adjacency storage, without building a node object, a list of
+    connections per node, or even a list of every edge along the way.
+
+    The file is streamed through twice, a chunk of edges at a time, each chunk as flat arrays: once to count each node's
+    connections, which gives the CSR offsets, and once to drop each connection into its node's next free slot. So reading
+    a file takes about as much memory as the graph it holds, however many edges it has. Each node's connections keep the
+    order they appear in the file, just like `CSRAdjacency.fromEdges`.
+
+    Three kinds of file can be read:
+
+    - text (`readText`): one edge per line, as the `from` and `to` node indices (and its cost, if the edges have costs)
+      separated by whitespace, e.g. SNAP edge lists. Blank lines and comment lines are skipped.
+    - CSV (`readCSV`): one edge per row, with the `from` and `to` node indices (and cost) in any columns.
+    - binary (`readBinary`): one edge after another, each as the `from` and `to` node indices as little-endian `int32`s,
+      followed by its cost as a little-endian `float64` if the edges have costs.
+
+    Read a maze's corridors from a text file and make a graph of them:
+    >>> import os, tempfile
+    >>> from graph import Graph
+    >>> path = os.path.join(tempfile.mkdtemp(), "maze.txt")
+    >>> with open(path, "w") as file:
+    ...     _ = file.write("# from to\\n0 1\\n1 2\\n\\n2 3\\n")
+    >>> Graph[None].createGraphFromAdjacency(EdgeListReader.readText(path, bidirectional=True))
+    ['None -> [1]', 'None -> [0, 2]', 'None -> [1, 3]', 'None -> [2]']
+    """
+
+    # a weighted binary record: the `from` and `to` node indices and the cost
+    __WEIGHTED_RECORD = struct.Struct("<iid")
+    # the field put between the lines of a text chunk, to check each line has the right number of fields. It can't be
+    # mistaken for a line's own field, as it isn't a number
+    __LINE_SEPARATOR = "|"
+
+    @staticmethod
+    def readText(
+        path: str,
+        nodeCount: Optional[int] = None,
+        bidirectional: bool = False,
+        weighted: bool = False,
+        comment: str = "#",
+        chunkSize: int = 65536,
+    ) -> CSRAdjacency:
+        """Read a text edge list: one edge per line, as the `from` and `to` node indices, and then its cost if the edges have
+        costs, separated by whitespace.
+
+        Args:
+            path (str): The path of the file to read.
+            nodeCount (Optional[int], optional): The number of nodes. Defaults to None, meaning one more than the highest
+            node index in the file.
+            bidirectional (bool, optional): Whether to also add the `(to, from)` edge for each edge. Defaults to False.
+            weighted (bool, optional): Whether each line has a third field, the edge's cost. Defaults to False.
+            comment (str, optional): Lines starting with this, after any whitespace, are skipped. Defaults to "#".
+            chunkSize (int, optional): The number of lines to read at a time. Defaults to 65536.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: A line isn't an edge, or the chunk size isn't positive.
+
+        Returns:
+            CSRAdjacency: The adjacency of the edges.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "roads.txt")
+        >>> with open(path, "w") as file:
+        ...     _ = file.write("0 1 2.5\\n1 2 1\\n2 zero 4\\n")
+        >>> EdgeListReader.readText(path, weighted=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: Line 3 of the edge list isn't an edge: '2 zero 4'.
+
+        Each line must be a whole edge, even if one line's extra field would make up for the next line's missing one:
+        >>> with open(path, "w") as file:
+        ...     _ = file.write("  # no costs\\n0 1 2\\n3\\n")
+        >>> EdgeListReader.readText(path)
+        Traceback (most recent call last):
+        ...
+        ValueError: Line 2 of the edge list isn't an edge: '0 1 2'.
+        """
+        EdgeListReader.__checkChunkSize(chunkSize)
+        fieldCount = 3 if weighted else 2
+
+        def chunks() -> Iterator[EdgeChunk]:
+            with open(path) as file:
+                lineNumber = 0
+                while True:
+                    lines = list(islice(file, chunkSize))
+                    if len(lines) == 0:
+                        return
+                    firstLineNumber = lineNumber + 1
+                    lineNumber += len(lines)
+
+                    edgeLines = [
+                        line
+                        for line in lines
+                        if not (line.isspace() or line.lstrip().startswith(comment))
+                    ]
+                    if len(edgeLines) == 0:
+                        continue
+                    # split the whole chunk at once, rather than line by line, with a separator field between lines.
+                    # Every line has exactly its own fields if the separators are all where they should be, so one line's
+                    # missing field can't be made up by another's extra one. Then pick out each line's fields
+                    fields = f" {EdgeListReader.__LINE_SEPARATOR} ".join(edgeLines).split()
+                    stride = fieldCount + 1
+                    try:
+                        if (len(fields) != len(edgeLines) * stride - 1) or (
+                            fields[fieldCount::stride].count(
+                                EdgeListReader.__LINE_SEPARATOR
+                            )
+                            != len(edgeLines) - 1
+                        ):
+                            raise ValueError()
+                        yield (
+                            array("i", map(int, fields[0::stride])),
+                            array("i", map(int, fields[1::stride])),
+                            array("d", map(float, fields[2::stride])) if weighted else None,
+                        )
+                    except (ValueError, OverflowError):
+                        EdgeListReader.__findBadLine(
+                            lines, firstLineNumber, comment, fieldCount
+                        )
+                        raise
+
+        return EdgeListReader.__build(chunks, nodeCount, bidirectional, weighted)
+
+    @staticmethod
+    def readCSV(
+        path: str,
+        nodeCount: Optional[int] = None,
+        bidirectional: bool = False,
+        fromColumn: int = 0,
+        toColumn: int = 1,
+        weightColumn: Optional[int] = None,
+        hasHeader: bool = False,
+        delimiter: str = ",",
+        chunkSize: int = 65536,
+    ) -> CSRAdjacency:
+        """Read a CSV edge list: one edge per row, with its `from` and `to` node indices, and its cost if the edges have
+        costs, in the given columns. Other columns are ignored.
+
+        Args:
+            path (str): The path of the file to read.
+            nodeCount (Optional[int], optional): The number of nodes. Defaults to None, meaning one more than the highest
+            node index in the file.
+            bidirectional (bool, optional): Whether to also add the `(to, from)` edge for each edge. Defaults to False.
+            fromColumn (int, optional): The column of the `from` node indices, counting from 0. Defaults to 0.
+            toColumn (int, optional): The column of the `to` node indices. Defaults to 1.
+            weightColumn (Optional[int], optional): The column of the edges' costs. Defaults to None, meaning every edge
+            costs 1.
+            hasHeader (bool, optional): Whether the first row is a header, and not an edge. Defaults to False.
+            delimiter (str, optional): The character between columns. Defaults to ",".
+            chunkSize (int, optional): The number of rows to read at a time. Defaults to 65536.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: A row isn't an edge, or the chunk size isn't positive.
+
+        Returns:
+            CSRAdjacency: The adjacency of the edges.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "roads.csv")
+        >>> with open(path, "w") as file:
+        ...     _ = file.write("name,from,to,length\\nHigh St,0,1,2.5\\n\\"Mill Lane, East\\",1,2,1\\n")
+        >>> roads = EdgeListReader.readCSV(path, fromColumn=1, toColumn=2, weightColumn=3, hasHeader=True)
+        >>> roads.toConnections(), roads.toWeights()
+        ([[1], [2], []], [[2.5], [1.0], []])
+        """
+        EdgeListReader.__checkChunkSize(chunkSize)
+        weighted = weightColumn is not None
+
+        def chunks() -> Iterator[EdgeChunk]:
+            with open(path, newline="") as file:
+                rows = csv.reader(file, delimiter=delimiter)
+                rowNumber = 0
+                if hasHeader and next(rows, None) is not None:
+                    rowNumber += 1
+                while True:
+                    chunk = [row for row in islice(rows, chunkSize)]
+                    if len(chunk) == 0:
+                        return
+                    sources = array("i")
+                    destinations = array("i")
+                    weights = array("d") if weighted else None
+                    for row in chunk:
+                        rowNumber += 1
+                        if len(row) == 0:
+                            continue
+                        try:
+                            sources.append(int(row[fromColumn]))
+                            destinations.append(int(row[toColumn]))
+                            if weights is not None:
+                                weights.append(float(row[weightColumn]))  # type: ignore
+                        except (IndexError, ValueError, OverflowError):
+                            raise ValueError(
+                                f"Row {rowNumber} of the edge list isn't an edge: {delimiter.join(row)!r}."
+                            )
+                    yield sources, destinations, weights
+
+        return EdgeListReader.__build(chunks, nodeCount, bidirectional, weighted)
+
+    @staticmethod
+    def readBinary(
+        path: str,
+        nodeCount: Optional[int] = None,
+        bidirectional: bool = False,
+        weighted: bool = False,
+        chunkSize: int = 65536,
+    ) -> CSRAdjacency:
+        """Read a binary edge list: one edge after another, each as its `from` and `to` node indices as little-endian
+        `int32`s, followed by its cost as a little-endian `float64` if the edges have costs.
+
+        Args:
+            path (str): The path of the file to read.
+            nodeCount (Optional[int], optional): The number of nodes. Defaults to None, meaning one more than the highest
+            node index in the file.
+            bidirectional (bool, optional): Whether to also add the `(to, from)` edge for each edge. Defaults to False.
+            weighted (bool, optional): Whether each edge is followed by its cost. Defaults to False.
+            chunkSize (int, optional): The number of edges to read at a time. Defaults to 65536.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: The file is cut short part way through an edge, or the chunk size isn't positive.
+
+        Returns:
+            CSRAdjacency: The adjacency of the edges.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "maze.edges")
+        >>> with open(path, "wb") as file:
+        ...     _ = file.write(array("i", [0, 1, 1, 2, 2, 0]).tobytes())
+        >>> EdgeListReader.readBinary(path).toConnections()
+        [[1], [2], [0]]
+        >>> EdgeListReader.readBinary(path, nodeCount=2)
+        Traceback (most recent call last):
+        ...
+        IndexError: Node at index 2 is out of range.
+        """
+        EdgeListReader.__checkChunkSize(chunkSize)
+        recordSize = EdgeListReader.__WEIGHTED_RECORD.size if weighted else 8
+
+        def chunks() -> Iterator[EdgeChunk]:
+            with open(path, "rb") as file:
+                while True:
+                    buffer = file.read(chunkSize * recordSize)
+                    if len(buffer) == 0:
+                        return
+                    if len(buffer) % recordSize != 0:
+                        raise ValueError("This edge file is cut short.")
+
+                    if weighted:
+                        records = list(EdgeListReader.__WEIGHTED_RECORD.iter_unpack(buffer))
+                        yield (
+                            array("i", [record[0] for record in records]),
+                            array("i", [record[1] for record in records]),
+                            array("d", [record[2] for record in records]),
+                        )
+                        continue
+
+                    # the `from` and `to` indices alternate, so read them all at once and then pick them apart
+                    indices = array("i")
+                    indices.frombytes(buffer)
+                    if sys.byteorder != "little":
+                        indices.byteswap()
+                    yield indices[0::2], indices[1::2], None
+
+        return EdgeListReader.__build(chunks, nodeCount, bidirectional, weighted)
+
+    @staticmethod
+    def __build(
+        chunks: Callable[[], Iterator[EdgeChunk]],
+        nodeCount: Optional[int],
+        bidirectional: bool,
+        weighted: bool,
+    ) -> CSRAdjacency:
+        """Build an adjacency from the edges of a file, in two passes over it: counting each node's connections, and then
+        dropping each connection into its node's next free slot.
+
+        Args:
+            chunks (Callable[[], Iterator[EdgeChunk]]): Starts a pass over the file's edges, a chunk at a time.
+            nodeCount (Optional[int]): The number of nodes, or None for one more than the highest node index in the file.
+            bidirectional (bool): Whether to also add the `(to, from)` edge for each edge.
+            weighted (bool): Whether the edges have costs.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: The file changed between the two passes.
+
+        Returns:
+            CSRAdjacency: The adjacency of the edges.
+        """
+        if (nodeCount is not None) and (nodeCount < 0):
+            raise ValueError(f"Invalid node count `{nodeCount}` given.")
+
+        # the first pass counts each node's connections, growing the counts as higher node indices turn up if the
+        # number of nodes isn't known yet
+        counts = array("q", [0]) * (0 if nodeCount is None else nodeCount)
+        for sources, destinations, _ in chunks():
+            if len(sources) == 0:
+                continue
+            for indices in (sources, destinations):
+                lowest = min(indices)
+                highest = max(indices)
+                if lowest < 0:
+                    raise IndexError(f"Node at index {lowest} is out of range.")
+                if highest >= len(counts):
+                    if nodeCount is not None:
+                        raise IndexError(f"Node at index {highest} is out of range.")
+                    counts.extend(array("q", [0]) * (highest + 1 - len(counts)))
+            for source in sources:
+                counts[source] += 1
+            if bidirectional:
+                for destination in destinations:
+                    counts[destination] += 1
+
+        # turn the counts into running totals, i.e. where each node's connections start
+        offsets = array("q", [0])
+        offsets.extend(accumulate(counts))
+        del counts
+        edgeCount = offsets[-1]
+
+        # the second pass drops each connection into the next free slot of its `from` node
+        targets = array("i", [0]) * edgeCount
+        weights = (array("d", [0.0]) * edgeCount) if weighted else None
+        nextSlot = offsets[:-1]
+        for sources, destinations, chunkWeights in chunks():
+            if (len(sources) > 0) and (max(max(sources), max(destinations)) >= len(nextSlot)):
+                raise ValueError("The edge file changed while it was being read.")
+            EdgeListReader.__fill(
+                targets, weights, nextSlot, sources, destinations, chunkWeights, bidirectional
+            )
+
+        if nextSlot != offsets[1:]:
+            raise ValueError("The edge file changed while it was being read.")
+        return CSRAdjacency(offsets, targets, weights)
+
+    @staticmethod
+    def __fill(
+        targets: "array[int]",
+        weights: Optional["array[float]"],
+        nextSlot: "array[int]",
+        sources: "array[int]",
+        destinations: "array[int]",
+        chunkWeights: Optional["array[float]"],
+        bidirectional: bool,
+    ) -> None:
+        """Drop a chunk of connections into the next free slots of their `from` nodes, and if the edges are bidirectional,
+        each one's connection back straight after it, just like `CSRAdjacency.fromEdges`.
+
+        Args:
+            targets (array[int]): The adjacency's targets, being filled in.
+            weights (Optional[array[float]]): The adjacency's weights, being filled in, if the edges have costs.
+            nextSlot (array[int]): The next free slot of each node.
+            sources (array[int]): The `from` node of each connection.
+            destinations (array[int]): The `to` node of each connection.
+            chunkWeights (Optional[array[float]]): The cost of each connection, if the edges have costs.
+            bidirectional (bool): Whether to also connect each `to` node back to its `from` node.
+
+        Raises:
+            ValueError: A node has more connections than were counted for it, so the file changed between the passes.
+        """
+        try:
+            if (weights is None) or (chunkWeights is None):
+                for source, destination in zip(sources, destinations):
+                    targets[nextSlot[source]] = destination
+                    nextSlot[source] += 1
+                    if bidirectional:
+                        targets[nextSlot[destination]] = source
+                        nextSlot[destination] += 1
+            else:
+                for source, destination, weight in zip(sources, destinations, chunkWeights):
+                    slot = nextSlot[source]
+                    targets[slot] = destination
+                    weights[slot] = weight
+                    nextSlot[source] = slot + 1
+                    if bidirectional:
+                        slot = nextSlot[destination]
+                        targets[slot] = source
+                        weights[slot] = weight
+                        nextSlot[destination] = slot + 1
+        except IndexError:
+            raise ValueError("The edge file changed while it was being read.")
+
+    @staticmethod
+    def __findBadLine(
+        lines: List[str], firstLineNumber: int, comment: str, fieldCount: int
+    ) -> None:
+        """Find the first line of a chunk that isn't an edge.
+
+        Args:
+            lines (List[str]): The chunk's lines.
+            firstLineNumber (int): The line number of the chunk's first line, counting from 1.
+            comment (str): Lines starting with this, after any whitespace, are skipped.
+            fieldCount (int): The number of fields an edge's line has.
+
+        Raises:
+            ValueError: The line that isn't an edge.
+        """
+        for lineNumber, line in enumerate(lines, firstLineNumber):
+            if line.isspace() or line.lstrip().startswith(comment):
+                continue
+            fields = line.split()
+            try:
+                if len(fields) != fieldCount:
+                    raise ValueError()
+                int(fields[0])
+                int(fields[1])
+                if fieldCount == 3:
+                    float(fields[2])
+                array("i", [int(fields[0]), int(fields[1])])
+            except (ValueError, OverflowError):
+                raise ValueError(
+                    f"Line {lineNumber} of the edge list isn't an edge: {line.strip()!r}."
+                )
+
+    @staticmethod
+    def __checkChunkSize(chunkSize: int) -> None:
+        """Check a chunk size is positive.
+
+        Raises:
+            ValueError: It isn't.
+        """
+        if chunkSize < 1:
+            raise ValueError(f"Invalid chunk size `{chunkSize}` given.")
@@ -0,0 +1,33 @@
+from csr_adjacency import CSRAdjacency as CSRAdjacency
+from typing import Optional
+
+class EdgeListReader:
+    @staticmethod
+    def readText(
+        path: str,
+        nodeCount: Optional[int] = ...,
+        bidirectional: bool = ...,
+        weighted: bool = ...,
+        comment: str = ...,
+        chunkSize: int = ...,
+    ) -> CSRAdjacency: ...
+    @staticmethod
+    def readCSV(
+        path: str,
+        nodeCount: Optional[int] = ...,
+        bidirectional: bool = ...,
+        fromColumn: int = ...,
+        toColumn: int = ...,
+        weightColumn: Optional[int] = ...,
+        hasHeader: bool = ...,
+        delimiter: str = ...,
+        chunkSize: int = ...,
+    ) -> CSRAdjacency: ...
+    @staticmethod
+    def readBinary(
+        path: str,
+        nodeCount: Optional[int] = ...,
+        bidirectional: bool = ...,
+        weighted: bool = ...,
+        chunkSize: int = ...,
+    ) -> CSRAdjacency: ...
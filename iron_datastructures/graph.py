@@ -1,21 +1,98 @@
 #!python3.9
 
+# measuring the memory taken up by node objects
+import sys
+
+# letting the event loop run part way through long searches
+import asyncio
+
+# taking snapshots of the graph that share its storage
+import copy
+
+# infinite costs for shortest path searches
+import math
+
+# flat arrays for per-node search state
+from array import array
+
 # support type hinting in editor and code
-from typing import Generator, Generic, Iterator, List, Optional, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 # circular queue for breadth first search
 from circular_queue import CircularQueue
 
+# compact adjacency storage
+from csr_adjacency import CSRAdjacency
+
+# cached connected components
+from disjoint_set import DisjointSet
+
+# saving and loading graphs
+from graph_file import GraphFile
+
+# stack and traversal order for depth first search
+from stack import Stack
+from _traversal_order import TraversalOrder
+
 # graph node
 from graph_node import Node
 
+# the result of shortest path searches, and the heap for cheapest path searches
+from path_result import PathResult
+from indexed_heap import IndexedHeap
+
+# where long searches stop to let the event loop run
+from _search_checkpoint import SearchCheckpoint
+
+# the result of finding articulation points and bridges
+from biconnectivity import Biconnectivity
+
 T = TypeVar("T")
 
 
 class Graph(Generic[T]):
     """A binary graph of type {T}."""
 
-    __nodes: List[Node[T]] = []  #  the list of nodes of this graph
+    __nodes: List[Node[T]]  #  the list of nodes of this graph
+    # when the graph is compact, its connections are packed into `__csr` and its nodes' data is kept in `__values`
+    # instead of in `__nodes`
+    __csr: Optional[CSRAdjacency]
+    __values: List[Optional[T]]
+    __version: int  # bumped by every change to the graph's connections
+    # which nodes are connected to which, and the version of the graph that was worked out for
+    __components: Optional[DisjointSet]
+    __componentsVersion: int
+    # columns of numbers, one per node, kept alongside the nodes, and the number each column's new nodes start with
+    __columns: Dict[str, "array[Any]"]
+    __columnDefaults: Dict[str, float]
+    # the connections into each node, and the version of the graph they were worked out for
+    __reverse: Optional[CSRAdjacency]
+    __reverseVersion: int
+    # whether the graph is a snapshot, which can't be changed
+    __isSnapshot: bool
+    # what the graph still shares with its snapshots, and so has to copy before changing: the list of nodes, the list of
+    # compact nodes' data, and columns. Once the list of nodes has been copied, its nodes are still shared, apart from
+    # those in `__copiedNodes`
+    __nodesShared: bool
+    __copiedNodes: Optional[Set[int]]
+    __valuesShared: bool
+    __sharedColumns: Set[str]
 
     def __init__(self, nodes: Optional[list[Node[T]]] = None):
         """Constructor for a binary tree of type {T}.
@@ -32,6 +109,23 @@ class Graph(Generic[T]):
         []
         """
 
+        # start off with no nodes, stored as node objects
+        self.__nodes = []
+        self.__csr = None
+        self.__values = []
+        self.__version = 0
+        self.__components = None
+        self.__componentsVersion = -1
+        self.__reverse = None
+        self.__reverseVersion = -1
+        self.__columns = {}
+        self.__columnDefaults = {}
+        self.__isSnapshot = False
+        self.__nodesShared = False
+        self.__copiedNodes = None
+        self.__valuesShared = False
+        self.__sharedColumns = set()
+
         # Check if any nodes were provided
         if nodes is not None:
             # And if any were, set the nodes to them
@@ -45,51 +139,324 @@ class Graph(Generic[T]):
         """
         # map each of the nodes in the graph to a string and put all those into a list
         # and then return the stringified list.
-        return str(list(map(str, self.__nodes)))
+        return str(list(map(str, self)))
 
     def __iter__(self) -> Generator[Node[T], None, None]:
         """Make this class iterable
 
         Yields:
             Generator[Node[T], None, None]: The nodes of the graph, in the order that the graph was initialized with them.
+            If the graph is compact, each node is a fresh object built from the packed storage.
         """
+        if self.__csr is not None:
+            for index, data in enumerate(self.__values):
+                weights = self.__csr.neighbourWeights(index)
+                yield Node[T](
+                    data,
+                    list(self.__csr.neighbours(index)),
+                    None if weights is None else list(weights),
+                )
+            return
+
         for node in self.__nodes:
             yield node
 
-    def __getitem__(self, key: int) -> Optional[T]:
-        index = 0
-        for node in self:
-            if index == key:
-                return node.data
-            index += 1
-        # not found
-        raise IndexError(f"Value at index {key} not found.")
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[Optional[T], List[Optional[T]]]:
+        """Get the data of the node at an index, or of the nodes in a slice of indices.
+
+        Args:
+            key (Union[int, slice]): The index of the node, or the slice of indices.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            Union[Optional[T], List[Optional[T]]]: The node's data, or a list of the nodes' data.
+
+        >>> maze = Graph[str]([Node('Entrance', []), Node('1', []), Node('2', []), Node('Exit', [])])
+        >>> maze[3]
+        'Exit'
+        >>> maze[1:3]
+        ['1', '2']
+        >>> maze[::-2]
+        ['Exit', '1']
+        >>> maze[4]
+        Traceback (most recent call last):
+        ...
+        IndexError: Value at index 4 not found.
+        """
+        if isinstance(key, slice):
+            return [self._dataAt(index) for index in range(len(self))[key]]
+
+        self.__checkDataIndexIsValidWithException(key)
+        return self._dataAt(key)
 
     def __len__(self) -> int:
+        if self.__csr is not None:
+            return len(self.__csr)
         return len(self.__nodes)
 
-    def getConnectionsOfNodeAtIndex(self, index: int) -> List[int]:
+    def _neighbours(self, index: int) -> Sequence[int]:
+        """Get the connections of the node at `index`, whichever way they are stored.
+        Traversals go through this (and `_dataAt`) rather than the node objects, so that they work on any storage.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+
+        Returns:
+            Sequence[int]: The indices of the node's connections.
+        """
+        if self.__csr is not None:
+            return self.__csr.neighbours(index)
+        return self.__nodes[index].connections
+
+    def _neighbourWeights(self, index: int) -> Optional[Sequence[float]]:
+        """Get the cost of each of the connections of the node at `index`, in the same order as `_neighbours`.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+
+        Returns:
+            Optional[Sequence[float]]: The cost of each connection, or None if every connection costs 1.
+        """
+        if self.__csr is not None:
+            return self.__csr.neighbourWeights(index)
+        return self.__nodes[index].weights
+
+    def _dataAt(self, index: int) -> Optional[T]:
+        """Get the data of the node at `index`, whichever way it is stored.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+
+        Returns:
+            Optional[T]: The node's data.
+        """
+        if self.__csr is not None:
+            return self.__values[index]
+        return self.__nodes[index].data
+
+    def _setDataAt(self, index: int, newValue: Optional[T]) -> None:
+        """Set the data of the node at `index`, whichever way it is stored.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+            newValue (Optional[T]): The node's new data.
+        """
+        self._checkCanChange()
+        if self.__csr is not None:
+            # the data of a compact graph lives in a plain list
+            self.__editableValues()[index] = newValue
+        else:
+            self.__editableNode(index).data = newValue
+
+    def getConnectionsOfNodeAtIndex(self, index: int) -> Sequence[int]:
         """Get the connections of a node at specified index.
 
         Args:
             index (int): The index of the node.
 
         Returns:
-            List[int]: The list indices of its connected cells.
+            Sequence[int]: The list indices of its connected cells.
+
+        >>> Graph[None]([Node(None, [1]), Node(None, [0])]).getConnectionsOfNodeAtIndex(1)
+        [0]
         """
-        return self.__nodes[index].connections
+        self.__checkIndexIsValidWithException(index)
+        return self._neighbours(index)
+
+    def getWeight(self, indexFrom: int, indexTo: int) -> float:
+        """Get the cost of the connection from one node to another.
+
+        Args:
+            indexFrom (int): The index of the node the connection is from.
+            indexTo (int): The index of the node the connection is to.
+
+        Raises:
+            IndexError: The `from` index is out of range.
+            ValueError: There is no connection from `indexFrom` to `indexTo`.
+
+        Returns:
+            float: The connection's cost, or 1 if it wasn't given one.
+
+        >>> roads = Graph[None].createGraphFromEdges(3, [(0, 1), (1, 2)], weights=[2.5, 4])
+        >>> roads.getWeight(0, 1), roads.getWeight(1, 2)
+        (2.5, 4.0)
+        >>> Graph[None].createGraphFromEdges(2, [(0, 1)]).getWeight(0, 1)
+        1
+        """
+        self.__checkIndexIsValidWithException(indexFrom)
+        connections = self._neighbours(indexFrom)
+        for position, connection in enumerate(connections):
+            if connection == indexTo:
+                weights = self._neighbourWeights(indexFrom)
+                return 1 if weights is None else weights[position]
+        raise ValueError(
+            f"Node index {indexTo} does not exist in node at index {indexFrom}'s connections."
+        )
 
     def setNodeData(self, index: int, newValue: T) -> None:
-        for nodeIndex, node in enumerate(
-            self
-        ):  # loop through self's nodes with an index counter as well as current node
-            if nodeIndex == index:
-                # set the node data bc index is correct
-                node.data = newValue
-                # make sure to return so we don't loop over everything!
-                return
-        # not found
-        raise IndexError(f"Value at index {index} not found.")
+        """Set the data of the node at an index.
+
+        Args:
+            index (int): The index of the node.
+            newValue (T): The node's new data.
+
+        Raises:
+            IndexError: The index is out of range.
+        """
+        self.__checkDataIndexIsValidWithException(index)
+        self._setDataAt(index, newValue)
+
+    def getData(self, indices: Union[Iterable[int], slice]) -> List[Optional[T]]:
+        """Get the data of many nodes at once.
+
+        Args:
+            indices (Union[Iterable[int], slice]): The indices of the nodes, or a slice of indices.
+
+        Raises:
+            IndexError: An index is out of range.
+
+        Returns:
+            List[Optional[T]]: The data of each node, in the same order as `indices`.
+
+        >>> maze = Graph[str]([Node('Entrance', []), Node('1', []), Node('Exit', [])])
+        >>> maze.getData([2, 0])
+        ['Exit', 'Entrance']
+        """
+        if isinstance(indices, slice):
+            indices = range(len(self))[indices]
+        result: List[Optional[T]] = []
+        for index in indices:
+            self.__checkDataIndexIsValidWithException(index)
+            result.append(self._dataAt(index))
+        return result
+
+    def setData(
+        self, indices: Union[Iterable[int], slice], values: Iterable[Optional[T]]
+    ) -> None:
+        """Set the data of many nodes at once. Nothing is changed unless every index is valid.
+
+        Args:
+            indices (Union[Iterable[int], slice]): The indices of the nodes, or a slice of indices.
+            values (Iterable[Optional[T]]): The new data of each node, in the same order as `indices`.
+
+        Raises:
+            IndexError: An index is out of range.
+            ValueError: There isn't exactly one value for every index.
+
+        >>> maze = Graph[str].createGraph(4, 1)
+        >>> maze.setData(slice(1, 3), ['1', '2'])
+        >>> maze.setData([0, 3], ['Entrance', 'Exit'])
+        >>> maze[:]
+        ['Entrance', '1', '2', 'Exit']
+        """
+        if isinstance(indices, slice):
+            indices = range(len(self))[indices]
+        indices = list(indices)
+        values = list(values)
+        if len(indices) != len(values):
+            raise ValueError("There must be exactly one value for every index.")
+
+        for index in indices:
+            self.__checkDataIndexIsValidWithException(index)
+        for index, value in zip(indices, values):
+            self._setDataAt(index, value)
+
+    def addColumn(
+        self, name: str, typecode: str = "d", default: float = 0
+    ) -> "array[Any]":
+        """Add a column of numbers to the graph, with one number per node, e.g. the cost of moving through each cell.
+        The column is a flat `array` kept alongside the nodes rather than on them, so a whole column can be read or
+        updated at once (e.g. with slice assignment) without touching any node objects.
+
+        The column grows (with `default`) and shrinks along with the number of nodes.
+
+        Args:
+            name (str): The name of the column.
+            typecode (str, optional): The `array` typecode of the numbers, e.g. `"d"` for floats or `"i"` for ints. Defaults to `"d"`.
+            default (float, optional): The number each node starts with. Defaults to 0.
+
+        Raises:
+            ValueError: There's already a column with this name.
+
+        Returns:
+            array[Any]: The column itself. Changes to it are changes to the graph's column.
+
+        >>> maze = Graph[None].createGraph(3, 1)
+        >>> costs = maze.addColumn('cost', 'd', 1.0)
+        >>> costs[1:] = array('d', [2.5, 4.0])
+        >>> maze.column('cost')
+        array('d', [1.0, 2.5, 4.0])
+        >>> maze.setNodesFromValuesAndConnections([None], [[]])
+        >>> maze.column('cost')
+        array('d', [1.0, 2.5, 4.0, 1.0])
+        """
+        self._checkCanChange()
+        if name in self.__columns:
+            raise ValueError(f"Column '{name}' already exists.")
+
+        self.__columns[name] = array(typecode, [default]) * len(self)  # type: ignore
+        self.__columnDefaults[name] = default
+        return self.__columns[name]
+
+    def column(self, name: str) -> "array[Any]":
+        """Get a column of numbers added with `addColumn`.
+
+        Args:
+            name (str): The name of the column.
+
+        Raises:
+            KeyError: There's no column with this name.
+
+        Returns:
+            array[Any]: The column itself. Changes to it are changes to the graph's column. A snapshot's columns must not
+            be changed.
+        """
+        if name not in self.__columns:
+            raise KeyError(f"No column named '{name}'.")
+        return self.__editableColumn(name)
+
+    def removeColumn(self, name: str) -> None:
+        """Remove a column of numbers added with `addColumn`.
+
+        Args:
+            name (str): The name of the column.
+
+        Raises:
+            KeyError: There's no column with this name.
+        """
+        self._checkCanChange()
+        if name not in self.__columns:
+            raise KeyError(f"No column named '{name}'.")
+        del self.__columns[name]
+        del self.__columnDefaults[name]
+        self.__sharedColumns.discard(name)
+
+    def columnNames(self) -> List[str]:
+        """Get the names of the graph's columns of numbers.
+
+        Returns:
+            List[str]: The names, in the order the columns were added.
+        """
+        return list(self.__columns)
+
+    def __resizeColumns(self) -> None:
+        """Make every column the same length as the number of nodes, adding default numbers or dropping numbers off the end."""
+        for name, values in self.__columns.items():
+            if len(values) == len(self):
+                # nothing to change, so no need to copy it if it's shared
+                continue
+            values = self.__editableColumn(name)
+            if len(values) > len(self):
+                del values[len(self) :]
+            else:
+                values.extend(
+                    array(values.typecode, [self.__columnDefaults[name]])
+                    * (len(self) - len(values))
+                )
 
     @staticmethod
     def createGraph(sizeX: int, sizeY: int) -> "Graph[T]":
@@ -111,9 +478,176 @@ class Graph(Generic[T]):
             raise ValueError(f"Invalid size `({sizeX}, {sizeY})` given.")
 
         # make a list of nodes of the correct length
-        everyNode = [Node[T](None) for _ in range(0, sizeX * sizeY)]
+        everyNode = [Node[T](None, []) for _ in range(0, sizeX * sizeY)]
         return Graph[T](nodes=everyNode)
 
+    @staticmethod
+    def manhattanHeuristic(sizeX: int) -> Callable[[int, int], float]:
+        """Make a heuristic for `aStar` on a grid made with `createGraph`, where the cell at `(x, y)` is the node at index `y * sizeX + x`.
+        The heuristic is the Manhattan distance between two cells: the number of steps between them if there were no walls.
+
+        Args:
+            sizeX (int): The X size of the grid.
+
+        Returns:
+            Callable[[int, int], float]: The heuristic, which takes the index of a node and the index of the destination.
+
+        >>> heuristic = Graph.manhattanHeuristic(4)
+        >>> heuristic(0, 15)        # from (0, 0) to (3, 3)
+        6
+        >>> heuristic(6, 5)         # from (2, 1) to (1, 1)
+        1
+        """
+        if sizeX < 1:
+            raise ValueError(f"Invalid size `{sizeX}` given.")
+
+        def heuristic(index: int, indexTo: int) -> float:
+            return abs((index % sizeX) - (indexTo % sizeX)) + abs(
+                (index // sizeX) - (indexTo // sizeX)
+            )
+
+        return heuristic
+
+    @staticmethod
+    def createGraphFromEdges(
+        nodeCount: int,
+        edges: Iterable[Tuple[int, int]],
+        values: Optional[list[T]] = None,
+        bidirectional: bool = False,
+        weights: Optional[Iterable[float]] = None,
+    ) -> "Graph[T]":
+        """Creates a compact graph from a list of `(from, to)` edges.
+
+        Args:
+            nodeCount (int): The number of nodes in the graph.
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of node indices to connect.
+            values (Optional[list[T]], optional): The value of each node. Defaults to None for every node.
+            bidirectional (bool, optional): Whether to connect each edge both ways. Defaults to False.
+            weights (Optional[Iterable[float]], optional): The cost of each edge, in the same order as `edges`. Defaults to None,
+            meaning every edge costs 1.
+
+        Returns:
+            Graph[T]: The compact graph object.
+
+        >>> graph = Graph[str].createGraphFromEdges(3, [(0, 1), (1, 2)], ['a', 'b', 'c'], bidirectional=True)
+        >>> graph
+        ['a -> [1]', 'b -> [0, 2]', 'c -> [1]']
+        >>> graph.isCompact()
+        True
+        """
+        if values is None:
+            values = [None] * nodeCount  # type: ignore
+        elif len(values) != nodeCount:
+            raise ValueError("There must be exactly one value for every node.")
+
+        graph = Graph[T]()
+        graph.__csr = CSRAdjacency.fromEdges(nodeCount, edges, bidirectional, weights)
+        graph.__values = list(values)  # type: ignore
+        return graph
+
+    def save(self, path: str) -> None:
+        """Save the graph to a file in the compact binary format of `GraphFile`: its connections in CSR form, followed by
+        its nodes' data (pickled) if any node has any.
+
+        Args:
+            path (str): The path of the file to save to, which is replaced if it exists.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "maze.graph")
+        >>> Graph[str]([Node('Entrance', [1]), Node('Exit', [0])]).save(path)
+        >>> maze = Graph[str].load(path)
+        >>> maze
+        ['Entrance -> [1]', 'Exit -> [0]']
+        >>> maze.isCompact()
+        True
+        """
+        GraphFile.write(
+            path,
+            self._adjacency(),
+            [self._dataAt(index) for index in range(len(self))],
+        )
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> "Graph[T]":
+        """Load a graph saved with `save`. The graph is compact.
+
+        With `mmap`, the file is memory-mapped and the graph's connections are read straight out of it, so loading
+        takes the same time however big the graph is, and processes loading the same file share its memory. Changing
+        the graph's connections copies them out of the file first; the file itself is never changed.
+
+        The nodes' data is unpickled, so only load files you trust.
+
+        Args:
+            path (str): The path of the file to load.
+            mmap (bool, optional): Whether to memory-map the file rather than read it into memory. Defaults to True.
+
+        Raises:
+            ValueError: The file isn't a graph file, is from a newer version of the format, or is cut short.
+
+        Returns:
+            Graph[T]: The loaded graph.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "maze.graph")
+        >>> Graph[None].createGraphFromEdges(4, [(0, 1), (1, 2), (2, 3)], bidirectional=True).save(path)
+        >>> maze = Graph[None].load(path)
+        >>> maze.shortestPath(0, 3).path
+        [0, 1, 2, 3]
+        >>> maze.addLinkBetween(0, 3)
+        >>> Graph[None].load(path, mmap=False).connectionExistsFrom(0, 3)
+        False
+        """
+        adjacency, values = GraphFile.read(path, mmap)
+        return Graph[T].createGraphFromAdjacency(adjacency, values)  # type: ignore
+
+    @staticmethod
+    def createGraphFromAdjacency(
+        adjacency: CSRAdjacency, values: Optional[list[T]] = None
+    ) -> "Graph[T]":
+        """Creates a compact graph that uses an existing CSR adjacency as its connections, without copying it.
+
+        Args:
+            adjacency (CSRAdjacency): The connections of the graph's nodes.
+            values (Optional[list[T]], optional): The value of each node. Defaults to None for every node.
+
+        Raises:
+            ValueError: There isn't exactly one value for every node.
+
+        Returns:
+            Graph[T]: The compact graph object.
+
+        >>> Graph[str].createGraphFromAdjacency(CSRAdjacency.fromConnections([[1], [0]]), ['a', 'b'])
+        ['a -> [1]', 'b -> [0]']
+        """
+        if values is None:
+            values = [None] * len(adjacency)  # type: ignore
+        elif len(values) != len(adjacency):
+            raise ValueError("There must be exactly one value for every node.")
+
+        graph = Graph[T]()
+        graph.__csr = adjacency
+        graph.__values = list(values)  # type: ignore
+        return graph
+
+    def _adjacency(self) -> CSRAdjacency:
+        """Get the graph's connections in CSR form: its own, if it's compact, or else packed from its nodes.
+
+        Returns:
+            CSRAdjacency: The connections of every node.
+        """
+        if self.__csr is not None:
+            return self.__csr
+
+        weightsPointers: Optional[List[Optional[Sequence[float]]]] = [
+            self._neighbourWeights(index) for index in range(len(self))
+        ]
+        if all(weights is None for weights in weightsPointers):  # type: ignore
+            # only pack weights if any connection has one
+            weightsPointers = None
+        return CSRAdjacency.fromConnections(
+            (self._neighbours(index) for index in range(len(self))), weightsPointers
+        )
+
     def setNodesFromNodesList(self, nodes: list[Node[T]]) -> None:
         """Set a graph's nodes from a list of nodes.
 
@@ -131,16 +665,27 @@ class Graph(Generic[T]):
         >>> sampleMaze
         ['None -> [1, 4]', 'None -> [0, 4]', 'None -> [4, 3]', 'None -> [2, 4]', 'None -> [0, 1, 2, 3]']
         """
+        self._checkCanChange()
         self.__nodes = nodes
+        self.__csr = None
+        self.__values = []
+        self.__storageReplaced()
+        self.__resizeColumns()
+        self._structureChanged()
 
     def setNodesFromValuesAndConnections(
-        self, values: list[T], connectionsPointers: list[list[int]]
+        self,
+        values: list[T],
+        connectionsPointers: list[list[int]],
+        compact: bool = False,
     ) -> None:
         """Give a Tree object some nodes.
 
         Args:
             values (List[T]): the value of each node.
             connectionsPointers (List[List[int]]): the connections that each node has.
+            compact (bool, optional): Whether to replace the graph's nodes with compact (CSR) storage of these nodes,
+            rather than appending them as node objects. Defaults to False.
 
         Setting a graph's nodes from provided data and connections:
         >>> maze = Graph[None]()
@@ -159,14 +704,39 @@ class Graph(Generic[T]):
         ... ])
         >>> maze
         ['None -> [1, 4]', 'None -> [0, 4]', 'None -> [4, 3]', 'None -> [2, 4]', 'None -> [0, 1, 2, 3]']
+
+        Setting the same nodes, but compactly:
+        >>> maze.setNodesFromValuesAndConnections([None] * 5, [[1, 4], [0, 4], [4, 3], [2, 4], [0, 1, 2, 3]], compact=True)
+        >>> maze.isCompact()
+        True
+        >>> maze
+        ['None -> [1, 4]', 'None -> [0, 4]', 'None -> [4, 3]', 'None -> [2, 4]', 'None -> [0, 1, 2, 3]']
         """
+        self._checkCanChange()
+
+        if compact:
+            if len(values) != len(connectionsPointers):
+                raise ValueError("There must be exactly one value for every node.")
+            self.__nodes = []
+            self.__csr = CSRAdjacency.fromConnections(connectionsPointers)
+            self.__values = list(values)  # type: ignore
+            self.__storageReplaced()
+            self.__resizeColumns()
+            self._structureChanged()
+            return
+
+        # appending node objects, so make sure the nodes we already have are node objects too
+        self.__expandCompactStorage()
 
+        nodes = self.__editableNodes()
         for index, thisValue in enumerate(values):
             # make new `Node` with this value's data and left and right pointers
             thisNode: Node[T] = Node(
                 data=thisValue, connections=connectionsPointers[index]
             )
-            self.__nodes.append(thisNode)  # append new node to `self.nodes`
+            nodes.append(thisNode)  # append new node to `self.nodes`
+        self.__resizeColumns()
+        self._structureChanged()
 
     def connectionExistsFrom(self, indexA: int, indexB: int) -> bool:
         """Check whether there is a connection from provided node index A to index B.
@@ -215,16 +785,240 @@ class Graph(Generic[T]):
         ...
         IndexError: Node at index 48 is nonexistent.
         """
+        if self.__csr is not None:
+            if not (len(self) > indexA >= -len(self)):
+                raise IndexError("Node at index {} is nonexistent.".format(str(indexA)))
+            return self.__csr.hasEdge(indexA % len(self), indexB)
+
         try:
             # check there's a connection between indexA and indexB
             return indexB in self.__nodes[indexA].connections
         except IndexError:
             raise IndexError("Node at index {} is nonexistent.".format(str(indexA)))
 
-    def __setAllNotVisited(self) -> None:
-        """Set all the nodes of the graph's `visited` status to `False`."""
+    def isCompact(self) -> bool:
+        """Check whether the graph's nodes are stored compactly, in CSR form, rather than as node objects.
+
+        Returns:
+            bool: Whether the graph is compact.
+        """
+        return self.__csr is not None
+
+    def compact(self) -> None:
+        """Pack the graph's connections into compressed sparse row (CSR) storage, replacing its node objects.
+
+        A compact graph can still be traversed and queried as normal. Adding or removing links turns it back
+        into node objects first.
+
+        >>> maze = Graph[int]([Node(0, [1]), Node(1, [0, 2]), Node(2, [1])])
+        >>> maze.compact()
+        >>> maze.isCompact()
+        True
+        >>> maze.connectionExistsFrom(1, 2)
+        True
+        >>> maze.addLinkBetween(0, 2)
+        >>> maze.isCompact()
+        False
+        >>> maze
+        ['0 -> [1, 2]', '1 -> [0, 2]', '2 -> [1, 0]']
+        """
+        if self.__csr is not None:
+            # already compact
+            return
+
+        self.__csr = self._adjacency()
+        self.__values = [node.data for node in self.__nodes]
+        self.__nodes = []
+        self.__storageReplaced()
+
+    def __expandCompactStorage(self) -> None:
+        """Turn compact storage back into node objects, so that the nodes can be edited."""
+        if self.__csr is None:
+            return
+
+        weightsPointers = self.__csr.toWeights()
+        self.__nodes = [
+            Node[T](
+                data,
+                connections,
+                None if weightsPointers is None else weightsPointers[index],
+            )
+            for index, (data, connections) in enumerate(
+                zip(self.__values, self.__csr.toConnections())
+            )
+        ]
+        self.__csr = None
+        self.__values = []
+        self.__storageReplaced()
+
+    def memoryUsage(self) -> int:
+        """Estimate the number of bytes the graph's structure takes up, not counting the nodes' data themselves.
+        Useful for comparing the node-object storage against compact storage.
+
+        Returns:
+            int: The estimated number of bytes.
+
+        >>> graph = Graph.createGraph(100, 100)
+        >>> for index in range(len(graph) - 1):
+        ...     graph.addLinkBetween(index, index + 1)
+        >>> objectBytes = graph.memoryUsage()
+        >>> graph.compact()
+        >>> objectBytes > 5 * graph.memoryUsage()
+        True
+        """
+        if self.__csr is not None:
+            return self.__csr.nbytes() + sys.getsizeof(self.__values)
+
+        total = sys.getsizeof(self.__nodes)
         for node in self.__nodes:
-            node.visited = False
+            total += sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+            total += sys.getsizeof(node.connections)
+            if node.weights is not None:
+                total += sys.getsizeof(node.weights)
+        return total
+
+    def snapshot(self) -> "Graph[T]":
+        """Take a snapshot of the graph as it is now, which can be searched and traversed for as long as needed while the
+        graph itself carries on being changed, e.g. by another thread.
+
+        Taking a snapshot takes constant time, as the snapshot shares the graph's storage rather than copying it. Instead,
+        the graph copies what it changes, the first time it changes it after a snapshot is taken: the list of its nodes
+        (one pointer per node, not the nodes themselves) or of a compact graph's data, then only each node that is
+        edited, and each column that is asked for. A compact graph's connections are never changed in place, so they are
+        never copied.
+
+        The snapshot can't be changed, and nor can its nodes or columns be edited directly. Its version stays the same,
+        so anything worked out from it stays correct.
+
+        Returns:
+            Graph[T]: The snapshot.
+
+        >>> maze = Graph[str].createGraph(3, 1)
+        >>> maze.addLinks([(0, 1), (1, 2)])
+        >>> frozen = maze.snapshot()
+        >>> maze.removeLinkBetween(1, 2)
+        >>> maze.setNodeData(0, 'Entrance')
+        >>> maze
+        ['Entrance -> [1]', 'None -> [0]', 'None -> []']
+        >>> frozen
+        ['None -> [1]', 'None -> [0, 2]', 'None -> [1]']
+        >>> frozen.shortestPath(0, 2).path
+        [0, 1, 2]
+        >>> frozen.addLinkBetween(0, 2)
+        Traceback (most recent call last):
+        ...
+        ValueError: A snapshot of a graph can't be changed.
+        """
+        if self.__isSnapshot:
+            # it can't change, so it's already a snapshot of itself
+            return self
+
+        snapshot = copy.copy(self)
+        snapshot.__isSnapshot = True
+        snapshot.__nodesShared = False
+        snapshot.__copiedNodes = None
+        snapshot.__valuesShared = False
+        snapshot.__sharedColumns = set()
+        # the components are kept up to date in place as links are added, so the snapshot works out its own
+        snapshot.__components = None
+        snapshot.__componentsVersion = -1
+
+        # from now on the graph has to copy whatever it changes
+        self.__nodesShared = True
+        self.__copiedNodes = None
+        self.__valuesShared = True
+        self.__columns = dict(self.__columns)
+        self.__columnDefaults = dict(self.__columnDefaults)
+        self.__sharedColumns = set(self.__columns)
+        return snapshot
+
+    def isSnapshot(self) -> bool:
+        """Check whether the graph is a snapshot taken with `snapshot`, and so can't be changed.
+
+        Returns:
+            bool: Whether the graph is a snapshot.
+        """
+        return self.__isSnapshot
+
+    def _checkCanChange(self) -> None:
+        """Make sure the graph isn't a snapshot, before changing it.
+
+        Raises:
+            ValueError: The graph is a snapshot.
+        """
+        if self.__isSnapshot:
+            raise ValueError("A snapshot of a graph can't be changed.")
+
+    def __storageReplaced(self) -> None:
+        """Note that the graph's nodes have been replaced with new storage, which isn't shared with any snapshot."""
+        self.__nodesShared = False
+        self.__copiedNodes = None
+        self.__valuesShared = False
+
+    def __editableNodes(self) -> List[Node[T]]:
+        """Get the list of the graph's nodes to change, copying it first if it's shared with a snapshot.
+        Its nodes are still shared, so a node has to be got with `__editableNode` to be edited.
+
+        Returns:
+            List[Node[T]]: The list of nodes.
+        """
+        if self.__nodesShared:
+            self.__nodes = list(self.__nodes)
+            self.__copiedNodes = set()
+            self.__nodesShared = False
+        return self.__nodes
+
+    def __editableNode(self, index: int) -> Node[T]:
+        """Get the node at `index` to edit in place, copying it first if it's shared with a snapshot.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+
+        Returns:
+            Node[T]: The node.
+        """
+        nodes = self.__editableNodes()
+        node = nodes[index]
+        if (self.__copiedNodes is not None) and (index not in self.__copiedNodes):
+            node = node.clone()
+            self.__setNode(index, node)
+        return node
+
+    def __setNode(self, index: int, node: Node[T]) -> None:
+        """Replace the node at `index` with a node that isn't shared with any snapshot.
+
+        Args:
+            index (int): The index of the node. This is not bounds-checked.
+            node (Node[T]): The new node.
+        """
+        self.__editableNodes()[index] = node
+        if self.__copiedNodes is not None:
+            self.__copiedNodes.add(index)
+
+    def __editableValues(self) -> List[Optional[T]]:
+        """Get the list of a compact graph's data to change, copying it first if it's shared with a snapshot.
+
+        Returns:
+            List[Optional[T]]: The data of each node.
+        """
+        if self.__valuesShared:
+            self.__values = list(self.__values)
+            self.__valuesShared = False
+        return self.__values
+
+    def __editableColumn(self, name: str) -> "array[Any]":
+        """Get a column to change, copying it first if it's shared with a snapshot.
+
+        Args:
+            name (str): The name of the column. It must exist.
+
+        Returns:
+            array[Any]: The column.
+        """
+        if name in self.__sharedColumns:
+            self.__columns[name] = self.__columns[name][:]
+            self.__sharedColumns.remove(name)
+        return self.__columns[name]
 
     def _exists(self, nodePointer: int) -> bool:
         """Determine whether or not a pointer points to a node which exists.
@@ -249,6 +1043,9 @@ class Graph(Generic[T]):
         False
         """
 
+        if self.__csr is not None:
+            return len(self) > nodePointer >= -len(self)
+
         try:
             _ = self.__nodes[nodePointer].data
         except IndexError:
@@ -258,20 +1055,27 @@ class Graph(Generic[T]):
             # the index is OK
             return True
 
-    def depthFirstTraversal(self, nodeIndex: Optional[int] = None) -> Iterator[T]:
-        """Recursively depth-first traverse the graph.
-        Yields data — rather than returning it — because returning the values would require putting everything into a list.
+    def depthFirstTraversal(
+        self,
+        nodeIndex: Optional[int] = None,
+        order: TraversalOrder = TraversalOrder.postOrder,
+    ) -> Iterator[T]:
+        """Iteratively depth-first traverse the graph.
+        Yields data — rather than returning it — because returning the values would require putting everything into a list.
 
         `yield` basically pauses the function after yielding, saving all of its states, and only
         when the next value is required by the caller function does the yielding function continue.
 
-        Complexity of this implementation is `O(V * E)` where `V` is the number of vertices (nodes) and `E` is the number of edges (connections).
+        Rather than recursing once per node, the nodes on the current path are kept on an explicit stack, so the
+        traversal can go as deep as the graph does without running out of Python stack. Which nodes have been
+        visited is kept per traversal, too, so any number of traversals of the same graph can run at once.
 
-        Args:
-            currentNode (Optional[int], optional): Specify the node index to start from. Used for recursion; don't worry about this parameter. Defaults to None.
+        Complexity of this implementation is `O(V + E)` where `V` is the number of vertices (nodes) and `E` is the number of edges (connections).
 
-        Raises:
-            Exception: The graph is empty, and therefore we cannot traverse it.
+        Args:
+            nodeIndex (Optional[int], optional): Specify the node index to start from. Defaults to None, meaning the first node.
+            order (TraversalOrder, optional): Whether to yield each node before (`preOrder`) or after (`postOrder`)
+            the nodes reachable from it. Defaults to `TraversalOrder.postOrder`.
 
         Yields:
             Generator[Node[T]]: The nodes' data in depth-first order.
@@ -286,47 +1090,158 @@ class Graph(Generic[T]):
         >>> [item for item in sampleGraph.depthFirstTraversal()]
         [11, 42, 91, 8, 2]
 
+        Visiting each node before its connections instead:
+        >>> [item for item in sampleGraph.depthFirstTraversal(order=TraversalOrder.preOrder)]
+        [2, 8, 91, 42, 11]
+
+        Two traversals of the same graph at once:
+        >>> list(zip(sampleGraph.depthFirstTraversal(), sampleGraph.depthFirstTraversal(3)))
+        [(11, 8), (42, 2), (91, 91), (8, 42), (2, 11)]
+
+        Traversing the same graph stored compactly:
+        >>> sampleGraph.compact()
+        >>> [item for item in sampleGraph.depthFirstTraversal()]
+        [11, 42, 91, 8, 2]
+
+        Traversing a corridor far deeper than Python's recursion limit:
+        >>> corridor = Graph[int].createGraphFromEdges(
+        ...     100000, [(index, index + 1) for index in range(99999)], list(range(100000))
+        ... )
+        >>> next(corridor.depthFirstTraversal())
+        99999
+
         >>> [item for item in Graph[int]().depthFirstTraversal()]       # test traversal of empty graph
         []
         """
+        yield from self.__depthFirstSteps(nodeIndex, order, None)
 
-        # check there's actually any nodes
-        if len(self.__nodes) < 1:
-            # there's no nodes.
-            return
+    async def adepthFirstTraversal(
+        self,
+        nodeIndex: Optional[int] = None,
+        order: TraversalOrder = TraversalOrder.postOrder,
+        chunkSize: int = 1024,
+        deadline: Optional[float] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> AsyncIterator[T]:
+        """Depth-first traverse the graph like `depthFirstTraversal`, but without holding up the event loop: after every
+        `chunkSize` nodes, the traversal lets the loop run everything else that's ready before carrying on.
+
+        Args:
+            nodeIndex (Optional[int], optional): Specify the node index to start from. Defaults to None, meaning the first node.
+            order (TraversalOrder, optional): Whether to yield each node before (`preOrder`) or after (`postOrder`)
+            the nodes reachable from it. Defaults to `TraversalOrder.postOrder`.
+            chunkSize (int, optional): The number of nodes to visit between letting the loop run. Defaults to 1024.
+            deadline (Optional[float], optional): The time, by the loop's clock (`loop.time()`), to give up at.
+            Defaults to None, meaning never.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of nodes visited so far, every
+            `chunkSize` nodes. Defaults to None.
+
+        Raises:
+            IndexError: The index is out of range.
+            ValueError: The chunk size isn't positive, or the graph's connections were changed during the traversal.
+            asyncio.TimeoutError: The deadline passed before the traversal finished.
+
+        Yields:
+            AsyncIterator[T]: The nodes' data in depth-first order.
+
+        >>> import asyncio
+        >>> sampleGraph = Graph[int]([Node(2, [1, 4]), Node(8, [0, 4]), Node(42, [4, 3]), Node(11, [2, 4]), Node(91, [0, 1, 2, 3])])
+        >>> async def traverse():
+        ...     return [item async for item in sampleGraph.adepthFirstTraversal(chunkSize=2, progress=print)]
+        >>> asyncio.run(traverse())
+        2
+        4
+        [11, 42, 91, 8, 2]
+        """
+        checkpoint = SearchCheckpoint(chunkSize)
+        steps = self.__depthFirstSteps(nodeIndex, order, checkpoint)
+        async for item in self.__cooperate(steps, checkpoint, deadline, progress):
+            yield item
+
+    def __depthFirstSteps(
+        self,
+        nodeIndex: Optional[int],
+        order: TraversalOrder,
+        checkpoint: Optional[SearchCheckpoint],
+    ) -> Iterator[Any]:
+        """Depth-first traverse the graph, for `depthFirstTraversal` and `adepthFirstTraversal`.
+
+        Args:
+            nodeIndex (Optional[int]): The node index to start from, or None for the first node.
+            order (TraversalOrder): Whether to yield each node before or after the nodes reachable from it.
+            checkpoint (Optional[SearchCheckpoint]): Where to stop every so many nodes, or None to never stop.
+
+        Yields:
+            Iterator[Any]: The nodes' data in depth-first order, and `checkpoint` whenever it is reached.
+        """
+        # check there's actually any nodes
+        if len(self) < 1:
+            # there's no nodes.
+            return
 
         if nodeIndex is None:
             # the function has been called without a starting node so we start from the beginning!
-            # so we'll make everything not visited to be able to visit stuff.
-            self.__setAllNotVisited()
-            # check that there are actually any items in the graph
-            if (self.__nodes is []) or (self.__nodes is None):
-                # there are no nodes in the graph...
-                raise Exception("Cannot traverse an empty graph")
-            else:
-                # there are nodes in the graph :)
-                # ...so we set `nodeIndex` to the first index:
-                nodeIndex = 0
-
-        # `nodeIndex` is set and guaranteed to have a value at this point
-        # start with node `self.__nodes[nodeIndex]`
-        # only continue if `self.__nodes[nodeIndex]` is not visited
-        if self.__nodes[nodeIndex].visited == False:
-            # the node is not visited
-            # so set it as visited
-            self.__nodes[nodeIndex].visited = True
-            # for each of this node's neighbours
-            for connectionIndex in self.__nodes[nodeIndex].connections:
-                # perform a depth first traversal of the neighbour
-                # `yield from` (emphasis on the `from`) because it is yielding the result of a recursive yield
-                # see PEP 380 Syntax for Delegating to a Subgenerator – https://www.python.org/dev/peps/pep-0380/
-                yield from self.depthFirstTraversal(connectionIndex)
-
-            data = self.__nodes[nodeIndex].data
-
+            nodeIndex = 0
+        self.__checkIndexIsValidWithException(nodeIndex)
+
+        preOrder = order == TraversalOrder.preOrder
+
+        # keep track of which nodes this traversal has visited in its own array of flags, one byte per node,
+        # rather than on the nodes themselves
+        visited = bytearray(len(self))
+        # the path from the starting node to the current node...
+        path = Stack[int]()
+        # ...and, for each node on the path, the position in its connections of the next one to try
+        nextConnection = Stack[int]()
+
+        # the number of nodes visited so far, and the number to stop at next
+        nodesProcessed = 1
+        nextCheckpoint = -1 if checkpoint is None else checkpoint.chunkSize
+
+        # visit the starting node
+        visited[nodeIndex] = True
+        path.push(nodeIndex)
+        nextConnection.push(0)
+        if preOrder:
+            data = self._dataAt(nodeIndex)
             if data is not None:
                 yield data
 
+        while not path.isEmpty():
+            currentIndex = path.peek()
+            connections = self._neighbours(currentIndex)
+            position = nextConnection.pop()
+
+            # skip past the connections that have already been visited
+            while (position < len(connections)) and visited[connections[position]]:
+                position += 1
+
+            if position < len(connections):
+                # there's an unvisited connection, so remember where we got up to here and go deeper
+                connectionIndex = connections[position]
+                nextConnection.push(position + 1)
+
+                visited[connectionIndex] = True
+                path.push(connectionIndex)
+                nextConnection.push(0)
+                if preOrder:
+                    data = self._dataAt(connectionIndex)
+                    if data is not None:
+                        yield data
+
+                nodesProcessed += 1
+                if nodesProcessed == nextCheckpoint:
+                    checkpoint.nodesProcessed = nodesProcessed  # type: ignore
+                    nextCheckpoint += checkpoint.chunkSize  # type: ignore
+                    yield checkpoint
+            else:
+                # everything reachable from this node has been visited, so we're done with it
+                path.pop()
+                if not preOrder:
+                    data = self._dataAt(currentIndex)
+                    if data is not None:
+                        yield data
+
     def breadthFirstTraversal(self) -> Iterator[T]:
         """Iteratively breadth-first traverse the graph.
         Yields data – rather than returning it – because returning values would require more memory.
@@ -352,6 +1267,9 @@ class Graph(Generic[T]):
         ... ])
         >>> [maze_cell for maze_cell in simply_connected_maze.breadthFirstTraversal()]  # test traversal of a simple connected maze
         ['Entrance', '1', '2', '3', '4', '5', '6', '7', 'Exit', '9', '10', '11']
+        >>> simply_connected_maze.compact()
+        >>> [maze_cell for maze_cell in simply_connected_maze.breadthFirstTraversal()]  # and again, stored compactly
+        ['Entrance', '1', '2', '3', '4', '5', '6', '7', 'Exit', '9', '10', '11']
 
         >>> non_simple_maze = Graph[str]([
         ...     Node('Entrance', [1, 2]),
@@ -373,40 +1291,1412 @@ class Graph(Generic[T]):
         >>> [item for item in Graph[int]().breadthFirstTraversal()]     # test a traversal of an empty graph
         []
         """
+        yield from self.__breadthFirstSteps(None)
+
+    async def abreadthFirstTraversal(
+        self,
+        chunkSize: int = 1024,
+        deadline: Optional[float] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> AsyncIterator[T]:
+        """Breadth-first traverse the graph like `breadthFirstTraversal`, but without holding up the event loop: after
+        every `chunkSize` nodes, the traversal lets the loop run everything else that's ready before carrying on.
+
+        Args:
+            chunkSize (int, optional): The number of nodes to visit between letting the loop run. Defaults to 1024.
+            deadline (Optional[float], optional): The time, by the loop's clock (`loop.time()`), to give up at.
+            Defaults to None, meaning never.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of nodes visited so far, every
+            `chunkSize` nodes. Defaults to None.
+
+        Raises:
+            ValueError: The chunk size isn't positive, or the graph's connections were changed during the traversal.
+            asyncio.TimeoutError: The deadline passed before the traversal finished.
+
+        Yields:
+            AsyncIterator[T]: The nodes' data in breadth-first order.
+
+        Traversing a long corridor while something else runs alongside:
+        >>> import asyncio
+        >>> corridor = Graph[int].createGraphFromEdges(
+        ...     10000, [(index, index + 1) for index in range(9999)], list(range(10000)), bidirectional=True
+        ... )
+        >>> async def traverseAndTick():
+        ...     ticks = 0
+        ...     async def tick():
+        ...         nonlocal ticks
+        ...         while True:
+        ...             ticks += 1
+        ...             await asyncio.sleep(0)
+        ...     ticker = asyncio.ensure_future(tick())
+        ...     cells = [cell async for cell in corridor.abreadthFirstTraversal(chunkSize=1000)]
+        ...     ticker.cancel()
+        ...     return cells[-1], ticks >= 9
+        >>> asyncio.run(traverseAndTick())
+        (9999, True)
+        """
+        checkpoint = SearchCheckpoint(chunkSize)
+        steps = self.__breadthFirstSteps(checkpoint)
+        async for item in self.__cooperate(steps, checkpoint, deadline, progress):
+            yield item
 
+    def __breadthFirstSteps(self, checkpoint: Optional[SearchCheckpoint]) -> Iterator[Any]:
+        """Breadth-first traverse the graph, for `breadthFirstTraversal` and `abreadthFirstTraversal`.
+
+        Args:
+            checkpoint (Optional[SearchCheckpoint]): Where to stop every so many nodes, or None to never stop.
+
+        Yields:
+            Iterator[Any]: The nodes' data in breadth-first order, and `checkpoint` whenever it is reached.
+        """
         # check there's actually any nodes
-        if len(self.__nodes) < 1:
+        if len(self) < 1:
             # there's no nodes.
             return
 
-        # initialize a queue for the visited nodes
-        visitedNodes = CircularQueue[Node[T]](len(self.__nodes))
+        # initialize a queue for the indices of the visited nodes
+        visitedNodes = CircularQueue[int](len(self))
+        # and the flags of which nodes have been visited, one byte per node
+        visited = bytearray(len(self))
+
+        # the number of nodes visited so far, and the number to stop at next
+        nodesProcessed = 0
+        nextCheckpoint = -1 if checkpoint is None else checkpoint.chunkSize
 
         # set the 0th node as visited
-        self.__nodes[0].visited = True
+        visited[0] = True
         # and enqueue it
-        visitedNodes.enQueue(self.__nodes[0])
+        visitedNodes.enQueue(0)
 
         # for each item in the queue:
         while len(visitedNodes) > 0:
             # pop a node from the queue
-            currentNode = visitedNodes.deQueue()
+            currentIndex = visitedNodes.deQueue()
             # and yield it
-            data = currentNode.data
+            data = self._dataAt(currentIndex)
             if data is not None:
                 yield data
 
+            nodesProcessed += 1
+            if nodesProcessed == nextCheckpoint:
+                checkpoint.nodesProcessed = nodesProcessed  # type: ignore
+                nextCheckpoint += checkpoint.chunkSize  # type: ignore
+                yield checkpoint
+
             # get neighbours of the node
-            for neighbour in currentNode.connections:
+            for neighbour in self._neighbours(currentIndex):
                 # check if it's been visited
-                if self.__nodes[neighbour].visited == False:
+                if not visited[neighbour]:
                     # set it to visited bc we're visiting it now
-                    self.__nodes[neighbour].visited = True
+                    visited[neighbour] = True
                     # and add it to the `visitedNodes` queue
-                    visitedNodes.enQueue(self.__nodes[neighbour])
+                    visitedNodes.enQueue(neighbour)
+
+    def breadthFirstDistances(
+        self, nodeIndex: int = 0
+    ) -> Tuple["array[int]", "array[int]"]:
+        """Breadth-first search the whole graph from a node, a level at a time, and find how many connections away every
+        node is and which node it was first reached from.
+
+        Rather than queueing nodes one at a time, each level's nodes (the frontier) are expanded together into the next
+        level, with the search state kept in flat arrays rather than on node objects.
+        A compact graph's neighbours are read straight out of its CSR arrays.
+
+        Args:
+            nodeIndex (int, optional): The index of the node to search from. Defaults to 0.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            Tuple[array[int], array[int]]: The distance of every node from `nodeIndex`, and the node each was first reached
+            from, each indexed by node. Both are `-1` for the nodes that can't be reached, and the parent of `nodeIndex`
+            is `-1` too.
+
+        >>> maze = Graph[None].createGraphFromEdges(6, [(0, 1), (1, 2), (0, 3), (3, 2), (4, 5)], bidirectional=True)
+        >>> distances, parents = maze.breadthFirstDistances(0)
+        >>> distances
+        array('i', [0, 1, 2, 1, -1, -1])
+        >>> parents
+        array('i', [-1, 0, 1, 0, -1, -1])
+        """
+        self.__checkIndexIsValidWithException(nodeIndex)
+        distances, parents, _ = self.__breadthFirstLevels([nodeIndex])
+        return distances, parents
+
+    def __breadthFirstLevels(
+        self, sources: Iterable[int]
+    ) -> Tuple["array[int]", "array[int]", "array[int]"]:
+        """Breadth-first search from some nodes at once, a level at a time.
+
+        Args:
+            sources (Iterable[int]): The indices of the nodes to search from, which are already bounds-checked.
+
+        Returns:
+            Tuple[array[int], array[int], array[int]]: The distance of every node from its nearest source, the node each
+            was first reached from, and the source each was reached from. All three are `-1` for the nodes that can't be
+            reached, and the sources' parents are `-1` too.
+        """
+        distances = array("i", [-1]) * len(self)
+        parents = array("i", [-1]) * len(self)
+        labels = array("i", [-1]) * len(self)
+
+        frontier: List[int] = []
+        for source in sources:
+            if distances[source] < 0:
+                distances[source] = 0
+                labels[source] = source
+                frontier.append(source)
+
+        neighbours = self.__neighboursLookup()
+        level = 0
+        while len(frontier) > 0:
+            level += 1
+            nextFrontier: List[int] = []
+            # expand every node of this level into the next level
+            for currentIndex in frontier:
+                for neighbour in neighbours(currentIndex):
+                    if distances[neighbour] < 0:
+                        distances[neighbour] = level
+                        parents[neighbour] = currentIndex
+                        labels[neighbour] = labels[currentIndex]
+                        nextFrontier.append(neighbour)
+            frontier = nextFrontier
+
+        return distances, parents, labels
+
+    def __neighboursLookup(self) -> Callable[[int], Sequence[int]]:
+        """Get the quickest way of looking up nodes' connections, for searches that look up every node's.
+
+        Returns:
+            Callable[[int], Sequence[int]]: Gets the connections of the node at an index, which is not bounds-checked.
+        """
+        if self.__csr is not None:
+            # read the neighbours straight out of the CSR arrays, rather than through a method call per node
+            offsets = self.__csr.offsets
+            targets = self.__csr.targets
+            return lambda index: targets[offsets[index] : offsets[index + 1]]
+        return self._neighbours
+
+    def distanceField(
+        self, sources: Iterable[int]
+    ) -> Tuple["array[int]", "array[int]"]:
+        """Find how many connections every node is from its nearest source node, e.g. the distance of every cell of a maze
+        to its nearest exit. All the sources are searched from at once, in a single breadth-first search.
+
+        Args:
+            sources (Iterable[int]): The indices of the source nodes.
+
+        Raises:
+            IndexError: A source index is out of range.
+
+        Returns:
+            Tuple[array[int], array[int]]: The distance of every node to its nearest source, and the index of that source,
+            each indexed by node. Both are `-1` for the nodes that can't reach any source. When two sources are equally
+            near, the one earlier in `sources` is used.
+
+        >>> corridor = Graph[None].createGraphFromEdges(6, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)], bidirectional=True)
+        >>> distances, nearestExits = corridor.distanceField([0, 5])
+        >>> distances
+        array('i', [0, 1, 2, 2, 1, 0])
+        >>> nearestExits
+        array('i', [0, 0, 0, 5, 5, 5])
+        """
+        sources = list(sources)
+        for source in sources:
+            self.__checkIndexIsValidWithException(source)
+
+        distances, _, labels = self.__breadthFirstLevels(sources)
+        return distances, labels
+
+    def reachableFrom(self, sources: Iterable[int]) -> bytearray:
+        """Find every node that can be reached from any of some source nodes, in a single breadth-first search.
+
+        Args:
+            sources (Iterable[int]): The indices of the source nodes.
+
+        Raises:
+            IndexError: A source index is out of range.
+
+        Returns:
+            bytearray: One byte per node: `1` if it can be reached from a source (including the sources themselves), else `0`.
+
+        >>> maze = Graph[None].createGraphFromEdges(5, [(0, 1), (2, 3)])
+        >>> list(maze.reachableFrom([0, 3]))
+        [1, 1, 0, 1, 0]
+        """
+        distances, _ = self.distanceField(sources)
+        # every node with a distance was reached
+        return bytearray(map((0).__le__, distances))
+
+    def shortestPath(self, indexFrom: int, indexTo: int) -> PathResult:
+        """Find the path with the fewest connections from one node to another, by breadth-first searching from `indexFrom`.
+        The search keeps track of which node it first reached each node from, and stops as soon as it reaches `indexTo`.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+
+        Raises:
+            IndexError: Either index is out of range.
+
+        Returns:
+            PathResult: The path, its number of connections, and the number of nodes expanded to find it. If there's no path, the path is empty.
+
+        >>> simply_connected_maze = Graph[str]([
+        ...     Node('Entrance', [1]),
+        ...     Node('1', [0, 2, 3]),
+        ...     Node('2', [1, 4]),
+        ...     Node('3', [1, 5]),
+        ...     Node('4', [2]),
+        ...     Node('5', [3, 6, 7]),
+        ...     Node('6', [5, 8]),
+        ...     Node('7', [5, 9, 10]),
+        ...     Node('Exit', [6, 11]),
+        ...     Node('9', [7]),
+        ...     Node('10', [7]),
+        ...     Node('11', [8])
+        ... ])
+        >>> simply_connected_maze.shortestPath(0, 8)
+        PathResult(path=[0, 1, 3, 5, 6, 8], cost=5, nodesExpanded=7)
+
+        >>> simply_connected_maze.shortestPath(4, 4)
+        PathResult(path=[4], cost=0, nodesExpanded=0)
+
+        >>> Graph[None]([Node(None, [1]), Node(None, [0]), Node(None, [])]).shortestPath(0, 2)
+        PathResult(path=[], cost=inf, nodesExpanded=2)
+        """
+        return self.__runToEnd(self.__shortestPathSteps(indexFrom, indexTo, None))
+
+    async def ashortestPath(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        chunkSize: int = 1024,
+        deadline: Optional[float] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> PathResult:
+        """Find the path with the fewest connections from one node to another like `shortestPath`, but without holding up
+        the event loop: after every `chunkSize` nodes expanded, the search lets the loop run everything else that's ready
+        before carrying on.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            chunkSize (int, optional): The number of nodes to expand between letting the loop run. Defaults to 1024.
+            deadline (Optional[float], optional): The time, by the loop's clock (`loop.time()`), to give up at.
+            Defaults to None, meaning never.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of nodes expanded so far, every
+            `chunkSize` nodes. Defaults to None.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The chunk size isn't positive, or the graph's connections were changed during the search.
+            asyncio.TimeoutError: The deadline passed before the search finished.
+
+        Returns:
+            PathResult: The path, its number of connections, and the number of nodes expanded to find it. If there's no path, the path is empty.
+
+        >>> import asyncio
+        >>> corridor = Graph[None].createGraphFromEdges(10000, [(index, index + 1) for index in range(9999)], bidirectional=True)
+        >>> asyncio.run(corridor.ashortestPath(0, 9999, chunkSize=1000)).cost
+        9999
+
+        Giving up at a deadline that has already passed:
+        >>> async def tooLate():
+        ...     return await corridor.ashortestPath(0, 9999, chunkSize=1000, deadline=asyncio.get_running_loop().time())
+        >>> asyncio.run(tooLate())
+        Traceback (most recent call last):
+        ...
+        TimeoutError: The search didn't finish before its deadline.
+        """
+        checkpoint = SearchCheckpoint(chunkSize)
+        steps = self.__shortestPathSteps(indexFrom, indexTo, checkpoint)
+        return await self.__cooperateToEnd(steps, checkpoint, deadline, progress)
+
+    def __shortestPathSteps(
+        self, indexFrom: int, indexTo: int, checkpoint: Optional[SearchCheckpoint]
+    ) -> Generator[SearchCheckpoint, None, PathResult]:
+        """Breadth-first search for the path with the fewest connections from one node to another, for `shortestPath` and
+        `ashortestPath`.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            checkpoint (Optional[SearchCheckpoint]): Where to stop every so many nodes, or None to never stop.
+
+        Raises:
+            IndexError: Either index is out of range.
+
+        Yields:
+            Generator[SearchCheckpoint, None, PathResult]: `checkpoint` whenever it is reached, and then returns the path.
+        """
+        self.__checkIndexIsValidWithException(indexFrom)
+        self.__checkIndexIsValidWithException(indexTo)
+        nextCheckpoint = -1 if checkpoint is None else checkpoint.chunkSize
+
+        # the node that each node was first reached from, or -1 if it hasn't been reached yet
+        predecessors = array("i", [-1]) * len(self)
+        predecessors[indexFrom] = indexFrom
+        nodesExpanded = 0
+
+        # initialize a queue for the nodes still to expand
+        toExpand = CircularQueue[int](len(self))
+        toExpand.enQueue(indexFrom)
+
+        # keep going until the destination has been reached or there's nowhere left to go
+        while (predecessors[indexTo] == -1) and (len(toExpand) > 0):
+            currentIndex = toExpand.deQueue()
+            nodesExpanded += 1
+            if nodesExpanded == nextCheckpoint:
+                checkpoint.nodesProcessed = nodesExpanded  # type: ignore
+                nextCheckpoint += checkpoint.chunkSize  # type: ignore
+                yield checkpoint  # type: ignore
+
+            for neighbour in self._neighbours(currentIndex):
+                if predecessors[neighbour] == -1:
+                    # first time reaching this node, so the shortest way here is via `currentIndex`
+                    predecessors[neighbour] = currentIndex
+                    toExpand.enQueue(neighbour)
+
+        path = self.__pathFromPredecessors(predecessors, indexFrom, indexTo)
+        return PathResult(path, len(path) - 1 if path else math.inf, nodesExpanded)
+
+    def bidirectionalShortestPath(self, indexFrom: int, indexTo: int) -> PathResult:
+        """Find the path with the fewest connections from one node to another, by breadth-first searching forwards from
+        `indexFrom` and backwards from `indexTo` at the same time until the two searches meet in the middle.
+
+        Each step expands a whole level of whichever search has the smaller frontier. On a graph where the number of
+        nodes within `d` connections grows quickly with `d`, two searches of depth `d / 2` expand far fewer nodes than
+        one search of depth `d`. The backwards search follows links against their direction, so one-way links added with
+        `bidirectional=False` are handled correctly; the connections into each node are worked out once and then reused
+        until the graph's connections change.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+
+        Raises:
+            IndexError: Either index is out of range.
+
+        Returns:
+            PathResult: The path, its number of connections, and the number of nodes expanded by both searches to find it.
+            If there's no path, the path is empty.
+
+        Searching an open 20 by 20 grid, where every cell is linked to its neighbours:
+        >>> grid = Graph[None].createGraph(20, 20)
+        >>> grid.addLinks([(index, index + 1) for index in range(400) if (index + 1) % 20 != 0])
+        >>> grid.addLinks([(index, index + 20) for index in range(380)])
+        >>> grid.bidirectionalShortestPath(0, 105)
+        PathResult(path=[0, 1, 2, 3, 4, 5, 25, 45, 65, 85, 105], cost=10, nodesExpanded=36)
+        >>> grid.shortestPath(0, 105).nodesExpanded
+        50
+
+        One-way links are only followed one way:
+        >>> oneWay = Graph[None].createGraphFromEdges(3, [(0, 1), (1, 2), (2, 0)])
+        >>> oneWay.bidirectionalShortestPath(2, 1)
+        PathResult(path=[2, 0, 1], cost=2, nodesExpanded=2)
+        >>> oneWay.removeLinkBetween(2, 0, bidirectional=False)
+        >>> oneWay.bidirectionalShortestPath(2, 1)
+        PathResult(path=[], cost=inf, nodesExpanded=1)
+        """
+        self.__checkIndexIsValidWithException(indexFrom)
+        self.__checkIndexIsValidWithException(indexTo)
+        if indexFrom == indexTo:
+            return PathResult([indexFrom], 0, 0)
+
+        reverse = self._reverseAdjacency()
+        # the node each node was first reached from by the forwards search, and by the backwards search (i.e. the next
+        # node on the way to `indexTo`), or -1 if it hasn't been reached yet
+        predecessors = array("i", [-1]) * len(self)
+        successors = array("i", [-1]) * len(self)
+        predecessors[indexFrom] = indexFrom
+        successors[indexTo] = indexTo
+        forwardFrontier = [indexFrom]
+        backwardFrontier = [indexTo]
+        nodesExpanded = 0
+        meeting = -1
+
+        while (meeting == -1) and (len(forwardFrontier) > 0) and (len(backwardFrontier) > 0):
+            # expand whichever search has fewer nodes to expand
+            forwards = len(forwardFrontier) <= len(backwardFrontier)
+            if forwards:
+                frontier, neighbours = forwardFrontier, self._neighbours
+                reached, reachedByOther = predecessors, successors
+            else:
+                frontier, neighbours = backwardFrontier, reverse.neighbours
+                reached, reachedByOther = successors, predecessors
+
+            nextFrontier: List[int] = []
+            for currentIndex in frontier:
+                nodesExpanded += 1
+                for neighbour in neighbours(currentIndex):
+                    if reached[neighbour] == -1:
+                        reached[neighbour] = currentIndex
+                        if reachedByOther[neighbour] != -1:
+                            # the searches have met, and as they have gone a level at a time this is a shortest path
+                            meeting = neighbour
+                            break
+                        nextFrontier.append(neighbour)
+                if meeting != -1:
+                    break
+
+            if forwards:
+                forwardFrontier = nextFrontier
+            else:
+                backwardFrontier = nextFrontier
+
+        if meeting == -1:
+            return PathResult([], math.inf, nodesExpanded)
+
+        # the forwards search's path to the meeting node, then the backwards search's path on from it
+        path = self.__pathFromPredecessors(predecessors, indexFrom, meeting)
+        while path[-1] != indexTo:
+            path.append(successors[path[-1]])
+        return PathResult(path, len(path) - 1, nodesExpanded)
+
+    def dijkstra(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        weight: Optional[Callable[[int, int], float]] = None,
+    ) -> PathResult:
+        """Find the cheapest path from one node to another with Dijkstra's algorithm.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            weight (Optional[Callable[[int, int], float]], optional): The cost of the connection between the two given node
+            indices. Costs must not be negative. Defaults to None, meaning each connection's own cost (1 if it hasn't got one).
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: A connection has a negative cost.
+
+        Returns:
+            PathResult: The path, its cost, and the number of nodes expanded to find it. If there's no path, the path is empty.
+
+        >>> triangle = Graph[None]([Node(None, [1, 2]), Node(None, [0, 2]), Node(None, [0, 1])])
+        >>> triangle.dijkstra(0, 2)
+        PathResult(path=[0, 2], cost=1, nodesExpanded=3)
+        >>> costs = {(0, 1): 1, (1, 2): 1, (0, 2): 5}
+        >>> triangle.dijkstra(0, 2, lambda a, b: costs[(min(a, b), max(a, b))])
+        PathResult(path=[0, 1, 2], cost=2, nodesExpanded=3)
+
+        Or give the connections their costs when linking them:
+        >>> roads = Graph[None]([Node(None), Node(None), Node(None)])
+        >>> roads.addLinkBetween(0, 1, weight=1.5)
+        >>> roads.addLinkBetween(1, 2, weight=1.5)
+        >>> roads.addLinkBetween(0, 2, weight=4)
+        >>> roads.dijkstra(0, 2)
+        PathResult(path=[0, 1, 2], cost=3.0, nodesExpanded=3)
+        """
+        return self.__runToEnd(self.__cheapestPath(indexFrom, indexTo, None, weight))
+
+    def aStar(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        heuristic: Callable[[int, int], float],
+        weight: Optional[Callable[[int, int], float]] = None,
+    ) -> PathResult:
+        """Find the cheapest path from one node to another with the A* algorithm: Dijkstra's algorithm, but expanding the nodes
+        that look closest to `indexTo` first.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            heuristic (Callable[[int, int], float]): An estimate of the cost from a node to `indexTo`, given both indices. To be sure of
+            finding the cheapest path, it must never overestimate. See `Graph.manhattanHeuristic` for grids.
+            weight (Optional[Callable[[int, int], float]], optional): The cost of the connection between the two given node
+            indices. Costs must not be negative. Defaults to None, meaning each connection's own cost (1 if it hasn't got one).
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: A connection has a negative cost.
+
+        Returns:
+            PathResult: The path, its cost, and the number of nodes expanded to find it. If there's no path, the path is empty.
+
+        Searching across an open 10x10 grid:
+        >>> grid = Graph.createGraph(10, 10)
+        >>> for y in range(10):
+        ...     for x in range(10):
+        ...         if x < 9:
+        ...             grid.addLinkBetween(y * 10 + x, y * 10 + x + 1)
+        ...         if y < 9:
+        ...             grid.addLinkBetween(y * 10 + x, (y + 1) * 10 + x)
+        >>> found = grid.aStar(0, 99, Graph.manhattanHeuristic(10))
+        >>> found.cost, found.nodesExpanded
+        (18, 19)
+        >>> grid.shortestPath(0, 99).nodesExpanded
+        98
+        """
+        return self.__runToEnd(
+            self.__cheapestPath(indexFrom, indexTo, heuristic, weight)
+        )
+
+    async def adijkstra(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        weight: Optional[Callable[[int, int], float]] = None,
+        chunkSize: int = 1024,
+        deadline: Optional[float] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> PathResult:
+        """Find the cheapest path from one node to another with Dijkstra's algorithm like `dijkstra`, but without holding up
+        the event loop: after every `chunkSize` nodes expanded, the search lets the loop run everything else that's ready
+        before carrying on.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            weight (Optional[Callable[[int, int], float]], optional): The cost of the connection between the two given node
+            indices. Costs must not be negative. Defaults to None, meaning each connection's own cost (1 if it hasn't got one).
+            chunkSize (int, optional): The number of nodes to expand between letting the loop run. Defaults to 1024.
+            deadline (Optional[float], optional): The time, by the loop's clock (`loop.time()`), to give up at.
+            Defaults to None, meaning never.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of nodes expanded so far, every
+            `chunkSize` nodes. Defaults to None.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: A connection has a negative cost, the chunk size isn't positive, or the graph's connections were
+            changed during the search.
+            asyncio.TimeoutError: The deadline passed before the search finished.
+
+        Returns:
+            PathResult: The path, its cost, and the number of nodes expanded to find it. If there's no path, the path is empty.
+
+        The search stops at its next checkpoint once it's cancelled:
+        >>> import asyncio
+        >>> corridor = Graph[None].createGraphFromEdges(10000, [(index, index + 1) for index in range(9999)], bidirectional=True)
+        >>> async def cancelSoon():
+        ...     search = asyncio.ensure_future(corridor.adijkstra(0, 9999, chunkSize=100, progress=print))
+        ...     await asyncio.sleep(0)
+        ...     await asyncio.sleep(0)
+        ...     search.cancel()
+        ...     try:
+        ...         await search
+        ...     except asyncio.CancelledError:
+        ...         return "cancelled"
+        >>> asyncio.run(cancelSoon())
+        100
+        200
+        'cancelled'
+        """
+        checkpoint = SearchCheckpoint(chunkSize)
+        steps = self.__cheapestPath(indexFrom, indexTo, None, weight, checkpoint)
+        return await self.__cooperateToEnd(steps, checkpoint, deadline, progress)
+
+    async def aaStar(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        heuristic: Callable[[int, int], float],
+        weight: Optional[Callable[[int, int], float]] = None,
+        chunkSize: int = 1024,
+        deadline: Optional[float] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> PathResult:
+        """Find the cheapest path from one node to another with the A* algorithm like `aStar`, but without holding up the
+        event loop: after every `chunkSize` nodes expanded, the search lets the loop run everything else that's ready
+        before carrying on.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            heuristic (Callable[[int, int], float]): An estimate of the cost from a node to `indexTo`, given both indices. To be sure of
+            finding the cheapest path, it must never overestimate. See `Graph.manhattanHeuristic` for grids.
+            weight (Optional[Callable[[int, int], float]], optional): The cost of the connection between the two given node
+            indices. Costs must not be negative. Defaults to None, meaning each connection's own cost (1 if it hasn't got one).
+            chunkSize (int, optional): The number of nodes to expand between letting the loop run. Defaults to 1024.
+            deadline (Optional[float], optional): The time, by the loop's clock (`loop.time()`), to give up at.
+            Defaults to None, meaning never.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of nodes expanded so far, every
+            `chunkSize` nodes. Defaults to None.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: A connection has a negative cost, the chunk size isn't positive, or the graph's connections were
+            changed during the search.
+            asyncio.TimeoutError: The deadline passed before the search finished.
+
+        Returns:
+            PathResult: The path, its cost, and the number of nodes expanded to find it. If there's no path, the path is empty.
+        """
+        checkpoint = SearchCheckpoint(chunkSize)
+        steps = self.__cheapestPath(indexFrom, indexTo, heuristic, weight, checkpoint)
+        return await self.__cooperateToEnd(steps, checkpoint, deadline, progress)
+
+    def __bestFirstSearch(
+        self,
+        indexFrom: int,
+        indexTo: Optional[int],
+        heuristic: Optional[Callable[[int, int], float]],
+        weight: Optional[Callable[[int, int], float]],
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> Generator[
+        SearchCheckpoint, None, Tuple[List[float], "array[int]", int]
+    ]:
+        """Find the cheapest paths from a node, always expanding the node with the lowest cost so far plus estimated cost to go.
+        This is A*, or Dijkstra's algorithm if there's no heuristic.
+
+        The nodes still to expand are kept in an indexed heap, so finding a cheaper way to a node lowers its priority in
+        place rather than pushing it again, and the heap holds at most one entry per node.
+
+        Args:
+            indexFrom (int): The index of the node to start from. This is not bounds-checked.
+            indexTo (Optional[int]): The index of the node to stop at, or None to find the cheapest path to every node.
+            heuristic (Optional[Callable[[int, int], float]]): The estimated cost from a node to `indexTo`, or None for no estimate.
+            weight (Optional[Callable[[int, int], float]]): The cost of a connection, or None for each connection's own cost.
+            checkpoint (Optional[SearchCheckpoint], optional): Where to stop every so many nodes expanded. Defaults to None,
+            meaning never.
+
+        Raises:
+            ValueError: A connection has a negative cost.
+
+        Yields:
+            Generator[SearchCheckpoint, None, Tuple[List[float], array[int], int]]: `checkpoint` whenever it is reached, and
+            then returns the cheapest cost found to each node (infinity for nodes not reached), the node the cheapest way to
+            each node comes from (-1 for nodes not reached, and the node itself for `indexFrom`), and the number of nodes
+            expanded.
+        """
+        # the cheapest known cost of getting to each node, and the node that the cheapest way comes from
+        costs = [math.inf] * len(self)
+        predecessors = array("i", [-1]) * len(self)
+        costs[indexFrom] = 0
+        predecessors[indexFrom] = indexFrom
+        nodesExpanded = 0
+        # which nodes have been expanded, so their cost is final
+        expanded = bytearray(len(self))
+
+        # each node's priority is its cost so far, or for A*, its estimated total cost and then its negative cost so far
+        # (so that, between equally promising nodes, the one furthest along is expanded first)
+        toExpand = IndexedHeap(len(self))
+        if heuristic is None:
+            toExpand.push(indexFrom, 0)
+        else:
+            toExpand.push(indexFrom, (heuristic(indexFrom, indexTo), 0))  # type: ignore
+
+        push = toExpand.push
+        pop = toExpand.pop
+        nextCheckpoint = -1 if checkpoint is None else checkpoint.chunkSize
+        while len(toExpand) > 0:
+            currentIndex, _ = pop()
+            expanded[currentIndex] = True
+            nodesExpanded += 1
+            if currentIndex == indexTo:
+                # got there!
+                break
+            if nodesExpanded == nextCheckpoint:
+                checkpoint.nodesProcessed = nodesExpanded  # type: ignore
+                nextCheckpoint += checkpoint.chunkSize  # type: ignore
+                yield checkpoint  # type: ignore
+
+            cost = costs[currentIndex]
+            weights = None if weight is not None else self._neighbourWeights(currentIndex)
+            for position, neighbour in enumerate(self._neighbours(currentIndex)):
+                if weight is not None:
+                    step = weight(currentIndex, neighbour)
+                elif weights is not None:
+                    step = weights[position]
+                else:
+                    step = 1
+                if step < 0:
+                    raise ValueError(
+                        f"Connection from node {currentIndex} to node {neighbour} has a negative cost."
+                    )
+
+                newCost = cost + step
+                if (newCost < costs[neighbour]) and not expanded[neighbour]:
+                    # this is the cheapest way to `neighbour` found so far
+                    costs[neighbour] = newCost
+                    predecessors[neighbour] = currentIndex
+                    if heuristic is None:
+                        push(neighbour, newCost)
+                    else:
+                        push(
+                            neighbour,
+                            (newCost + heuristic(neighbour, indexTo), -newCost),  # type: ignore
+                        )
+
+        return costs, predecessors, nodesExpanded
+
+    def __cheapestPath(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        heuristic: Optional[Callable[[int, int], float]],
+        weight: Optional[Callable[[int, int], float]],
+        checkpoint: Optional[SearchCheckpoint] = None,
+    ) -> Generator[SearchCheckpoint, None, PathResult]:
+        """Find the cheapest path from one node to another with `__bestFirstSearch`.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to find a path to.
+            heuristic (Optional[Callable[[int, int], float]]): The estimated cost from a node to `indexTo`, or None for no estimate.
+            weight (Optional[Callable[[int, int], float]]): The cost of a connection, or None for each connection's own cost.
+            checkpoint (Optional[SearchCheckpoint], optional): Where to stop every so many nodes expanded. Defaults to None,
+            meaning never.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: A connection has a negative cost.
+
+        Yields:
+            Generator[SearchCheckpoint, None, PathResult]: `checkpoint` whenever it is reached, and then returns the path,
+            its cost, and the number of nodes expanded to find it.
+        """
+        self.__checkIndexIsValidWithException(indexFrom)
+        self.__checkIndexIsValidWithException(indexTo)
+
+        costs, predecessors, nodesExpanded = yield from self.__bestFirstSearch(
+            indexFrom, indexTo, heuristic, weight, checkpoint
+        )
+        path = self.__pathFromPredecessors(predecessors, indexFrom, indexTo)
+        return PathResult(path, costs[indexTo], nodesExpanded)
+
+    def dijkstraDistances(
+        self,
+        indexFrom: int,
+        weight: Optional[Callable[[int, int], float]] = None,
+    ) -> Tuple["array[float]", "array[int]"]:
+        """Find the cheapest cost of getting to every node from one node, with Dijkstra's algorithm.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            weight (Optional[Callable[[int, int], float]], optional): The cost of the connection between the two given node
+            indices. Costs must not be negative. Defaults to None, meaning each connection's own cost (1 if it hasn't got one).
+
+        Raises:
+            IndexError: The index is out of range.
+            ValueError: A connection has a negative cost.
+
+        Returns:
+            Tuple[array[float], array[int]]: The cheapest cost of getting to each node, and the node the cheapest way to it
+            comes from, each indexed by node. The cost is infinity and the node is `-1` for the nodes that can't be reached,
+            and the node is `-1` for `indexFrom` too.
+
+        >>> roads = Graph[None].createGraphFromEdges(4, [(0, 1), (1, 2), (0, 2), (2, 3)], bidirectional=True, weights=[1, 1, 5, 2.5])
+        >>> costs, predecessors = roads.dijkstraDistances(0)
+        >>> costs
+        array('d', [0.0, 1.0, 2.0, 4.5])
+        >>> predecessors
+        array('i', [-1, 0, 1, 2])
+        """
+        return self.__runToEnd(self.__dijkstraDistancesSteps(indexFrom, weight, None))
+
+    async def adijkstraDistances(
+        self,
+        indexFrom: int,
+        weight: Optional[Callable[[int, int], float]] = None,
+        chunkSize: int = 1024,
+        deadline: Optional[float] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> Tuple["array[float]", "array[int]"]:
+        """Find the cheapest cost of getting to every node from one node like `dijkstraDistances`, but without holding up
+        the event loop: after every `chunkSize` nodes expanded, the search lets the loop run everything else that's ready
+        before carrying on.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            weight (Optional[Callable[[int, int], float]], optional): The cost of the connection between the two given node
+            indices. Costs must not be negative. Defaults to None, meaning each connection's own cost (1 if it hasn't got one).
+            chunkSize (int, optional): The number of nodes to expand between letting the loop run. Defaults to 1024.
+            deadline (Optional[float], optional): The time, by the loop's clock (`loop.time()`), to give up at.
+            Defaults to None, meaning never.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of nodes expanded so far, every
+            `chunkSize` nodes. Defaults to None.
+
+        Raises:
+            IndexError: The index is out of range.
+            ValueError: A connection has a negative cost, the chunk size isn't positive, or the graph's connections were
+            changed during the search.
+            asyncio.TimeoutError: The deadline passed before the search finished.
+
+        Returns:
+            Tuple[array[float], array[int]]: The cheapest cost of getting to each node, and the node the cheapest way to it
+            comes from, as for `dijkstraDistances`.
+        """
+        checkpoint = SearchCheckpoint(chunkSize)
+        steps = self.__dijkstraDistancesSteps(indexFrom, weight, checkpoint)
+        return await self.__cooperateToEnd(steps, checkpoint, deadline, progress)
+
+    def __dijkstraDistancesSteps(
+        self,
+        indexFrom: int,
+        weight: Optional[Callable[[int, int], float]],
+        checkpoint: Optional[SearchCheckpoint],
+    ) -> Generator[SearchCheckpoint, None, Tuple["array[float]", "array[int]"]]:
+        """Find the cheapest cost of getting to every node from one node, for `dijkstraDistances` and `adijkstraDistances`.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            weight (Optional[Callable[[int, int], float]]): The cost of a connection, or None for each connection's own cost.
+            checkpoint (Optional[SearchCheckpoint]): Where to stop every so many nodes expanded, or None to never stop.
+
+        Raises:
+            IndexError: The index is out of range.
+            ValueError: A connection has a negative cost.
+
+        Yields:
+            Generator[SearchCheckpoint, None, Tuple[array[float], array[int]]]: `checkpoint` whenever it is reached, and
+            then returns the cheapest cost of getting to each node and the node the cheapest way to it comes from.
+        """
+        self.__checkIndexIsValidWithException(indexFrom)
+
+        costs, predecessors, _ = yield from self.__bestFirstSearch(
+            indexFrom, None, None, weight, checkpoint
+        )
+        predecessors[indexFrom] = -1
+        return array("d", costs), predecessors
+
+    @staticmethod
+    def __pathFromPredecessors(
+        predecessors: Sequence[int], indexFrom: int, indexTo: int
+    ) -> List[int]:
+        """Follow the predecessors back from `indexTo` to `indexFrom` to find the path between them.
+
+        Args:
+            predecessors (Sequence[int]): The node each node was reached from, or -1 for nodes that weren't reached.
+            indexFrom (int): The index of the node the path starts from.
+            indexTo (int): The index of the node the path goes to.
+
+        Returns:
+            List[int]: The indices of the nodes along the path, or an empty list if `indexTo` wasn't reached.
+        """
+        if predecessors[indexTo] == -1:
+            # never got there
+            return []
+
+        path = [indexTo]
+        while path[-1] != indexFrom:
+            path.append(predecessors[path[-1]])
+        # the path was followed backwards, so turn it around
+        path.reverse()
+        return path
+
+    @staticmethod
+    def __runToEnd(steps: Generator[Any, None, Any]) -> Any:
+        """Run a search that stops at checkpoints all the way to the end, without stopping.
+
+        Args:
+            steps (Generator[Any, None, Any]): The search.
+
+        Returns:
+            Any: What the search returns.
+        """
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+    async def __cooperate(
+        self,
+        steps: Iterator[Any],
+        checkpoint: SearchCheckpoint,
+        deadline: Optional[float],
+        progress: Optional[Callable[[int], None]],
+    ) -> AsyncIterator[Any]:
+        """Run a traversal that stops at checkpoints, letting the event loop run everything else that's ready at each one.
+
+        Args:
+            steps (Iterator[Any]): The traversal, which yields the nodes' data and `checkpoint` whenever it is reached.
+            checkpoint (SearchCheckpoint): The traversal's checkpoint.
+            deadline (Optional[float]): The time, by the loop's clock, to give up at, or None for never.
+            progress (Optional[Callable[[int], None]]): Called with the number of nodes processed at each checkpoint.
+
+        Yields:
+            AsyncIterator[Any]: The nodes' data.
+        """
+        loop = asyncio.get_running_loop()
+        version = self.getVersion()
+        try:
+            for item in steps:
+                if item is not checkpoint:
+                    yield item
+                    continue
+                if progress is not None:
+                    progress(checkpoint.nodesProcessed)
+                await self.__letLoopRun(loop, version, deadline)
+        finally:
+            # stop the traversal if it was given up on part way through
+            steps.close()  # type: ignore
+
+    async def __cooperateToEnd(
+        self,
+        steps: Generator[SearchCheckpoint, None, Any],
+        checkpoint: SearchCheckpoint,
+        deadline: Optional[float],
+        progress: Optional[Callable[[int], None]],
+    ) -> Any:
+        """Run a search that stops at checkpoints to the end, letting the event loop run everything else that's ready at
+        each one.
+
+        Args:
+            steps (Generator[SearchCheckpoint, None, Any]): The search, which yields `checkpoint` whenever it is reached.
+            checkpoint (SearchCheckpoint): The search's checkpoint.
+            deadline (Optional[float]): The time, by the loop's clock, to give up at, or None for never.
+            progress (Optional[Callable[[int], None]]): Called with the number of nodes processed at each checkpoint.
+
+        Returns:
+            Any: What the search returns.
+        """
+        loop = asyncio.get_running_loop()
+        version = self.getVersion()
+        try:
+            while True:
+                try:
+                    next(steps)
+                except StopIteration as stop:
+                    return stop.value
+                if progress is not None:
+                    progress(checkpoint.nodesProcessed)
+                await self.__letLoopRun(loop, version, deadline)
+        finally:
+            # stop the search if it was given up on part way through
+            steps.close()
+
+    async def __letLoopRun(
+        self, loop: asyncio.AbstractEventLoop, version: int, deadline: Optional[float]
+    ) -> None:
+        """Let the event loop run everything else that's ready, part way through a search, unless the search's deadline
+        has passed. The search can be cancelled while it waits.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+            version (int): The graph's version when the search started.
+            deadline (Optional[float]): The time, by the loop's clock, to give up at, or None for never.
+
+        Raises:
+            asyncio.TimeoutError: The deadline has passed.
+            ValueError: The graph's connections were changed while the loop was running something else.
+        """
+        if (deadline is not None) and (loop.time() >= deadline):
+            raise asyncio.TimeoutError("The search didn't finish before its deadline.")
+        await asyncio.sleep(0)
+        if self.getVersion() != version:
+            raise ValueError("The graph's connections were changed during the search.")
+
+    def _reverseAdjacency(self) -> CSRAdjacency:
+        """Get the connections into each node, working them out again only if the graph has changed since last time.
+
+        Returns:
+            CSRAdjacency: For each node, the indices of the nodes that connect to it.
+        """
+        if (self.__reverse is None) or (self.__reverseVersion != self.getVersion()):
+            self.__reverse = CSRAdjacency.fromEdges(
+                len(self),
+                (
+                    (connection, index)
+                    for index in range(len(self))
+                    for connection in self._neighbours(index)
+                ),
+            )
+            self.__reverseVersion = self.getVersion()
+        return self.__reverse
+
+    def _setReverseAdjacency(self, reverse: CSRAdjacency) -> None:
+        """Give the graph the connections into each node, worked out elsewhere, so that it doesn't work them out itself.
+        They're used until the graph's connections next change.
+
+        Args:
+            reverse (CSRAdjacency): For each node, the indices of the nodes that connect to it. This isn't checked.
+
+        >>> maze = Graph[None].createGraphFromEdges(3, [(0, 1), (1, 2)])
+        >>> reverse = CSRAdjacency.fromEdges(3, [(1, 0), (2, 1)])
+        >>> maze._setReverseAdjacency(reverse)
+        >>> maze._reverseAdjacency() is reverse
+        True
+        >>> maze.addLinkBetween(2, 0, bidirectional=False)
+        >>> maze._reverseAdjacency().toConnections()
+        [[2], [0], [1]]
+        """
+        self.__reverse = reverse
+        self.__reverseVersion = self.getVersion()
+
+    def getVersion(self) -> int:
+        """Get the graph's version, which goes up every time its connections are changed with `addLinkBetween`,
+        `removeLinkBetween`, `setNodesFromNodesList` or `setNodesFromValuesAndConnections`.
+        Anything worked out from the graph's connections is still correct for as long as the version stays the same.
+
+        Editing a node's `connections` list directly, rather than through the graph, doesn't change the version.
+
+        Returns:
+            int: The version.
+
+        >>> maze = Graph[None]([Node(None, []), Node(None, [])])
+        >>> version = maze.getVersion()
+        >>> maze.setNodeData(0, None)
+        >>> maze.getVersion() == version
+        True
+        >>> maze.addLinkBetween(0, 1)
+        >>> maze.getVersion() > version
+        True
+        """
+        return self.__version
+
+    def _structureChanged(self) -> None:
+        """Note that the graph's connections have changed, so anything worked out from them is out of date."""
+        self.__version += 1
+
+    def _linksAdded(self, edges: Iterable[Tuple[int, int]]) -> None:
+        """Note that some links have been added between nodes.
+        Adding links can only ever join components together, so if the components are up to date they are kept up to date
+        by joining each link's nodes' components, rather than being worked out again from scratch.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` indices of each link added.
+        """
+        componentsWereCurrent = self.__componentsVersion == self.getVersion()
+        self._structureChanged()
+
+        if componentsWereCurrent and (self.__components is not None):
+            self.__components.unionMany(edges)
+            self.__componentsVersion = self.getVersion()
+
+    def __componentSets(self) -> DisjointSet:
+        """Get which nodes are connected to which, working it out again only if the graph has changed since last time.
+
+        Returns:
+            DisjointSet: The nodes' components.
+        """
+        if (self.__components is None) or (
+            self.__componentsVersion != self.getVersion()
+        ):
+            self.__components = DisjointSet.fromGraph(self)
+            self.__componentsVersion = self.getVersion()
+        return self.__components
+
+    def componentOf(self, index: int) -> int:
+        """Get the label of the connected component a node is in. Two nodes are in the same component if there is a path
+        between them, ignoring the direction of the links.
+
+        The components are worked out once and then reused until the graph's connections change, so this is almost
+        constant time. Labels are only comparable while the graph's version stays the same.
+
+        Args:
+            index (int): The index of the node.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            int: The label of its component, which is the index of one of the nodes in it.
+
+        >>> maze = Graph[None].createGraphFromEdges(5, [(0, 1), (1, 2), (3, 4)], bidirectional=True)
+        >>> maze.componentOf(0) == maze.componentOf(2)
+        True
+        >>> maze.componentOf(2) == maze.componentOf(3)
+        False
+        >>> maze.componentOf(5)
+        Traceback (most recent call last):
+        ...
+        IndexError: Node at index 5 is out of range.
+        """
+        self.__checkIndexIsValidWithException(index)
+        return self.__componentSets().find(index)
+
+    def sameComponent(self, indexA: int, indexB: int) -> bool:
+        """Check whether there is a path between two nodes, ignoring the direction of the links.
+        The components are worked out once and then reused until the graph's connections change.
+
+        Args:
+            indexA (int): The index of one node.
+            indexB (int): The index of the other node.
+
+        Raises:
+            IndexError: Either index is out of range.
+
+        Returns:
+            bool: Whether the nodes are in the same component.
+
+        Adding a link joins the components it links up, without working the rest out again:
+        >>> maze = Graph[None].createGraphFromEdges(4, [(0, 1), (2, 3)], bidirectional=True)
+        >>> maze.sameComponent(0, 3)
+        False
+        >>> maze.addLinkBetween(1, 2)
+        >>> maze.sameComponent(0, 3)
+        True
+
+        And removing it splits them again:
+        >>> maze.removeLinkBetween(1, 2)
+        >>> maze.sameComponent(0, 3)
+        False
+        """
+        self.__checkIndexIsValidWithException(indexA)
+        self.__checkIndexIsValidWithException(indexB)
+        return self.__componentSets().connected(indexA, indexB)
+
+    def components(self) -> List[List[int]]:
+        """Get every connected component of the graph, ignoring the direction of the links.
+
+        Returns:
+            List[List[int]]: The indices of the nodes in each component, in order. The components are ordered by their
+            lowest node index.
+
+        >>> Graph[None].createGraphFromEdges(6, [(0, 3), (4, 1), (3, 5)]).components()
+        [[0, 3, 5], [1, 4], [2]]
+        """
+        componentSets = self.__componentSets()
+        # the position in the result of each component seen so far, by its label
+        positions: Dict[int, int] = {}
+        result: List[List[int]] = []
+        for index in range(len(self)):
+            label = componentSets.find(index)
+            if label not in positions:
+                positions[label] = len(result)
+                result.append([])
+            result[positions[label]].append(index)
+        return result
+
+    def topologicalSort(self) -> "array[int]":
+        """Order the nodes so that every connection goes from a node to one later in the order, e.g. so that every job
+        comes after the jobs it depends on. Each connection is one-way, from `from` to `to`.
+
+        This is Kahn's algorithm: count how many connections go into each node, then repeatedly take a node with none
+        left, and remove its connections by counting down the nodes they go into. It takes `O(V + E)` time.
+
+        Raises:
+            ValueError: The graph has a cycle, so there is no such order. `findCycle` finds one.
+
+        Returns:
+            array[int]: Every node's index, in order.
+
+        Dress for the day:
+        >>> clothes = Graph[str].createGraphFromEdges(
+        ...     5, [(0, 1), (1, 2), (3, 2), (0, 4)], ["socks", "shoes", "out", "coat", "hat"]
+        ... )
+        >>> [clothes[index] for index in clothes.topologicalSort()]
+        ['socks', 'coat', 'shoes', 'hat', 'out']
+
+        >>> Graph[None].createGraphFromEdges(3, [(0, 1), (1, 2), (2, 1)]).topologicalSort()
+        Traceback (most recent call last):
+        ...
+        ValueError: The graph has a cycle, so it can't be sorted topologically.
+        """
+        neighbours = self.__neighboursLookup()
+
+        # the number of connections into each node that haven't been removed yet
+        inDegrees = array("i", [0]) * len(self)
+        for index in range(len(self)):
+            for neighbour in neighbours(index):
+                inDegrees[neighbour] += 1
+
+        # the order so far doubles as the queue of nodes to remove: everything after `head` is waiting to be removed
+        order = array(
+            "i", [index for index in range(len(self)) if inDegrees[index] == 0]
+        )
+        head = 0
+        while head < len(order):
+            currentIndex = order[head]
+            head += 1
+            for neighbour in neighbours(currentIndex):
+                inDegrees[neighbour] -= 1
+                if inDegrees[neighbour] == 0:
+                    # that was its last connection in, so it can go next
+                    order.append(neighbour)
+
+        if len(order) < len(self):
+            # the nodes left over all have connections in from each other, so they must be on or after a cycle
+            raise ValueError(
+                "The graph has a cycle, so it can't be sorted topologically."
+            )
+        return order
+
+    def findCycle(self) -> Optional[List[int]]:
+        """Find a cycle: a path of one-way connections that leads back to where it started.
+
+        This is an iterative depth-first search that colours each node white (not yet visited), grey (on the current path)
+        or black (everything after it has been searched). A connection to a grey node leads back onto the current path,
+        closing a cycle. It takes `O(V + E)` time, and doesn't recurse, so it works however deep the graph is.
+
+        Each connection is one-way, so a bidirectional link is a cycle of two nodes.
+
+        Returns:
+            Optional[List[int]]: The indices of the nodes around a cycle, in order, where the last connects back to the
+            first. None if the graph has no cycles.
+
+        >>> jobs = Graph[None].createGraphFromEdges(5, [(0, 1), (1, 2), (2, 3), (3, 1), (0, 4)])
+        >>> jobs.findCycle()
+        [1, 2, 3]
+        >>> jobs.removeLinkBetween(3, 1, bidirectional=False)
+        >>> jobs.findCycle() is None
+        True
+        >>> Graph[None].createGraphFromEdges(1, [(0, 0)]).findCycle()
+        [0]
+        """
+        WHITE, GREY, BLACK = 0, 1, 2
+        neighbours = self.__neighboursLookup()
+        colours = bytearray(len(self))
+        # the node each node was reached from, to walk back around a cycle once one is found
+        parents = array("i", [-1]) * len(self)
+        # the nodes on the current path, and for each, the position in its connections of the next one to try
+        path = Stack[int]()
+        nextConnection = Stack[int]()
+
+        for root in range(len(self)):
+            if colours[root] != WHITE:
+                continue
+            colours[root] = GREY
+            path.push(root)
+            nextConnection.push(0)
+
+            while not path.isEmpty():
+                currentIndex = path.peek()
+                connections = neighbours(currentIndex)
+                position = nextConnection.pop()
+
+                # skip past the connections that have already been searched completely
+                while (position < len(connections)) and (
+                    colours[connections[position]] == BLACK
+                ):
+                    position += 1
+
+                if position == len(connections):
+                    # everything after this node has been searched, without leading back to it
+                    colours[currentIndex] = BLACK
+                    path.pop()
+                    continue
+
+                connectionIndex = connections[position]
+                if colours[connectionIndex] == GREY:
+                    # it's on the current path, so walk back along the path from here to it
+                    cycle = [currentIndex]
+                    while cycle[-1] != connectionIndex:
+                        cycle.append(parents[cycle[-1]])
+                    cycle.reverse()
+                    return cycle
+
+                # it's unvisited, so remember where we got up to here and go deeper
+                nextConnection.push(position + 1)
+                colours[connectionIndex] = GREY
+                parents[connectionIndex] = currentIndex
+                path.push(connectionIndex)
+                nextConnection.push(0)
+
+        return None
+
+    def biconnectivity(self) -> Biconnectivity:
+        """Find the articulation points, bridges and biconnected components of the graph: where it can be cut in two by
+        removing a single node or link, e.g. the chokepoints of a maze or a network.
+
+        This is Tarjan's low-link algorithm. An iterative depth-first search numbers the nodes in the order it reaches them,
+        and works out for each the lowest number reachable from its subtree by at most one link that isn't part of the
+        search tree. When nothing in a node's subtree can get above its parent, the parent is an articulation point (unless
+        it is the root and this is its only subtree), and if nothing can get even as high as the parent, the link to it is a
+        bridge. It takes `O(V + E)` time, and doesn't recurse, so it works however deep the graph is.
+
+        Links are treated as going both ways, as in mazes and `createGraphFromEdges(..., bidirectional=True)`, so every
+        connection should have one back the other way. Nodes without any links aren't in any component.
+
+        Returns:
+            Biconnectivity: The articulation points, the bridges and the nodes of each biconnected component.
+
+        Two squares joined by a corridor, 3 to 4 to 5:
+        >>> rooms = Graph[None].createGraphFromEdges(
+        ...     8, [(0, 1), (1, 2), (2, 3), (3, 0), (3, 4), (4, 5), (5, 6), (6, 7), (7, 5)], bidirectional=True
+        ... )
+        >>> rooms.biconnectivity()
+        Biconnectivity(articulationPoints=[3, 4, 5], bridges=[(3, 4), (4, 5)], components=[[5, 6, 7], [4, 5], [3, 4], [0, 1, 2, 3]])
+        """
+        nodeCount = len(self)
+        neighbours = self.__neighboursLookup()
+        # the order each node was reached in (-1 if it hasn't been yet), and the lowest order reachable from its subtree
+        order = array("i", [-1]) * nodeCount
+        low = array("i", [0]) * nodeCount
+        # the node each node was reached from, whether the link back to it has been passed over yet (so that one link back
+        # is skipped, but a second one isn't), and the position in each node's connections of the next one to try
+        parents = array("i", [-1]) * nodeCount
+        skippedParent = bytearray(nodeCount)
+        nextConnection = array("i", [0]) * nodeCount
+        isArticulationPoint = bytearray(nodeCount)
+        bridges: List[Tuple[int, int]] = []
+        components: List[List[int]] = []
+        # the nodes on the current path, and the nodes reached but not yet put in a component
+        path = Stack[int]()
+        unassigned = Stack[int]()
+        count = 0
+
+        for root in range(nodeCount):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = count
+            count += 1
+            rootChildren = 0
+            path.push(root)
+
+            while not path.isEmpty():
+                currentIndex = path.peek()
+                connections = neighbours(currentIndex)
+                position = nextConnection[currentIndex]
+
+                if position < len(connections):
+                    nextConnection[currentIndex] = position + 1
+                    connectionIndex = connections[position]
+                    if (connectionIndex == parents[currentIndex]) and not skippedParent[
+                        currentIndex
+                    ]:
+                        # that's the link the search came along
+                        skippedParent[currentIndex] = True
+                    elif order[connectionIndex] == -1:
+                        # it's unvisited, so go deeper
+                        order[connectionIndex] = low[connectionIndex] = count
+                        count += 1
+                        parents[connectionIndex] = currentIndex
+                        if currentIndex == root:
+                            rootChildren += 1
+                        path.push(connectionIndex)
+                        unassigned.push(connectionIndex)
+                    elif order[connectionIndex] < low[currentIndex]:
+                        # it's a link back up the search tree
+                        low[currentIndex] = order[connectionIndex]
+                    continue
+
+                # everything after this node has been searched, so hand its low-link back to its parent
+                path.pop()
+                parentIndex = parents[currentIndex]
+                if parentIndex == -1:
+                    continue
+                if low[currentIndex] < low[parentIndex]:
+                    low[parentIndex] = low[currentIndex]
+                if low[currentIndex] >= order[parentIndex]:
+                    # nothing below gets above the parent, so the subtree and the parent are a component of their own
+                    if parentIndex != root:
+                        isArticulationPoint[parentIndex] = True
+                    if low[currentIndex] > order[parentIndex]:
+                        bridges.append(
+                            (min(parentIndex, currentIndex), max(parentIndex, currentIndex))
+                        )
+                    component = [parentIndex]
+                    while True:
+                        index = unassigned.pop()
+                        component.append(index)
+                        if index == currentIndex:
+                            break
+                    component.sort()
+                    components.append(component)
+
+            if rootChildren > 1:
+                isArticulationPoint[root] = True
+
+        articulationPoints = [
+            index for index in range(nodeCount) if isArticulationPoint[index]
+        ]
+        bridges.sort()
+        return Biconnectivity(articulationPoints, bridges, components)
+
+    def __checkDataIndexIsValidWithException(self, index: int) -> bool:
+        if not (len(self) > index >= 0):
+            raise IndexError(f"Value at index {index} not found.")
+        return True
 
     def __checkIndexIsValidWithException(self, index: int) -> bool:
-        if not (len(self.__nodes) > index >= 0):
+        if not (len(self) > index >= 0):
             raise IndexError("Node at index {} is out of range.".format(str(index)))
         return True
 
@@ -427,10 +2717,20 @@ class Graph(Generic[T]):
         # make sure indices are valid
         self.__checkIndexIsValidWithException(indexFrom)
         self.__checkIndexIsValidWithException(indexTo)
+        # and that the nodes can be edited
+        self._checkCanChange()
+        self.__expandCompactStorage()
 
         # check it's in the list of indices
-        if indexTo in self.__nodes[indexFrom].connections:
-            self.__nodes[indexFrom].connections.remove(indexTo)
+        node = self.__nodes[indexFrom]
+        if indexTo in node.connections:
+            node = self.__editableNode(indexFrom)
+            position = node.connections.index(indexTo)
+            del node.connections[position]
+            if node.weights is not None:
+                # and its cost along with it
+                del node.weights[position]
+            self._structureChanged()
         else:
             # it isn't
             raise ValueError(
@@ -446,6 +2746,7 @@ class Graph(Generic[T]):
         indexFrom: int,
         indexTo: int,
         bidirectional: bool = True,
+        weight: Optional[float] = None,
     ) -> None:
         """Add a link between two nodes of given indices.
 
@@ -453,6 +2754,7 @@ class Graph(Generic[T]):
             indexFrom (int): the 'from' node to connect to the 'to'
             indexTo (int): the 'to' node
             bidirectional (bool, optional): Whether or not to connect the link both ways (i.e., `indexFrom` to `indexTo` and vice versa.). Defaults to True.
+            weight (Optional[float], optional): The cost of the link (both ways, if bidirectional). Defaults to None, meaning it costs 1.
 
         Raises:
             Exception: If the node index `indexFrom` already exists in `indexTo`'s connections.
@@ -493,6 +2795,9 @@ class Graph(Generic[T]):
         # make sure indices are valid
         self.__checkIndexIsValidWithException(indexFrom)
         self.__checkIndexIsValidWithException(indexTo)
+        # and that the nodes can be edited
+        self._checkCanChange()
+        self.__expandCompactStorage()
 
         # check the node isn't already connected
         if self.connectionExistsFrom(indexFrom, indexTo):
@@ -517,10 +2822,169 @@ class Graph(Generic[T]):
 
             # set our temporary vars correctly
             nodeTemp.connections.append(indexTo)
+            if (weight is not None) and (nodeTemp.weights is None):
+                # the node's other connections cost 1
+                nodeTemp.weights = [1.0] * (len(nodeTemp.connections) - 1)
+            if nodeTemp.weights is not None:
+                nodeTemp.weights.append(1.0 if weight is None else weight)
             # and then set the node we want to the correctly set temporary variable
-            self.__nodes[indexFrom] = nodeTemp
+            self.__setNode(indexFrom, nodeTemp)
+            self._linksAdded([(indexFrom, indexTo)])
 
         if bidirectional:
             # do it again!
             #  but make sure to not do it bidirectionally because then it'd go on forever
-            self.addLinkBetween(indexTo, indexFrom, False)
+            self.addLinkBetween(indexTo, indexFrom, False, weight)
+
+    def addLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = True,
+        weights: Optional[Iterable[float]] = None,
+    ) -> None:
+        """Add many links at once, e.g. when loading a whole graph.
+
+        The edges are read and checked in a single pass, with each touched node's connections put in a set so that
+        spotting a duplicate takes constant time. Nothing is changed unless every edge is valid, and each touched node
+        is copied at most once, so adding `E` links takes `O(E)` time. A compact graph stays compact.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of node indices to link.
+            bidirectional (bool, optional): Whether or not to also link each `to` node back to its `from` node. Defaults to True.
+            weights (Optional[Iterable[float]], optional): The cost of each link, in the same order as `edges`. Defaults to None,
+            meaning each costs 1.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: A link already exists, or appears more than once in `edges`, or there isn't one weight per edge.
+
+        >>> maze = Graph[None].createGraph(3, 1)
+        >>> maze.addLinks([(0, 1), (1, 2)])
+        >>> maze
+        ['None -> [1]', 'None -> [0, 2]', 'None -> [1]']
+
+        >>> maze.addLinks([(0, 2), (2, 1)])
+        Traceback (most recent call last):
+        ...
+        ValueError: Node index '1' already exists in node 2's connections.
+        >>> maze.connectionExistsFrom(0, 2)
+        False
+
+        >>> maze.compact()
+        >>> maze.addLinks([(0, 2)], bidirectional=False)
+        >>> maze.isCompact(), maze.connectionExistsFrom(0, 2), maze.connectionExistsFrom(2, 0)
+        (True, True, False)
+        """
+        self._checkCanChange()
+        sources, destinations = CSRAdjacency.edgeArrays(
+            len(self), edges, bidirectional
+        )
+        edgeWeights = None
+        if weights is not None:
+            edgeWeights = CSRAdjacency.weightArray(weights, bidirectional, len(sources))
+
+        # check every link is new, keeping a set of the connections of each node we've come across
+        connectionSets: Dict[int, Set[int]] = {}
+        for indexFrom, indexTo in zip(sources, destinations):
+            connections = connectionSets.get(indexFrom)
+            if connections is None:
+                connections = set(self._neighbours(indexFrom))
+                connectionSets[indexFrom] = connections
+            if indexTo in connections:
+                raise ValueError(
+                    "Node index '{}' already exists in node {}'s connections.".format(
+                        str(indexTo), str(indexFrom)
+                    )
+                )
+            connections.add(indexTo)
+
+        if self.__csr is not None:
+            self.__csr = self.__csr.withEdges(sources, destinations, edgeWeights)
+        else:
+            # copy each touched node once, rather than once per link, so no other node sharing its connections list is changed
+            for index in connectionSets:
+                node = self.__nodes[index].clone()
+                if (edgeWeights is not None) and (node.weights is None):
+                    # the node's existing connections cost 1
+                    node.weights = [1.0] * len(node.connections)
+                self.__setNode(index, node)
+            for edge, (indexFrom, indexTo) in enumerate(zip(sources, destinations)):
+                node = self.__nodes[indexFrom]
+                node.connections.append(indexTo)
+                if node.weights is not None:
+                    node.weights.append(1.0 if edgeWeights is None else edgeWeights[edge])
+
+        self._linksAdded(zip(sources, destinations))
+
+    def removeLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = True,
+    ) -> None:
+        """Remove many links at once.
+
+        The edges are read and checked in a single pass, with each touched node's connections put in a set so that
+        checking a link exists takes constant time. Nothing is changed unless every link exists, and each touched
+        node's connections are rebuilt once, so removing `E` links takes linear time. A compact graph stays compact.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of node indices to unlink.
+            bidirectional (bool, optional): Whether or not to also remove the link from each `to` node back to its `from` node. Defaults to True.
+
+        Raises:
+            IndexError: An edge refers to a node index that is out of range.
+            ValueError: A link doesn't exist, or appears more than once in `edges`.
+
+        >>> maze = Graph[None].createGraphFromEdges(3, [(0, 1), (1, 2), (2, 0)], bidirectional=True)
+        >>> maze.removeLinks([(0, 1), (1, 2)])
+        >>> maze
+        ['None -> [2]', 'None -> []', 'None -> [0]']
+
+        >>> maze.removeLinks([(2, 0), (0, 1)])
+        Traceback (most recent call last):
+        ...
+        ValueError: Node index 1 already does not exist in node at index 0's connections.
+        >>> maze.connectionExistsFrom(2, 0)
+        True
+        """
+        self._checkCanChange()
+        sources, destinations = CSRAdjacency.edgeArrays(
+            len(self), edges, bidirectional
+        )
+
+        # check every link exists, crossing it off a set of the connections of its node as we go
+        connectionSets: Dict[int, Set[int]] = {}
+        for indexFrom, indexTo in zip(sources, destinations):
+            connections = connectionSets.get(indexFrom)
+            if connections is None:
+                connections = set(self._neighbours(indexFrom))
+                connectionSets[indexFrom] = connections
+            if indexTo not in connections:
+                raise ValueError(
+                    f"Node index {indexTo} already does not exist in node at index {indexFrom}'s connections.",
+                )
+            connections.remove(indexTo)
+
+        if self.__csr is not None:
+            self.__csr = self.__csr.withoutEdges(sources, destinations)
+        else:
+            # what's left in each set is what the node keeps, so filter its connections down to that, keeping their order
+            for index, remaining in connectionSets.items():
+                node = self.__nodes[index]
+                kept = [
+                    position
+                    for position, connection in enumerate(node.connections)
+                    if connection in remaining
+                ]
+                self.__setNode(
+                    index,
+                    Node(
+                        node.data,
+                        [node.connections[position] for position in kept],
+                        None
+                        if node.weights is None
+                        else [node.weights[position] for position in kept],
+                    ),
+                )
+
+        self._structureChanged()
@@ -1,28 +1,190 @@
+from array import array
+from biconnectivity import Biconnectivity as Biconnectivity
 from circular_queue import CircularQueue as CircularQueue
+from csr_adjacency import CSRAdjacency as CSRAdjacency
+from disjoint_set import DisjointSet as DisjointSet
+from graph_file import GraphFile as GraphFile
 from graph_node import Node as Node
-from typing import Generator, Generic, Iterator, List, Optional, TypeVar
+from path_result import PathResult as PathResult
+from stack import Stack as Stack
+from _traversal_order import TraversalOrder as TraversalOrder
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 T = TypeVar("T")
 
 class Graph(Generic[T]):
     def __init__(self, nodes: Optional[list[Node[T]]] = ...) -> None: ...
     def __iter__(self) -> Generator[Node[T], None, None]: ...
+    @overload
     def __getitem__(self, key: int) -> Optional[T]: ...
+    @overload
+    def __getitem__(self, key: slice) -> List[Optional[T]]: ...
     def __len__(self) -> int: ...
-    def getConnectionsOfNodeAtIndex(self, index: int) -> List[int]: ...
+    def getConnectionsOfNodeAtIndex(self, index: int) -> Sequence[int]: ...
+    def getWeight(self, indexFrom: int, indexTo: int) -> float: ...
     def setNodeData(self, index: int, newValue: T) -> None: ...
+    def getData(self, indices: Union[Iterable[int], slice]) -> List[Optional[T]]: ...
+    def setData(
+        self, indices: Union[Iterable[int], slice], values: Iterable[Optional[T]]
+    ) -> None: ...
+    def addColumn(
+        self, name: str, typecode: str = ..., default: float = ...
+    ) -> array[Any]: ...
+    def column(self, name: str) -> array[Any]: ...
+    def removeColumn(self, name: str) -> None: ...
+    def columnNames(self) -> List[str]: ...
     @staticmethod
     def createGraph(sizeX: int, sizeY: int) -> Graph[T]: ...
+    @staticmethod
+    def manhattanHeuristic(sizeX: int) -> Callable[[int, int], float]: ...
+    @staticmethod
+    def createGraphFromEdges(
+        nodeCount: int,
+        edges: Iterable[Tuple[int, int]],
+        values: Optional[list[T]] = ...,
+        bidirectional: bool = ...,
+        weights: Optional[Iterable[float]] = ...,
+    ) -> Graph[T]: ...
+    def save(self, path: str) -> None: ...
+    @staticmethod
+    def load(path: str, mmap: bool = ...) -> Graph[T]: ...
+    @staticmethod
+    def createGraphFromAdjacency(
+        adjacency: CSRAdjacency, values: Optional[list[T]] = ...
+    ) -> Graph[T]: ...
     def setNodesFromNodesList(self, nodes: list[Node[T]]) -> None: ...
     def setNodesFromValuesAndConnections(
-        self, values: list[T], connectionsPointers: list[list[int]]
+        self,
+        values: list[T],
+        connectionsPointers: list[list[int]],
+        compact: bool = ...,
     ) -> None: ...
     def connectionExistsFrom(self, indexA: int, indexB: int) -> bool: ...
-    def depthFirstTraversal(self, nodeIndex: Optional[int] = ...) -> Iterator[T]: ...
+    def isCompact(self) -> bool: ...
+    def compact(self) -> None: ...
+    def memoryUsage(self) -> int: ...
+    def snapshot(self) -> Graph[T]: ...
+    def isSnapshot(self) -> bool: ...
+    def depthFirstTraversal(
+        self, nodeIndex: Optional[int] = ..., order: TraversalOrder = ...
+    ) -> Iterator[T]: ...
+    def adepthFirstTraversal(
+        self,
+        nodeIndex: Optional[int] = ...,
+        order: TraversalOrder = ...,
+        chunkSize: int = ...,
+        deadline: Optional[float] = ...,
+        progress: Optional[Callable[[int], None]] = ...,
+    ) -> AsyncIterator[T]: ...
     def breadthFirstTraversal(self) -> Iterator[Optional[T]]: ...
+    def abreadthFirstTraversal(
+        self,
+        chunkSize: int = ...,
+        deadline: Optional[float] = ...,
+        progress: Optional[Callable[[int], None]] = ...,
+    ) -> AsyncIterator[T]: ...
+    def breadthFirstDistances(
+        self, nodeIndex: int = ...
+    ) -> Tuple[array[int], array[int]]: ...
+    def distanceField(
+        self, sources: Iterable[int]
+    ) -> Tuple[array[int], array[int]]: ...
+    def reachableFrom(self, sources: Iterable[int]) -> bytearray: ...
+    def shortestPath(self, indexFrom: int, indexTo: int) -> PathResult: ...
+    async def ashortestPath(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        chunkSize: int = ...,
+        deadline: Optional[float] = ...,
+        progress: Optional[Callable[[int], None]] = ...,
+    ) -> PathResult: ...
+    def bidirectionalShortestPath(
+        self, indexFrom: int, indexTo: int
+    ) -> PathResult: ...
+    def dijkstra(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        weight: Optional[Callable[[int, int], float]] = ...,
+    ) -> PathResult: ...
+    def dijkstraDistances(
+        self,
+        indexFrom: int,
+        weight: Optional[Callable[[int, int], float]] = ...,
+    ) -> Tuple[array[float], array[int]]: ...
+    async def adijkstraDistances(
+        self,
+        indexFrom: int,
+        weight: Optional[Callable[[int, int], float]] = ...,
+        chunkSize: int = ...,
+        deadline: Optional[float] = ...,
+        progress: Optional[Callable[[int], None]] = ...,
+    ) -> Tuple[array[float], array[int]]: ...
+    def aStar(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        heuristic: Callable[[int, int], float],
+        weight: Optional[Callable[[int, int], float]] = ...,
+    ) -> PathResult: ...
+    async def adijkstra(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        weight: Optional[Callable[[int, int], float]] = ...,
+        chunkSize: int = ...,
+        deadline: Optional[float] = ...,
+        progress: Optional[Callable[[int], None]] = ...,
+    ) -> PathResult: ...
+    async def aaStar(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        heuristic: Callable[[int, int], float],
+        weight: Optional[Callable[[int, int], float]] = ...,
+        chunkSize: int = ...,
+        deadline: Optional[float] = ...,
+        progress: Optional[Callable[[int], None]] = ...,
+    ) -> PathResult: ...
+    def getVersion(self) -> int: ...
+    def componentOf(self, index: int) -> int: ...
+    def sameComponent(self, indexA: int, indexB: int) -> bool: ...
+    def components(self) -> List[List[int]]: ...
+    def topologicalSort(self) -> array[int]: ...
+    def findCycle(self) -> Optional[List[int]]: ...
+    def biconnectivity(self) -> Biconnectivity: ...
     def removeLinkBetween(
         self, indexFrom: int, indexTo: int, bidirectional: bool = ...
     ) -> None: ...
     def addLinkBetween(
-        self, indexFrom: int, indexTo: int, bidirectional: bool = ...
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = ...,
+        weight: Optional[float] = ...,
+    ) -> None: ...
+    def addLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = ...,
+        weights: Optional[Iterable[float]] = ...,
+    ) -> None: ...
+    def removeLinks(
+        self, edges: Iterable[Tuple[int, int]], bidirectional: bool = ...
     ) -> None: ...
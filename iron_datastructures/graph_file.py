@@ -0,0 +1,214 @@
+#!python3.9
+
+# memory-mapping graph files rather than reading them in
+from mmap import ACCESS_READ, mmap as memoryMap
+
+# serializing the nodes' data, which can be of any type
+import pickle
+
+# packing the header and checking the machine's byte order
+import struct
+import sys
+
+# flat arrays for the offsets and neighbour indices
+from array import array
+
+# support type hinting in editor and code
+from typing import Any, List, Optional, Sequence, Tuple
+
+# compact adjacency storage
+from csr_adjacency import CSRAdjacency
+
+
+class GraphFile:
+    """Reads and writes graphs in a compact binary format, so that large graphs can be saved without pickling every node
+    and loaded without building any node objects.
+
+    A graph file is laid out as:
+
+    - a 40 byte header: the magic bytes `IRONGRPH`, the format version and some flags (each a little-endian `uint32`),
+      then the number of nodes, the number of connections and the size of the data section (each a little-endian `uint64`)
+    - the CSR offsets, one little-endian `int64` per node plus one
+    - the CSR targets, one little-endian `int32` per connection, padded to a multiple of 8 bytes
+    - the cost of each connection, one little-endian `float64` per connection, if the connections have costs
+      (flag `HAS_WEIGHTS`, from version 2)
+    - the nodes' data, pickled, if any node has any (flag `HAS_DATA`)
+
+    Every section starts on an 8 byte boundary, so the offsets and targets can be used straight out of a memory-mapped file.
+
+    Write a graph's adjacency to a file and read it back:
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "maze.graph")
+    >>> GraphFile.write(path, CSRAdjacency.fromConnections([[1], [0, 2], [1]]), ["Entrance", None, "Exit"])
+    >>> adjacency, values = GraphFile.read(path)
+    >>> adjacency.toConnections(), values
+    ([[1], [0, 2], [1]], ['Entrance', None, 'Exit'])
+    """
+
+    MAGIC = b"IRONGRPH"
+    VERSION = 2
+    HAS_DATA = 1  # flag: the file has a data section
+    HAS_WEIGHTS = 2  # flag: the file has a weights section
+
+    # magic, version, flags, node count, connection count, data section size
+    __HEADER = struct.Struct("<8sIIQQQ")
+
+    @staticmethod
+    def write(path: str, adjacency: CSRAdjacency, values: Sequence[Any]) -> None:
+        """Write a graph to a file.
+
+        Args:
+            path (str): The path of the file to write, which is replaced if it exists.
+            adjacency (CSRAdjacency): The graph's connections.
+            values (Sequence[Any]): The data of each node. The data section is left out if every node's data is `None`.
+
+        Raises:
+            ValueError: There isn't exactly one value for every node.
+        """
+        nodeCount = len(adjacency)
+        if len(values) != nodeCount:
+            raise ValueError("There must be exactly one value for every node.")
+
+        flags = 0
+        data = b""
+        if any(value is not None for value in values):
+            flags |= GraphFile.HAS_DATA
+            data = pickle.dumps(list(values), protocol=pickle.HIGHEST_PROTOCOL)
+
+        offsets: Any = adjacency.offsets
+        targets: Any = adjacency.targets
+        weights: Any = adjacency.weights
+        if weights is not None:
+            flags |= GraphFile.HAS_WEIGHTS
+        else:
+            weights = b""
+        if sys.byteorder != "little":
+            # the file is always little-endian
+            offsets = array("q", offsets)
+            targets = array("i", targets)
+            offsets.byteswap()
+            targets.byteswap()
+            if flags & GraphFile.HAS_WEIGHTS:
+                weights = array("d", weights)
+                weights.byteswap()
+
+        with open(path, "wb") as file:
+            file.write(
+                GraphFile.__HEADER.pack(
+                    GraphFile.MAGIC,
+                    GraphFile.VERSION,
+                    flags,
+                    nodeCount,
+                    len(targets),
+                    len(data),
+                )
+            )
+            file.write(offsets)
+            file.write(targets)
+            file.write(bytes(GraphFile.__padding(len(targets) * 4)))
+            file.write(weights)
+            file.write(data)
+
+    @staticmethod
+    def read(path: str, mmap: bool = True) -> Tuple[CSRAdjacency, List[Optional[Any]]]:
+        """Read a graph from a file.
+
+        The data section is unpickled, so only read files you trust if they might have one.
+
+        Args:
+            path (str): The path of the file to read.
+            mmap (bool, optional): Whether to memory-map the file and use the offsets and targets straight out of it,
+            rather than reading them into memory. The mapping is read-only and shared with every other process mapping
+            the same file. Defaults to True.
+
+        Raises:
+            ValueError: The file isn't a graph file, is from a newer version of the format, or is cut short.
+
+        Returns:
+            Tuple[CSRAdjacency, List[Optional[Any]]]: The graph's connections and the data of each node.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "not_a.graph")
+        >>> with open(path, "wb") as file:
+        ...     _ = file.write(b"definitely not a graph file, honest")
+        >>> GraphFile.read(path)
+        Traceback (most recent call last):
+        ...
+        ValueError: This is not a graph file.
+        """
+        with open(path, "rb") as file:
+            if mmap and (sys.byteorder == "little"):
+                buffer: Any = memoryview(
+                    memoryMap(file.fileno(), 0, access=ACCESS_READ)
+                )
+            else:
+                buffer = memoryview(file.read())
+
+        if len(buffer) < GraphFile.__HEADER.size:
+            raise ValueError("This is not a graph file.")
+        magic, version, flags, nodeCount, edgeCount, dataSize = (
+            GraphFile.__HEADER.unpack_from(buffer)
+        )
+        if magic != GraphFile.MAGIC:
+            raise ValueError("This is not a graph file.")
+        if version > GraphFile.VERSION:
+            raise ValueError(
+                f"This graph file is version {version}, but only up to version {GraphFile.VERSION} can be read."
+            )
+
+        # work out where each section starts and ends
+        offsetsStart = GraphFile.__HEADER.size
+        targetsStart = offsetsStart + (nodeCount + 1) * 8
+        weightsStart = (
+            targetsStart + edgeCount * 4 + GraphFile.__padding(edgeCount * 4)
+        )
+        dataStart = weightsStart
+        if flags & GraphFile.HAS_WEIGHTS:
+            dataStart += edgeCount * 8
+        if len(buffer) < dataStart + dataSize:
+            raise ValueError("This graph file is cut short.")
+
+        offsetsBytes = buffer[offsetsStart:targetsStart]
+        targetsBytes = buffer[targetsStart : targetsStart + edgeCount * 4]
+        weightsBytes = buffer[weightsStart:dataStart]
+        offsets: Sequence[int]
+        targets: Sequence[int]
+        weights: Optional[Sequence[float]] = None
+        if mmap and (sys.byteorder == "little"):
+            # use them where they are
+            offsets = offsetsBytes.cast("q")
+            targets = targetsBytes.cast("i")
+            if flags & GraphFile.HAS_WEIGHTS:
+                weights = weightsBytes.cast("d")
+        else:
+            # copy them out of the file's bytes, into arrays of this machine's byte order
+            offsets = array("q", offsetsBytes.tobytes())
+            targets = array("i", targetsBytes.tobytes())
+            if flags & GraphFile.HAS_WEIGHTS:
+                weights = array("d", weightsBytes.tobytes())
+            if sys.byteorder != "little":
+                offsets.byteswap()
+                targets.byteswap()
+                if weights is not None:
+                    weights.byteswap()  # type: ignore
+
+        values: List[Optional[Any]]
+        if flags & GraphFile.HAS_DATA:
+            values = pickle.loads(buffer[dataStart : dataStart + dataSize])
+        else:
+            values = [None] * nodeCount
+
+        return CSRAdjacency(offsets, targets, weights), values
+
+    @staticmethod
+    def __padding(size: int) -> int:
+        """Get the number of bytes needed to pad a section to a multiple of 8 bytes.
+
+        Args:
+            size (int): The size of the section, in bytes.
+
+        Returns:
+            int: The number of padding bytes.
+        """
+        return -size % 8
+
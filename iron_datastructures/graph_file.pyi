@@ -0,0 +1,14 @@
+from csr_adjacency import CSRAdjacency as CSRAdjacency
+from typing import Any, List, Optional, Sequence, Tuple
+
+class GraphFile:
+    MAGIC: bytes
+    VERSION: int
+    HAS_DATA: int
+    HAS_WEIGHTS: int
+    @staticmethod
+    def write(path: str, adjacency: CSRAdjacency, values: Sequence[Any]) -> None: ...
+    @staticmethod
+    def read(
+        path: str, mmap: bool = ...
+    ) -> Tuple[CSRAdjacency, List[Optional[Any]]]: ...
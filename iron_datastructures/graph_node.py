@@ -18,19 +18,29 @@ class Node(Generic[T]):
     connections: list[
         int
     ]  # pointers of this node's connections   – public bc it needs to be read by the graph
+    weights: Optional[
+        list[float]
+    ]  # the cost of each of this node's connections, in the same order, or None if every connection costs 1
     visited: bool = (
         False  # a helper variable to assist in traversals of a graph of nodes
     )
 
-    def __init__(self, data: Optional[T], connections: list[int] = list[int]()) -> None:
+    def __init__(
+        self,
+        data: Optional[T],
+        connections: list[int] = list[int](),
+        weights: Optional[list[float]] = None,
+    ) -> None:
         """Constructor for a binary tree node.
 
         Args:
             data (T): This node's data, e.g. 'Barry'.
             connections (list[int], optional): The list of pointers that are connections of this node. Defaults to an emply list[int]().
+            weights (Optional[list[float]], optional): The cost of each connection, in the same order as `connections`. Defaults to None, meaning every connection costs 1.
         """
         self.data = data
         self.connections = connections
+        self.weights = weights
 
     def __repr__(self) -> str:
         """Return a string representation of this object
@@ -49,4 +59,7 @@ class Node(Generic[T]):
     def clone(self) -> "Node[T]":
         #  make sure to clone by value, not reference.
         connections: List[int] = [x for x in self.connections]
-        return Node[T](self.data, connections)
\ No newline at end of file
+        weights: Optional[List[float]] = (
+            None if self.weights is None else list(self.weights)
+        )
+        return Node[T](self.data, connections, weights)
\ No newline at end of file
@@ -5,6 +5,12 @@ T = TypeVar("T")
 class Node(Generic[T]):
     data: Optional[T]
     connections: list[int]
+    weights: Optional[list[float]]
     visited: bool = ...
-    def __init__(self, data: Optional[T], connections: list[int] = ...) -> None: ...
+    def __init__(
+        self,
+        data: Optional[T],
+        connections: list[int] = ...,
+        weights: Optional[list[float]] = ...,
+    ) -> None: ...
     def clone(self) -> Node[T]: ...
@@ -0,0 +1,237 @@
+#!python3.9
+
+# the number of CPUs, for the default number of workers
+import os
+
+# worker processes, and the shared memory they read the graph from
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+# support type hinting in editor and code
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+# the graph the queries are answered on, and its compact adjacency storage
+from csr_adjacency import CSRAdjacency
+from graph import Graph
+from path_result import PathResult
+
+# the graph each worker process answers queries on, attached to the shared memory when the worker starts
+_workerGraph: Optional[Graph[None]] = None
+# and the shared memory itself, which must outlive the graph
+_workerMemory: Optional[SharedMemory] = None
+# the connections into each node, in the shared memory, which the graph must never work out for itself
+_workerReverse: Optional[CSRAdjacency] = None
+
+
+class GraphQueryPool:
+    """Answers batches of independent path queries on a graph with a pool of worker processes, so that they aren't all
+    answered one at a time on one core.
+
+    The graph's connections are copied into shared memory once, as the flat CSR offset and target arrays of the
+    connections out of each node and of the connections into each node (which the backwards half of a bidirectional
+    search follows). Each worker attaches to the shared memory and searches the arrays where they are, without copying
+    or unpickling the graph, or working anything out from it. Only the queries and their results are sent between
+    processes.
+
+    The pool answers queries on the graph as it was when the pool was made. The nodes' data isn't shared.
+
+    Answer some queries on a maze, in order:
+    >>> maze = Graph[None].createGraphFromEdges(5, [(0, 1), (1, 2), (3, 4)], bidirectional=True)
+    >>> with GraphQueryPool(maze, processes=2) as pool:
+    ...     pool.shortestPaths([(0, 2), (2, 0), (0, 4)])
+    ...     pool.reachable([(0, 2), (0, 4), (4, 3)])
+    [PathResult(path=[0, 1, 2], cost=2, nodesExpanded=2), PathResult(path=[2, 1, 0], cost=2, nodesExpanded=2), PathResult(path=[], cost=inf, nodesExpanded=3)]
+    [True, False, True]
+
+    A graph with far fewer connections than nodes:
+    >>> corridor = Graph[None].createGraphFromEdges(1000, [(0, 1), (1, 2)])
+    >>> with GraphQueryPool(corridor, processes=1) as pool:
+    ...     pool.reachable([(0, 2), (2, 0), (0, 999)])
+    [True, False, False]
+    """
+
+    __memory: SharedMemory  # the graph's forwards and backwards offsets and targets, laid out by `_sharedArrays`
+    __pool: Any  # the worker processes
+    __processes: int  # the number of worker processes
+    __nodeCount: int
+
+    def __init__(self, graph: Graph[Any], processes: Optional[int] = None) -> None:
+        """Constructor for a query pool. Copies the graph's connections into shared memory and starts the workers.
+
+        Args:
+            graph (Graph[Any]): The graph to answer queries on.
+            processes (Optional[int], optional): The number of worker processes. Defaults to None, meaning one per CPU.
+        """
+        adjacency = graph._adjacency()
+        reverse = graph._reverseAdjacency()
+        self.__nodeCount = len(adjacency)
+        edgeCount = adjacency.edgeCount()
+
+        # copy both ways' offsets (8 bytes each) and targets (4 bytes each) into one block of shared memory
+        self.__memory = SharedMemory(
+            create=True,
+            size=max(1, 2 * ((self.__nodeCount + 1) * 8 + edgeCount * 4)),
+        )
+        try:
+            sharedArrays = _sharedArrays(
+                self.__memory.buf, self.__nodeCount, edgeCount
+            )
+            try:
+                for shared, values in zip(
+                    sharedArrays,
+                    (adjacency.offsets, adjacency.targets, reverse.offsets, reverse.targets),
+                ):
+                    shared[:] = memoryview(values)  # type: ignore
+            finally:
+                # let go of the shared memory, so that it can be closed
+                for shared in sharedArrays:
+                    shared.release()
+
+            self.__processes = processes or os.cpu_count() or 1
+            self.__pool = Pool(
+                self.__processes,
+                initializer=_attachWorker,
+                initargs=(self.__memory.name, self.__nodeCount, edgeCount),
+            )
+        except BaseException:
+            # don't leave the shared memory behind if the pool couldn't be made
+            self.__memory.close()
+            self.__memory.unlink()
+            raise
+
+    def __enter__(self) -> "GraphQueryPool":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory. The pool can't be used afterwards."""
+        self.__pool.terminate()
+        self.__pool.join()
+        self.__memory.close()
+        self.__memory.unlink()
+
+    def shortestPaths(self, queries: Iterable[Tuple[int, int]]) -> List[PathResult]:
+        """Find the path with the fewest connections for each of some `(from, to)` pairs of nodes,
+        with `Graph.bidirectionalShortestPath`.
+
+        Args:
+            queries (Iterable[Tuple[int, int]]): The `(from, to)` node indices of each query.
+
+        Raises:
+            IndexError: A node index is out of range.
+
+        Returns:
+            List[PathResult]: The result of each query, in the same order as the queries.
+        """
+        return self.__map(_shortestPath, queries)
+
+    def reachable(self, queries: Iterable[Tuple[int, int]]) -> List[bool]:
+        """Check whether there's a path for each of some `(from, to)` pairs of nodes.
+
+        Args:
+            queries (Iterable[Tuple[int, int]]): The `(from, to)` node indices of each query.
+
+        Raises:
+            IndexError: A node index is out of range.
+
+        Returns:
+            List[bool]: Whether there's a path for each query, in the same order as the queries.
+        """
+        return self.__map(_reachable, queries)
+
+    def __map(
+        self,
+        function: Callable[[Sequence[int]], Any],
+        queries: Iterable[Tuple[int, int]],
+    ) -> List[Any]:
+        """Answer each query on a worker, sending them out in chunks.
+
+        Args:
+            function (Callable[[Sequence[int]], Any]): The module-level function that answers one query on a worker.
+            queries (Iterable[Tuple[int, int]]): The `(from, to)` node indices of each query.
+
+        Raises:
+            IndexError: A node index is out of range.
+
+        Returns:
+            List[Any]: The answer to each query, in the same order as the queries.
+        """
+        queries = list(queries)
+        # check the queries here, so a bad one doesn't get as far as a worker
+        for query in queries:
+            for index in query:
+                if not (self.__nodeCount > index >= 0):
+                    raise IndexError(f"Node at index {index} is out of range.")
+
+        # a few chunks per worker: big enough that sending them is cheap, small enough to even out slow queries
+        chunkSize = max(1, len(queries) // (self.__processes * 4))
+        return self.__pool.map(function, queries, chunkSize)
+
+
+def _sharedArrays(
+    buffer: memoryview, nodeCount: int, edgeCount: int
+) -> Tuple[memoryview, memoryview, memoryview, memoryview]:
+    """Lay the graph's arrays out in a block of shared memory: the offsets of the connections out of and into each node
+    first, so that they're all 8-byte aligned, and then the targets of each.
+
+    Args:
+        buffer (memoryview): The shared memory, at least `2 * ((nodeCount + 1) * 8 + edgeCount * 4)` bytes long.
+        nodeCount (int): The number of nodes in the graph.
+        edgeCount (int): The number of connections in the graph.
+
+    Returns:
+        Tuple[memoryview, memoryview, memoryview, memoryview]: The forwards offsets and targets, and then the backwards
+        offsets and targets.
+
+    >>> [len(view) for view in _sharedArrays(memoryview(bytearray(72)), 2, 3)]
+    [3, 3, 3, 3]
+    >>> [len(view) for view in _sharedArrays(memoryview(bytearray(8032)), 500, 2)]
+    [501, 2, 501, 2]
+    """
+    offsetsSize = (nodeCount + 1) * 8
+    targetsSize = edgeCount * 4
+    targetsStart = offsetsSize * 2
+    return (
+        buffer[:offsetsSize].cast("q"),
+        buffer[targetsStart : targetsStart + targetsSize].cast("i"),
+        buffer[offsetsSize:targetsStart].cast("q"),
+        buffer[targetsStart + targetsSize : targetsStart + targetsSize * 2].cast("i"),
+    )
+
+
+def _attachWorker(memoryName: str, nodeCount: int, edgeCount: int) -> None:
+    """Start a worker process: attach to the shared memory, and make a graph that reads its connections both ways straight
+    out of it.
+
+    Args:
+        memoryName (str): The name of the shared memory holding the graph's offsets and targets.
+        nodeCount (int): The number of nodes in the graph.
+        edgeCount (int): The number of connections in the graph.
+    """
+    global _workerGraph, _workerMemory, _workerReverse
+
+    # the workers share the pool's resource tracker, so this doesn't make the worker an owner of the shared memory
+    _workerMemory = SharedMemory(name=memoryName)
+    offsets, targets, reverseOffsets, reverseTargets = _sharedArrays(
+        _workerMemory.buf, nodeCount, edgeCount
+    )
+    _workerGraph = Graph[None].createGraphFromAdjacency(CSRAdjacency(offsets, targets))
+    # the backwards searches follow the shared connections into each node, rather than the worker working out its own
+    _workerReverse = CSRAdjacency(reverseOffsets, reverseTargets)
+    _workerGraph._setReverseAdjacency(_workerReverse)
+
+
+def _shortestPath(query: Sequence[int]) -> PathResult:
+    """Answer a shortest path query on a worker."""
+    assert _workerGraph is not None
+    assert _workerGraph._reverseAdjacency() is _workerReverse
+    return _workerGraph.bidirectionalShortestPath(query[0], query[1])
+
+
+def _reachable(query: Sequence[int]) -> bool:
+    """Answer a reachability query on a worker."""
+    assert _workerGraph is not None
+    assert _workerGraph._reverseAdjacency() is _workerReverse
+    return _workerGraph.bidirectionalShortestPath(query[0], query[1]).found()
@@ -0,0 +1,11 @@
+from graph import Graph as Graph
+from path_result import PathResult as PathResult
+from typing import Any, Iterable, List, Optional, Tuple
+
+class GraphQueryPool:
+    def __init__(self, graph: Graph[Any], processes: Optional[int] = ...) -> None: ...
+    def __enter__(self) -> GraphQueryPool: ...
+    def __exit__(self, *_: Any) -> None: ...
+    def close(self) -> None: ...
+    def shortestPaths(self, queries: Iterable[Tuple[int, int]]) -> List[PathResult]: ...
+    def reachable(self, queries: Iterable[Tuple[int, int]]) -> List[bool]: ...
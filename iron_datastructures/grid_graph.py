@@ -0,0 +1,637 @@
+#!python3.9
+
+# measuring the memory taken up by the grid
+import sys
+
+# support type hinting in editor and code
+from typing import Dict, Generator, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+# the graph this grid behaves like
+from graph import Graph
+
+# graph node
+from graph_node import Node
+
+T = TypeVar("T")
+
+
+class GridGraph(Graph[T]):
+    """A graph of `sizeX` by `sizeY` cells, where each cell can only ever connect to the cells to its north, east, south and west.
+    The cell at `(x, y)` is the node at index `y * sizeX + x`, just like a graph made with `Graph.createGraph`.
+
+    Rather than storing a node object and a list of connections for each cell, a grid graph stores which of each cell's four
+    walls are up in 4 bits of a single byte, and works out the neighbours from the cell's index. A 4000x4000 maze takes up
+    16 MB. Only cells that have some data set take up any more.
+
+    It has the same traversal, link and query methods as `Graph`.
+
+    Make a 3x2 grid and carve a maze into it:
+    >>> grid = GridGraph[str](3, 2)
+    >>> grid.addLinkBetween(0, 1)
+    >>> grid.addLinkBetween(1, 2)
+    >>> grid.addLinkBetween(2, 5)
+    >>> grid.addLinkBetween(5, 4)
+    >>> grid.addLinkBetween(4, 3)
+    >>> grid.setNodeData(0, 'Entrance')
+    >>> grid.setNodeData(3, 'Exit')
+    >>> grid
+    ['Entrance -> [1]', 'None -> [2, 0]', 'None -> [5, 1]', 'Exit -> [4]', 'None -> [5, 3]', 'None -> [2, 4]']
+    >>> grid.shortestPath(0, 3).path
+    [0, 1, 2, 5, 4, 3]
+    >>> [cell for cell in grid.breadthFirstTraversal()]
+    ['Entrance', 'Exit']
+
+    Cells that aren't next to each other can't be connected:
+    >>> grid.addLinkBetween(0, 4)
+    Traceback (most recent call last):
+    ...
+    ValueError: Nodes 0 and 4 are not next to each other in the grid.
+    """
+
+    # the bits of a cell's walls. A bit that is set means that wall is up.
+    NORTH = 1
+    EAST = 2
+    SOUTH = 4
+    WEST = 8
+    # all four walls up
+    ALL_WALLS = NORTH | EAST | SOUTH | WEST
+
+    sizeX: int  # the X size of the grid
+    sizeY: int  # the Y size of the grid
+    __walls: bytearray  # which of each cell's walls are up
+    __data: Dict[int, T]  # the data of the cells that have any
+    # for each combination of walls, the index offsets of the neighbours that can be reached through the open walls
+    __offsetsByWalls: List[Tuple[int, ...]]
+    # whether the walls and the cells' data are shared with a snapshot, and so have to be copied before they're changed
+    __wallsShared: bool
+    __dataShared: bool
+
+    def __init__(self, sizeX: int, sizeY: int) -> None:
+        """Constructor for a grid graph with every wall of every cell up, i.e. no connections at all.
+
+        Args:
+            sizeX (int): The X size of the grid.
+            sizeY (int): The Y size of the grid.
+
+        Raises:
+            ValueError: A size is negative.
+
+        >>> grid = GridGraph[None](4000, 4000)
+        >>> len(grid)
+        16000000
+        >>> grid.memoryUsage() < 17_000_000
+        True
+        """
+        super().__init__()
+
+        if (sizeX < 0) or (sizeY < 0):
+            raise ValueError(f"Invalid size `({sizeX}, {sizeY})` given.")
+
+        self.sizeX = sizeX
+        self.sizeY = sizeY
+        self.__walls = bytearray([GridGraph.ALL_WALLS]) * (sizeX * sizeY)
+        self.__data = {}
+        self.__wallsShared = False
+        self.__dataShared = False
+
+        # work out which neighbours each combination of walls leaves reachable, once,
+        # so that finding a cell's neighbours is just a lookup
+        self.__offsetsByWalls = []
+        for walls in range(GridGraph.ALL_WALLS + 1):
+            offsets: List[int] = []
+            for direction, offset in (
+                (GridGraph.NORTH, -sizeX),
+                (GridGraph.EAST, 1),
+                (GridGraph.SOUTH, sizeX),
+                (GridGraph.WEST, -1),
+            ):
+                if not (walls & direction):
+                    offsets.append(offset)
+            self.__offsetsByWalls.append(tuple(offsets))
+
+    def __iter__(self) -> Generator[Node[T], None, None]:
+        """Make this class iterable
+
+        Yields:
+            Generator[Node[T], None, None]: A fresh node object for each cell, in index order.
+        """
+        for index in range(len(self)):
+            yield Node[T](self._dataAt(index), list(self._neighbours(index)))
+
+    def __len__(self) -> int:
+        return len(self.__walls)
+
+    def _neighbours(self, index: int) -> Sequence[int]:
+        return [
+            index + offset for offset in self.__offsetsByWalls[self.__walls[index]]
+        ]
+
+    def _neighbourWeights(self, index: int) -> Optional[Sequence[float]]:
+        # every step between cells costs the same
+        return None
+
+    def _dataAt(self, index: int) -> Optional[T]:
+        return self.__data.get(index)
+
+    @staticmethod
+    def createGraph(sizeX: int, sizeY: int) -> "GridGraph[T]":
+        """Creates a grid graph of the specified X and Y size.
+
+        Args:
+            sizeX (int): the desired X size of the graph.
+            sizeY (int): the desired Y size of the graph.
+
+        Returns:
+            GridGraph[T]: The (empty) grid graph object (of the given size).
+
+        >>> graph = GridGraph.createGraph(2, 2)
+        >>> [i for i in map(str, graph)]
+        ['None -> []', 'None -> []', 'None -> []', 'None -> []']
+        """
+        return GridGraph[T](sizeX, sizeY)
+
+    def indexOf(self, x: int, y: int) -> int:
+        """Get the index of the cell at `(x, y)`.
+
+        Args:
+            x (int): The X coordinate of the cell.
+            y (int): The Y coordinate of the cell.
+
+        Raises:
+            IndexError: The coordinates are outside the grid.
+
+        Returns:
+            int: The index of the cell.
+
+        >>> GridGraph[None](3, 2).indexOf(1, 1)
+        4
+        """
+        if not ((self.sizeX > x >= 0) and (self.sizeY > y >= 0)):
+            raise IndexError(f"Cell at `({x}, {y})` is outside the grid.")
+        return y * self.sizeX + x
+
+    def coordinatesOf(self, index: int) -> Tuple[int, int]:
+        """Get the `(x, y)` coordinates of the cell at `index`.
+
+        Args:
+            index (int): The index of the cell.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            Tuple[int, int]: The coordinates of the cell.
+
+        >>> GridGraph[None](3, 2).coordinatesOf(4)
+        (1, 1)
+        """
+        self.__checkIndexIsValidWithException(index)
+        return (index % self.sizeX, index // self.sizeX)
+
+    def getWalls(self, index: int) -> int:
+        """Get which walls of a cell are up, as a combination of `NORTH`, `EAST`, `SOUTH` and `WEST`.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            int: The cell's walls.
+
+        >>> grid = GridGraph[None](2, 1)
+        >>> grid.addLinkBetween(0, 1)
+        >>> grid.getWalls(0) == GridGraph.NORTH | GridGraph.SOUTH | GridGraph.WEST
+        True
+        """
+        self.__checkIndexIsValidWithException(index)
+        return self.__walls[index]
+
+    def setWalls(self, walls: bytearray) -> None:
+        """Replace the walls of every cell at once, e.g. with a whole maze carved elsewhere.
+
+        Args:
+            walls (bytearray): One byte per cell, in index order, each a combination of `NORTH`, `EAST`, `SOUTH` and `WEST`.
+            The walls around the outside of the grid must be up.
+
+        Raises:
+            ValueError: There isn't one byte per cell, a byte isn't a combination of walls, or an outside wall is down.
+
+        >>> grid = GridGraph[None](2, 1)
+        >>> grid.setWalls(bytearray([GridGraph.ALL_WALLS & ~GridGraph.EAST, GridGraph.ALL_WALLS & ~GridGraph.WEST]))
+        >>> grid
+        ['None -> [1]', 'None -> [0]']
+
+        >>> grid.setWalls(bytearray([GridGraph.ALL_WALLS & ~GridGraph.NORTH, GridGraph.ALL_WALLS]))
+        Traceback (most recent call last):
+        ...
+        ValueError: The walls around the outside of the grid must be up.
+        """
+        self._checkCanChange()
+        if len(walls) != len(self):
+            raise ValueError("There must be exactly one set of walls for every cell.")
+        if len(walls) == 0:
+            # nothing to check
+            return
+        if max(walls) > GridGraph.ALL_WALLS:
+            raise ValueError(
+                "Each cell's walls must be a combination of `NORTH`, `EAST`, `SOUTH` and `WEST`."
+            )
+
+        # check each edge of the grid: the top and bottom rows, and the left and right columns
+        for edge, direction in (
+            (walls[: self.sizeX], GridGraph.NORTH),
+            (walls[len(walls) - self.sizeX :], GridGraph.SOUTH),
+            (walls[:: self.sizeX], GridGraph.WEST),
+            (walls[self.sizeX - 1 :: self.sizeX], GridGraph.EAST),
+        ):
+            if not all(cell & direction for cell in edge):
+                raise ValueError("The walls around the outside of the grid must be up.")
+
+        self.__walls = bytearray(walls)
+        self.__wallsShared = False
+        self._structureChanged()
+
+    def _setDataAt(self, index: int, newValue: Optional[T]) -> None:
+        if newValue is None:
+            # cells without data don't take up any space
+            self.__editableData().pop(index, None)
+        else:
+            self.__editableData()[index] = newValue
+
+    def setNodesFromNodesList(self, nodes: list[Node[T]]) -> None:
+        """Set a grid's cells from a list of nodes, one for every cell.
+
+        Args:
+            nodes (list[Node[T]]): The list of nodes from which to set the grid's data and walls.
+
+        Raises:
+            ValueError: There isn't one node per cell, or a node connects to a cell that isn't next to it.
+
+        >>> grid = GridGraph[None](2, 2)
+        >>> grid.setNodesFromNodesList([Node(None, [1]), Node(None, [0, 3]), Node(None, []), Node(None, [1])])
+        >>> grid
+        ['None -> [1]', 'None -> [3, 0]', 'None -> []', 'None -> [1]']
+        """
+        self.setNodesFromValuesAndConnections(
+            [node.data for node in nodes],  # type: ignore
+            [node.connections for node in nodes],
+        )
+
+    def setNodesFromValuesAndConnections(
+        self,
+        values: list[T],
+        connectionsPointers: list[list[int]],
+        compact: bool = False,
+    ) -> None:
+        """Set a grid's cells from the data and connections of every cell.
+
+        Args:
+            values (list[T]): the value of each cell.
+            connectionsPointers (list[list[int]]): the connections that each cell has.
+            compact (bool, optional): Ignored, as a grid graph is always stored compactly. Defaults to False.
+
+        Raises:
+            ValueError: There isn't one value and one list of connections per cell, or a cell connects to a cell that isn't next to it.
+
+        >>> GridGraph[None](2, 2).setNodesFromValuesAndConnections([None] * 4, [[3], [], [], []])
+        Traceback (most recent call last):
+        ...
+        ValueError: Nodes 0 and 3 are not next to each other in the grid.
+        """
+        self._checkCanChange()
+        if (len(values) != len(self)) or (len(connectionsPointers) != len(self)):
+            raise ValueError(
+                "There must be exactly one value and one list of connections for every cell."
+            )
+
+        # work out all the walls first so that nothing changes if any of the connections are invalid
+        walls = bytearray([GridGraph.ALL_WALLS]) * len(self)
+        for index, connections in enumerate(connectionsPointers):
+            for connectionIndex in connections:
+                walls[index] &= ~self.__directionBetween(index, connectionIndex)
+
+        self.__walls = walls
+        self.__data = {}
+        self.__wallsShared = self.__dataShared = False
+        self._structureChanged()
+        for index, value in enumerate(values):
+            self.setNodeData(index, value)
+
+    def connectionExistsFrom(self, indexA: int, indexB: int) -> bool:
+        if not self._exists(indexA):
+            raise IndexError("Node at index {} is nonexistent.".format(str(indexA)))
+        return indexB in self._neighbours(indexA % len(self))
+
+    def isCompact(self) -> bool:
+        """A grid graph's cells are always stored compactly.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def compact(self) -> None:
+        """Does nothing, as a grid graph's cells are always stored compactly."""
+        return
+
+    def memoryUsage(self) -> int:
+        """Estimate the number of bytes the grid's structure takes up, not counting the cells' data themselves.
+
+        Returns:
+            int: The estimated number of bytes.
+        """
+        return sys.getsizeof(self.__walls) + sys.getsizeof(self.__data)
+
+    def _exists(self, nodePointer: int) -> bool:
+        return len(self) > nodePointer >= -len(self)
+
+    def snapshot(self) -> "GridGraph[T]":
+        """Take a snapshot of the grid as it is now, which can be searched and traversed for as long as needed while the
+        grid itself carries on being changed.
+
+        Taking a snapshot takes constant time. The grid copies its walls (one byte per cell) the first time it adds or
+        removes a link after a snapshot is taken, and its cells' data the first time it sets some.
+
+        Returns:
+            GridGraph[T]: The snapshot, which can't be changed.
+
+        >>> grid = GridGraph[str](2, 1)
+        >>> frozen = grid.snapshot()
+        >>> grid.addLinkBetween(0, 1)
+        >>> grid.setNodeData(1, 'Exit')
+        >>> frozen
+        ['None -> []', 'None -> []']
+        >>> frozen.setNodeData(0, 'Entrance')
+        Traceback (most recent call last):
+        ...
+        ValueError: A snapshot of a graph can't be changed.
+        """
+        snapshot = super().snapshot()
+        if snapshot is not self:
+            self.__wallsShared = True
+            self.__dataShared = True
+        return snapshot  # type: ignore
+
+    def __editableWalls(self) -> bytearray:
+        """Get the walls to change, copying them first if they're shared with a snapshot.
+
+        Raises:
+            ValueError: The grid is a snapshot.
+
+        Returns:
+            bytearray: The walls of each cell.
+        """
+        self._checkCanChange()
+        if self.__wallsShared:
+            self.__walls = bytearray(self.__walls)
+            self.__wallsShared = False
+        return self.__walls
+
+    def __editableData(self) -> Dict[int, T]:
+        """Get the cells' data to change, copying it first if it's shared with a snapshot.
+
+        Raises:
+            ValueError: The grid is a snapshot.
+
+        Returns:
+            Dict[int, T]: The data of the cells that have any.
+        """
+        self._checkCanChange()
+        if self.__dataShared:
+            self.__data = dict(self.__data)
+            self.__dataShared = False
+        return self.__data
+
+    def __checkIndexIsValidWithException(self, index: int) -> bool:
+        if not (len(self) > index >= 0):
+            raise IndexError("Node at index {} is out of range.".format(str(index)))
+        return True
+
+    def __directionBetween(self, indexFrom: int, indexTo: int) -> int:
+        """Get the wall of the cell at `indexFrom` that lies between it and the cell at `indexTo`.
+
+        Args:
+            indexFrom (int): The index of the `from` cell.
+            indexTo (int): The index of the `to` cell.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The cells aren't next to each other.
+
+        Returns:
+            int: The wall, one of `NORTH`, `EAST`, `SOUTH` or `WEST`.
+        """
+        self.__checkIndexIsValidWithException(indexFrom)
+        self.__checkIndexIsValidWithException(indexTo)
+
+        difference = indexTo - indexFrom
+        if difference == -self.sizeX:
+            return GridGraph.NORTH
+        if difference == self.sizeX:
+            return GridGraph.SOUTH
+        # cells either side of each other must also be on the same row
+        if (difference == 1) and (indexTo % self.sizeX != 0):
+            return GridGraph.EAST
+        if (difference == -1) and (indexFrom % self.sizeX != 0):
+            return GridGraph.WEST
+
+        raise ValueError(
+            f"Nodes {indexFrom} and {indexTo} are not next to each other in the grid."
+        )
+
+    def removeLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = True,
+    ) -> None:
+        """Removes a link between two cells, by putting the wall between them back up.
+
+        Args:
+            indexFrom (int): The `from` cell to disconnect from the `to`
+            indexTo (int): The `to` cell
+            bidirectional (bool, optional): Whether or not to remove the link both ways. Defaults to True.
+
+        >>> grid = GridGraph[None](2, 1)
+        >>> grid.addLinkBetween(0, 1)
+        >>> grid.removeLinkBetween(0, 1)
+        >>> grid.removeLinkBetween(0, 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: Node index 1 already does not exist in node at index 0's connections.
+        """
+        direction = self.__directionBetween(indexFrom, indexTo)
+
+        if self.__walls[indexFrom] & direction:
+            # the wall is already up
+            raise ValueError(
+                f"Node index {indexTo} already does not exist in node at index {indexFrom}'s connections.",
+            )
+        self.__editableWalls()[indexFrom] |= direction
+        self._structureChanged()
+
+        # if bidirectional, flip indexTo and indexFrom and do it again
+        if bidirectional:
+            self.removeLinkBetween(indexTo, indexFrom, False)
+
+    def addLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = True,
+        weight: Optional[float] = None,
+    ) -> None:
+        """Add a link between two cells next to each other, by taking down the wall between them.
+
+        Args:
+            indexFrom (int): the 'from' cell to connect to the 'to'
+            indexTo (int): the 'to' cell
+            bidirectional (bool, optional): Whether or not to connect the link both ways (i.e., `indexFrom` to `indexTo` and vice versa.). Defaults to True.
+            weight (Optional[float], optional): Must be None, as every step between cells costs 1. Defaults to None.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The cells are already connected, they aren't next to each other, or a weight was given.
+
+        >>> grid = GridGraph[None](2, 2)
+        >>> grid.addLinkBetween(0, 2, bidirectional=False)
+        >>> grid.connectionExistsFrom(0, 2), grid.connectionExistsFrom(2, 0)
+        (True, False)
+        >>> grid.addLinkBetween(0, 2)
+        Traceback (most recent call last):
+        ...
+        ValueError: Node index '2' already exists in node 0's connections.
+        >>> grid.addLinkBetween(0, 7)
+        Traceback (most recent call last):
+        ...
+        IndexError: Node at index 7 is out of range.
+        """
+        if weight is not None:
+            raise ValueError("A grid graph's links can't have weights.")
+        direction = self.__directionBetween(indexFrom, indexTo)
+
+        if not (self.__walls[indexFrom] & direction):
+            # the wall is already down
+            raise ValueError(
+                "Node index '{}' already exists in node {}'s connections.".format(
+                    str(indexTo), str(indexFrom)
+                )
+            )
+        self.__editableWalls()[indexFrom] &= ~direction
+        self._linksAdded([(indexFrom, indexTo)])
+
+        if bidirectional:
+            # do it again, the other way
+            self.addLinkBetween(indexTo, indexFrom, False)
+
+    def addLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = True,
+        weights: Optional[Iterable[float]] = None,
+    ) -> None:
+        """Add many links at once, by taking down the walls between each pair of cells.
+        Nothing is changed unless every link is valid.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of cell indices to link.
+            bidirectional (bool, optional): Whether or not to also link each `to` cell back to its `from` cell. Defaults to True.
+            weights (Optional[Iterable[float]], optional): Must be None, as every step between cells costs 1. Defaults to None.
+
+        Raises:
+            IndexError: An edge refers to a cell index that is out of range.
+            ValueError: A link already exists or appears more than once, its cells aren't next to each other, or weights were given.
+
+        >>> grid = GridGraph[None](2, 2)
+        >>> grid.addLinks([(0, 1), (1, 3)])
+        >>> grid
+        ['None -> [1]', 'None -> [3, 0]', 'None -> []', 'None -> [1]']
+        >>> grid.addLinks([(2, 3), (3, 1)])
+        Traceback (most recent call last):
+        ...
+        ValueError: Node index '1' already exists in node 3's connections.
+        >>> grid.connectionExistsFrom(2, 3)
+        False
+        """
+        if weights is not None:
+            raise ValueError("A grid graph's links can't have weights.")
+        edges = list(edges)
+        self.__setChangedWalls(self.__wallsChangedBy(edges, bidirectional, True))
+        self._linksAdded(edges)
+
+    def removeLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = True,
+    ) -> None:
+        """Remove many links at once, by putting the walls between each pair of cells back up.
+        Nothing is changed unless every link exists.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of cell indices to unlink.
+            bidirectional (bool, optional): Whether or not to also remove the link from each `to` cell back to its `from` cell. Defaults to True.
+
+        Raises:
+            IndexError: An edge refers to a cell index that is out of range.
+            ValueError: A link doesn't exist or appears more than once, or its cells aren't next to each other.
+
+        >>> grid = GridGraph[None](2, 1)
+        >>> grid.addLinks([(0, 1)])
+        >>> grid.removeLinks([(1, 0)])
+        >>> grid
+        ['None -> []', 'None -> []']
+        """
+        self.__setChangedWalls(self.__wallsChangedBy(edges, bidirectional, False))
+        self._structureChanged()
+
+    def __wallsChangedBy(
+        self, edges: Iterable[Tuple[int, int]], bidirectional: bool, adding: bool
+    ) -> Dict[int, int]:
+        """Work out the walls after taking down or putting up the wall for each of some links, without changing the grid's.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of cell indices.
+            bidirectional (bool): Whether to also change the wall from each `to` cell back to its `from` cell.
+            adding (bool): Whether the links are being added (walls taken down) rather than removed (walls put up).
+
+        Raises:
+            IndexError: An edge refers to a cell index that is out of range.
+            ValueError: A link is already in the state it's being changed to, or its cells aren't next to each other.
+
+        Returns:
+            Dict[int, int]: The new walls of each cell whose walls change.
+        """
+        walls: Dict[int, int] = {}
+        for indexFrom, indexTo in edges:
+            for fromIndex, toIndex in (
+                ((indexFrom, indexTo), (indexTo, indexFrom))
+                if bidirectional
+                else ((indexFrom, indexTo),)
+            ):
+                direction = self.__directionBetween(fromIndex, toIndex)
+                if fromIndex not in walls:
+                    walls[fromIndex] = self.__walls[fromIndex]
+                if adding:
+                    if not (walls[fromIndex] & direction):
+                        raise ValueError(
+                            "Node index '{}' already exists in node {}'s connections.".format(
+                                str(toIndex), str(fromIndex)
+                            )
+                        )
+                    walls[fromIndex] &= ~direction
+                else:
+                    if walls[fromIndex] & direction:
+                        raise ValueError(
+                            f"Node index {toIndex} already does not exist in node at index {fromIndex}'s connections.",
+                        )
+                    walls[fromIndex] |= direction
+        return walls
+
+    def __setChangedWalls(self, walls: Dict[int, int]) -> None:
+        """Set the walls of some cells.
+
+        Args:
+            walls (Dict[int, int]): The new walls of each cell whose walls change.
+        """
+        editableWalls = self.__editableWalls()
+        for index, cellWalls in walls.items():
+            editableWalls[index] = cellWalls
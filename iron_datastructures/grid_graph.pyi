@@ -0,0 +1,54 @@
+from graph import Graph as Graph
+from graph_node import Node as Node
+from typing import Generator, Iterable, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class GridGraph(Graph[T]):
+    NORTH: int
+    EAST: int
+    SOUTH: int
+    WEST: int
+    ALL_WALLS: int
+    sizeX: int
+    sizeY: int
+    def __init__(self, sizeX: int, sizeY: int) -> None: ...
+    def __iter__(self) -> Generator[Node[T], None, None]: ...
+    def __len__(self) -> int: ...
+    @staticmethod
+    def createGraph(sizeX: int, sizeY: int) -> GridGraph[T]: ...
+    def indexOf(self, x: int, y: int) -> int: ...
+    def coordinatesOf(self, index: int) -> Tuple[int, int]: ...
+    def getWalls(self, index: int) -> int: ...
+    def setWalls(self, walls: bytearray) -> None: ...
+    def setNodesFromNodesList(self, nodes: list[Node[T]]) -> None: ...
+    def setNodesFromValuesAndConnections(
+        self,
+        values: list[T],
+        connectionsPointers: list[list[int]],
+        compact: bool = ...,
+    ) -> None: ...
+    def connectionExistsFrom(self, indexA: int, indexB: int) -> bool: ...
+    def isCompact(self) -> bool: ...
+    def compact(self) -> None: ...
+    def memoryUsage(self) -> int: ...
+    def snapshot(self) -> GridGraph[T]: ...
+    def removeLinkBetween(
+        self, indexFrom: int, indexTo: int, bidirectional: bool = ...
+    ) -> None: ...
+    def addLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = ...,
+        weight: Optional[float] = ...,
+    ) -> None: ...
+    def addLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = ...,
+        weights: Optional[Iterable[float]] = ...,
+    ) -> None: ...
+    def removeLinks(
+        self, edges: Iterable[Tuple[int, int]], bidirectional: bool = ...
+    ) -> None: ...
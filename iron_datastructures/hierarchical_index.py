@@ -0,0 +1,581 @@
+#!python3.9
+
+# priority queue and infinite costs for searching the abstract graph
+import heapq
+import math
+
+# flat arrays for the predecessors found by searches within a cluster
+from array import array
+
+# support type hinting in editor and code
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# the graph being indexed, and the results of searching it
+from graph import Graph
+from indexed_heap import IndexedHeap
+from path_result import PathResult
+
+
+class HierarchicalIndex:
+    """A hierarchical pathfinding (HPA*) index of a grid graph, where the cell at `(x, y)` is the node at index
+    `y * sizeX + x`, like a graph made with `Graph.createGraph` or a `GridGraph`.
+
+    The grid is split into square clusters of `clusterSize` by `clusterSize` cells. Every cell with a connection across
+    a cluster's border is an entrance, and the cheapest cost between each pair of entrances of the same cluster, without
+    leaving it, is worked out in advance. Together with the connections across the borders, these make a small abstract
+    graph of just the entrances. A query searches the abstract graph, then works out the cells along the path only in
+    the clusters the path goes through.
+
+    Every connection across a border is an entrance of its own, rather than runs of them being merged into one, so the
+    paths found are the cheapest there are, not just nearly so.
+
+    Changing the graph's connections through the index's own `addLinkBetween` and `removeLinkBetween` updates only the
+    clusters either side of the change. Changing them any other way leaves the index out of date.
+
+    Index a 4x4 grid, in clusters of 2x2 cells, with a wall down the middle that has a gap at the bottom:
+    >>> grid = Graph[None].createGraph(4, 4)
+    >>> for y in range(4):
+    ...     for x in range(3):
+    ...         if (x != 1) or (y == 3):
+    ...             grid.addLinkBetween(y * 4 + x, y * 4 + x + 1)
+    >>> for y in range(3):
+    ...     for x in range(4):
+    ...         grid.addLinkBetween(y * 4 + x, (y + 1) * 4 + x)
+    >>> index = HierarchicalIndex(grid, 4, clusterSize=2)
+    >>> index.shortestPath(0, 3).path
+    [0, 1, 5, 9, 13, 14, 15, 11, 7, 3]
+
+    Open up the wall at the top, and the index catches up straight away:
+    >>> index.addLinkBetween(1, 2)
+    >>> index.shortestPath(0, 3).path
+    [0, 1, 2, 3]
+    """
+
+    sizeX: int  # the X size of the grid
+    sizeY: int  # the Y size of the grid
+    clusterSize: int  # the X and Y size of each cluster
+    __graph: Graph[Any]  # the grid being indexed
+    __version: int  # the graph's version when the index was last brought up to date
+    __clustersX: int  # the number of clusters across the grid
+    __weighted: bool  # whether any connection costs anything but 1
+    __heuristicScale: float  # the lowest cost per cell of Manhattan distance of any connection, for the A* heuristic
+    __entrances: List[Set[int]]  # the entrances of each cluster
+    __crossings: Dict[int, int]  # the number of connections across a border each entrance has, in either direction
+    __inter: Dict[int, Dict[int, float]]  # the cost of the connections across borders, from each entrance
+    __intra: Dict[int, Dict[int, float]]  # the cheapest cost from each entrance to the others of its cluster
+
+    def __init__(self, graph: Graph[Any], sizeX: int, clusterSize: int = 16) -> None:
+        """Constructor for a hierarchical index. Finds every cluster's entrances, and the costs between them.
+
+        Args:
+            graph (Graph[Any]): The grid graph to index.
+            sizeX (int): The X size of the grid.
+            clusterSize (int, optional): The X and Y size of each cluster. Bigger clusters make a smaller abstract graph,
+            but more cells to search within each cluster. Defaults to 16.
+
+        Raises:
+            ValueError: The graph isn't a whole number of rows of `sizeX` cells, or the cluster size isn't positive.
+        """
+        if (sizeX <= 0) or (len(graph) % sizeX != 0):
+            raise ValueError(f"The graph must be a grid of {sizeX} cells across.")
+        if clusterSize < 1:
+            raise ValueError(f"Invalid cluster size `{clusterSize}` given.")
+
+        self.sizeX = sizeX
+        self.sizeY = len(graph) // sizeX
+        self.clusterSize = clusterSize
+        self.__graph = graph
+        self.__version = graph.getVersion()
+        self.__clustersX = -(-sizeX // clusterSize)
+        clustersY = -(-self.sizeY // clusterSize)
+        self.__weighted = False
+        self.__heuristicScale = math.inf
+        self.__entrances = [set() for _ in range(self.__clustersX * clustersY)]
+        self.__crossings = {}
+        self.__inter = {}
+        self.__intra = {}
+
+        # find every connection across a border
+        for index in range(len(graph)):
+            cluster = self.clusterOf(index)
+            for position, neighbour in enumerate(graph._neighbours(index)):
+                cost = self.__costOf(index, position)
+                self.__noteCost(index, neighbour, cost)
+                if self.clusterOf(neighbour) != cluster:
+                    self.__addCrossing(index, neighbour, cost)
+        if self.__heuristicScale == math.inf:
+            # there aren't any connections yet
+            self.__heuristicScale = 1
+
+        for cluster in range(len(self.__entrances)):
+            self.__linkEntrances(cluster)
+
+    def clusterOf(self, index: int) -> int:
+        """Get the cluster a cell is in. Clusters are numbered row by row, like cells.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            int: The number of its cluster.
+        """
+        x, y = index % self.sizeX, index // self.sizeX
+        return (y // self.clusterSize) * self.__clustersX + (x // self.clusterSize)
+
+    def entrancesOf(self, cluster: int) -> List[int]:
+        """Get the entrances of a cluster: its cells that have a connection to or from another cluster.
+
+        Args:
+            cluster (int): The number of the cluster.
+
+        Raises:
+            IndexError: The cluster is out of range.
+
+        Returns:
+            List[int]: The indices of its entrances, in order.
+        """
+        if not (len(self.__entrances) > cluster >= 0):
+            raise IndexError(f"Cluster {cluster} is out of range.")
+        return sorted(self.__entrances[cluster])
+
+    def shortestPath(self, indexFrom: int, indexTo: int) -> PathResult:
+        """Find the cheapest path from one cell to another, by A* search of the abstract graph of entrances.
+
+        Args:
+            indexFrom (int): The index of the cell to start from.
+            indexTo (int): The index of the cell to find a path to.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The graph has been changed other than through the index.
+
+        Returns:
+            PathResult: The path, its cost, and the number of entrances expanded to find it. If there's no path, the path
+            is empty.
+        """
+        self.__checkIsUpToDate()
+        for index in (indexFrom, indexTo):
+            if not (len(self.__graph) > index >= 0):
+                raise IndexError(f"Node at index {index} is out of range.")
+        if indexFrom == indexTo:
+            return PathResult([indexFrom], 0, 0)
+
+        clusterFrom = self.clusterOf(indexFrom)
+        clusterTo = self.clusterOf(indexTo)
+        # the cheapest ways from the start to the entrances of its cluster, and to the destination from the entrances of
+        # its cluster, without leaving them
+        startCosts, startPredecessors = self.__searchCluster(indexFrom, False)
+        goalCosts, goalSuccessors = self.__searchCluster(indexTo, True)
+
+        # A* over the entrances, from the start to the destination. The start and destination are in the search as
+        # START and GOAL, as they are only entrances if they happen to be.
+        START, GOAL = -1, -2
+        costs: Dict[int, float] = {}
+        predecessors: Dict[int, int] = {}
+        toExpand: List[Tuple[float, float, int]] = []
+
+        def reach(index: int, cost: float, predecessor: int) -> None:
+            if cost < costs.get(index, math.inf):
+                costs[index] = cost
+                predecessors[index] = predecessor
+                estimate = 0 if index == GOAL else self.__estimate(index, indexTo)
+                # between equally promising entrances, expand the one furthest along first
+                heapq.heappush(toExpand, (cost + estimate, -cost, index))
+
+        if clusterFrom == clusterTo:
+            # the destination might be cheapest to get to without leaving the cluster
+            reach(GOAL, startCosts[self.__localIndexOf(indexTo)], START)
+        for entrance in self.__entrances[clusterFrom]:
+            reach(entrance, startCosts[self.__localIndexOf(entrance)], START)
+
+        nodesExpanded = 0
+        while len(toExpand) > 0:
+            _, negativeCost, currentIndex = heapq.heappop(toExpand)
+            cost = -negativeCost
+            if cost > costs[currentIndex]:
+                # it's been reached more cheaply since this was pushed
+                continue
+            if currentIndex == GOAL:
+                break
+            nodesExpanded += 1
+
+            if self.clusterOf(currentIndex) == clusterTo:
+                goalCost = goalCosts[self.__localIndexOf(currentIndex)]
+                reach(GOAL, cost + goalCost, currentIndex)
+            for neighbours in (self.__intra, self.__inter):
+                for neighbour, step in neighbours.get(currentIndex, {}).items():
+                    reach(neighbour, cost + step, currentIndex)
+
+        if GOAL not in costs:
+            return PathResult([], math.inf, nodesExpanded)
+
+        # the entrances along the way...
+        entrances: List[int] = []
+        currentIndex = predecessors[GOAL]
+        while currentIndex != START:
+            entrances.append(currentIndex)
+            currentIndex = predecessors[currentIndex]
+        entrances.reverse()
+
+        # ...and the cells in between them
+        if len(entrances) == 0:
+            path = self.__pathWithin(startPredecessors, indexFrom, indexTo)
+        else:
+            path = self.__pathWithin(startPredecessors, indexFrom, entrances[0])
+            for position in range(1, len(entrances)):
+                indexA, indexB = entrances[position - 1], entrances[position]
+                if self.clusterOf(indexA) != self.clusterOf(indexB):
+                    # straight across the border
+                    path.append(indexB)
+                else:
+                    _, predecessorsA = self.__searchCluster(indexA, False, indexB)
+                    path.extend(self.__pathWithin(predecessorsA, indexA, indexB)[1:])
+            towardsGoal = self.__pathWithin(goalSuccessors, indexTo, entrances[-1])
+            path.extend(reversed(towardsGoal[:-1]))
+
+        return PathResult(path, costs[GOAL], nodesExpanded)
+
+    def addLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = True,
+        weight: Optional[float] = None,
+    ) -> None:
+        """Add a link between two cells of the graph with its own `addLinkBetween`, and update the clusters either side.
+
+        Args:
+            indexFrom (int): the 'from' cell to connect to the 'to'
+            indexTo (int): the 'to' cell
+            bidirectional (bool, optional): Whether or not to connect the link both ways. Defaults to True.
+            weight (Optional[float], optional): The cost of the link. Defaults to None, meaning 1.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The link already exists, or the graph has been changed other than through the index.
+        """
+        self.__checkIsUpToDate()
+        self.__graph.addLinkBetween(indexFrom, indexTo, bidirectional, weight)
+
+        links = [(indexFrom, indexTo)]
+        if bidirectional:
+            links.append((indexTo, indexFrom))
+        for linkFrom, linkTo in links:
+            cost = self.__graph.getWeight(linkFrom, linkTo)
+            self.__noteCost(linkFrom, linkTo, cost)
+            if self.clusterOf(linkFrom) != self.clusterOf(linkTo):
+                self.__addCrossing(linkFrom, linkTo, cost)
+        self.__relinkClustersOf(indexFrom, indexTo)
+
+    def removeLinkBetween(
+        self, indexFrom: int, indexTo: int, bidirectional: bool = True
+    ) -> None:
+        """Remove a link between two cells of the graph with its own `removeLinkBetween`, and update the clusters either side.
+
+        Args:
+            indexFrom (int): the 'from' cell to disconnect from the 'to'
+            indexTo (int): the 'to' cell
+            bidirectional (bool, optional): Whether or not to remove the link both ways. Defaults to True.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The link doesn't exist, or the graph has been changed other than through the index.
+        """
+        self.__checkIsUpToDate()
+        self.__graph.removeLinkBetween(indexFrom, indexTo, bidirectional)
+
+        links = [(indexFrom, indexTo)]
+        if bidirectional:
+            links.append((indexTo, indexFrom))
+        for linkFrom, linkTo in links:
+            if self.clusterOf(linkFrom) != self.clusterOf(linkTo):
+                self.__removeCrossing(linkFrom, linkTo)
+        self.__relinkClustersOf(indexFrom, indexTo)
+
+    def __checkIsUpToDate(self) -> None:
+        """Check the graph hasn't been changed other than through the index.
+
+        Raises:
+            ValueError: It has, so the index is out of date.
+        """
+        if self.__graph.getVersion() != self.__version:
+            raise ValueError("The graph has changed since it was indexed.")
+
+    def __relinkClustersOf(self, indexA: int, indexB: int) -> None:
+        """Work out the costs between the entrances of the clusters of two cells again, after a link between them changed.
+
+        Args:
+            indexA (int): The index of one cell.
+            indexB (int): The index of the other.
+        """
+        for cluster in {self.clusterOf(indexA), self.clusterOf(indexB)}:
+            self.__linkEntrances(cluster)
+        self.__version = self.__graph.getVersion()
+
+    def __costOf(self, index: int, position: int) -> float:
+        """Get the cost of one of a cell's connections.
+
+        Args:
+            index (int): The index of the cell.
+            position (int): The position of the connection in its connections.
+
+        Returns:
+            float: The connection's cost, or 1 if it wasn't given one.
+        """
+        weights = self.__graph._neighbourWeights(index)
+        return 1 if weights is None else weights[position]
+
+    def __noteCost(self, indexFrom: int, indexTo: int, cost: float) -> None:
+        """Take note of the cost of a connection, to keep the A* heuristic from ever overestimating.
+
+        Args:
+            indexFrom (int): The index of the cell the connection is from.
+            indexTo (int): The index of the cell the connection is to.
+            cost (float): The connection's cost.
+        """
+        if cost != 1:
+            self.__weighted = True
+        distance = self.__manhattanDistance(indexFrom, indexTo)
+        if distance > 0:
+            self.__heuristicScale = min(self.__heuristicScale, cost / distance)
+
+    def __manhattanDistance(self, indexA: int, indexB: int) -> int:
+        """Get the Manhattan distance between two cells."""
+        return abs(indexA % self.sizeX - indexB % self.sizeX) + abs(
+            indexA // self.sizeX - indexB // self.sizeX
+        )
+
+    def __estimate(self, index: int, indexTo: int) -> float:
+        """Estimate the cost from a cell to the destination, without ever overestimating it."""
+        return self.__heuristicScale * self.__manhattanDistance(index, indexTo)
+
+    def __addCrossing(self, indexFrom: int, indexTo: int, cost: float) -> None:
+        """Add a connection across a border to the abstract graph, making both its cells entrances.
+
+        Args:
+            indexFrom (int): The index of the cell the connection is from.
+            indexTo (int): The index of the cell the connection is to, in another cluster.
+            cost (float): The connection's cost.
+        """
+        self.__inter.setdefault(indexFrom, {})[indexTo] = cost
+        for index in (indexFrom, indexTo):
+            self.__crossings[index] = self.__crossings.get(index, 0) + 1
+            self.__entrances[self.clusterOf(index)].add(index)
+
+    def __removeCrossing(self, indexFrom: int, indexTo: int) -> None:
+        """Remove a connection across a border from the abstract graph, and any entrances it was the last crossing of.
+
+        Args:
+            indexFrom (int): The index of the cell the connection was from.
+            indexTo (int): The index of the cell the connection was to, in another cluster.
+        """
+        del self.__inter[indexFrom][indexTo]
+        if len(self.__inter[indexFrom]) == 0:
+            del self.__inter[indexFrom]
+        for index in (indexFrom, indexTo):
+            self.__crossings[index] -= 1
+            if self.__crossings[index] == 0:
+                # it isn't an entrance any more
+                del self.__crossings[index]
+                self.__entrances[self.clusterOf(index)].discard(index)
+                self.__intra.pop(index, None)
+
+    def __linkEntrances(self, cluster: int) -> None:
+        """Work out the cheapest cost from each entrance of a cluster to each other, without leaving the cluster.
+
+        Args:
+            cluster (int): The number of the cluster.
+        """
+        localIndices = {
+            entrance: self.__localIndexOf(entrance)
+            for entrance in self.__entrances[cluster]
+        }
+        links = self.__clusterLinks(cluster, False)
+        for entrance, localIndex in localIndices.items():
+            costs, _ = self.__searchLinks(links.__getitem__, len(links), localIndex)
+            self.__intra[entrance] = {
+                other: costs[otherLocalIndex]
+                for other, otherLocalIndex in localIndices.items()
+                if (other != entrance) and (costs[otherLocalIndex] < math.inf)
+            }
+
+    def __clusterBounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        """Get where a cluster is, and its size, which is smaller than `clusterSize` at the right and bottom edges.
+
+        Args:
+            cluster (int): The number of the cluster.
+
+        Returns:
+            Tuple[int, int, int, int]: The X and Y of its top left cell, and its X and Y size.
+        """
+        x = (cluster % self.__clustersX) * self.clusterSize
+        y = (cluster // self.__clustersX) * self.clusterSize
+        sizeX = min(self.clusterSize, self.sizeX - x)
+        sizeY = min(self.clusterSize, self.sizeY - y)
+        return x, y, sizeX, sizeY
+
+    def __localIndexOf(self, index: int) -> int:
+        """Get a cell's index within its cluster, counting row by row from the cluster's top left cell."""
+        x, y = index % self.sizeX, index // self.sizeX
+        clusterX = x - x % self.clusterSize
+        sizeX = min(self.clusterSize, self.sizeX - clusterX)
+        return (y % self.clusterSize) * sizeX + (x - clusterX)
+
+    def __linksWithin(self, cluster: int) -> Callable[[int], List[Tuple[int, float]]]:
+        """Get a way of looking up the connections within a cluster, between the cells' indices within it.
+
+        Args:
+            cluster (int): The number of the cluster.
+
+        Returns:
+            Callable[[int], List[Tuple[int, float]]]: Gets the cells within the cluster that a cell of it is connected to,
+            and what each connection costs.
+        """
+        graph = self.__graph
+        gridSizeX = self.sizeX
+        clusterX, clusterY, sizeX, sizeY = self.__clusterBounds(cluster)
+
+        def linksFrom(localIndex: int) -> List[Tuple[int, float]]:
+            y, x = divmod(localIndex, sizeX)
+            index = (clusterY + y) * gridSizeX + (clusterX + x)
+            weights = graph._neighbourWeights(index)
+            links = []
+            for position, neighbour in enumerate(graph._neighbours(index)):
+                x = neighbour % gridSizeX - clusterX
+                y = neighbour // gridSizeX - clusterY
+                if (sizeX > x >= 0) and (sizeY > y >= 0):
+                    cost = 1 if weights is None else weights[position]
+                    links.append((y * sizeX + x, cost))
+            return links
+
+        return linksFrom
+
+    def __clusterLinks(
+        self, cluster: int, reverse: bool
+    ) -> List[List[Tuple[int, float]]]:
+        """Get all the connections within a cluster at once, between the cells' indices within it.
+
+        Args:
+            cluster (int): The number of the cluster.
+            reverse (bool): Whether to turn each connection around, for searching backwards from a cell.
+
+        Returns:
+            List[List[Tuple[int, float]]]: For each cell of the cluster, the cells within it that it's connected to (or
+            from, if reversed) and what each connection costs.
+        """
+        _, _, sizeX, sizeY = self.__clusterBounds(cluster)
+        linksFrom = self.__linksWithin(cluster)
+        links = [linksFrom(localIndex) for localIndex in range(sizeX * sizeY)]
+        if not reverse:
+            return links
+
+        reversedLinks: List[List[Tuple[int, float]]] = [[] for _ in links]
+        for localIndex, cellLinks in enumerate(links):
+            for neighbour, cost in cellLinks:
+                reversedLinks[neighbour].append((localIndex, cost))
+        return reversedLinks
+
+    def __searchCluster(
+        self, index: int, reverse: bool, indexTo: Optional[int] = None
+    ) -> Tuple[List[float], "array[int]"]:
+        """Find the cheapest cost from a cell to the other cells of its cluster (or to it, if reversed), without leaving it.
+
+        Args:
+            index (int): The index of the cell.
+            reverse (bool): Whether to search backwards, for the costs to the cell rather than from it.
+            indexTo (Optional[int], optional): The index of a cell of the same cluster to stop at, once the cheapest way
+            to it is found. Defaults to None, meaning search the whole cluster.
+
+        Returns:
+            Tuple[List[float], array[int]]: See `__searchLinks`.
+        """
+        cluster = self.clusterOf(index)
+        _, _, sizeX, sizeY = self.__clusterBounds(cluster)
+        if reverse:
+            links = self.__clusterLinks(cluster, True).__getitem__
+        else:
+            # look the connections up as they're needed, as the search might not need them all
+            links = self.__linksWithin(cluster)
+        return self.__searchLinks(
+            links,
+            sizeX * sizeY,
+            self.__localIndexOf(index),
+            -1 if indexTo is None else self.__localIndexOf(indexTo),
+        )
+
+    def __searchLinks(
+        self,
+        links: Callable[[int], List[Tuple[int, float]]],
+        size: int,
+        source: int,
+        target: int = -1,
+    ) -> Tuple[List[float], "array[int]"]:
+        """Find the cheapest cost from a cell to every other cell of a cluster, with Dijkstra's algorithm, or with a
+        breadth-first search if every connection costs 1.
+
+        Args:
+            links (Callable[[int], List[Tuple[int, float]]]): Gets the connections of a cell of the cluster, and their costs.
+            size (int): The number of cells in the cluster.
+            source (int): The index within the cluster of the cell to search from.
+            target (int, optional): The index within the cluster of a cell to stop at, once the cheapest way to it is
+            found. Defaults to -1, meaning search the whole cluster.
+
+        Returns:
+            Tuple[List[float], array[int]]: The cheapest cost to each cell of the cluster (infinity if it can't be reached),
+            and the cell the cheapest way to each comes from (-1 for the source and the cells that can't be reached), by
+            their indices within the cluster.
+        """
+        costs = [math.inf] * size
+        predecessors = array("i", [-1]) * size
+        costs[source] = 0
+
+        if not self.__weighted:
+            frontier = [source]
+            level = 0
+            while (len(frontier) > 0) and ((target < 0) or (costs[target] == math.inf)):
+                level += 1
+                nextFrontier = []
+                for currentIndex in frontier:
+                    for neighbour, _ in links(currentIndex):
+                        if costs[neighbour] == math.inf:
+                            costs[neighbour] = level
+                            predecessors[neighbour] = currentIndex
+                            nextFrontier.append(neighbour)
+                frontier = nextFrontier
+            return costs, predecessors
+
+        toExpand = IndexedHeap(size)
+        toExpand.push(source, 0)
+        while len(toExpand) > 0:
+            currentIndex, cost = toExpand.pop()
+            if currentIndex == target:
+                break
+            for neighbour, step in links(currentIndex):
+                if cost + step < costs[neighbour]:
+                    costs[neighbour] = cost + step
+                    predecessors[neighbour] = currentIndex
+                    toExpand.push(neighbour, cost + step)
+        return costs, predecessors
+
+    def __pathWithin(
+        self, predecessors: "array[int]", indexFrom: int, indexTo: int
+    ) -> List[int]:
+        """Follow the predecessors from a search within a cluster back from one cell to the cell the search started from.
+
+        Args:
+            predecessors (array[int]): The predecessors from `__searchLinks`, by index within the cluster.
+            indexFrom (int): The index of the cell the search started from.
+            indexTo (int): The index of the cell to follow the predecessors back from, in the same cluster.
+
+        Returns:
+            List[int]: The indices of the cells from `indexFrom` to `indexTo`.
+        """
+        clusterX, clusterY, sizeX, _ = self.__clusterBounds(self.clusterOf(indexFrom))
+        path = [indexTo]
+        localIndex = self.__localIndexOf(indexTo)
+        while path[-1] != indexFrom:
+            localIndex = predecessors[localIndex]
+            y, x = divmod(localIndex, sizeX)
+            path.append((clusterY + y) * self.sizeX + (clusterX + x))
+        path.reverse()
+        return path
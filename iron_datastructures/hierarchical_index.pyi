@@ -0,0 +1,22 @@
+from graph import Graph as Graph
+from path_result import PathResult as PathResult
+from typing import Any, List, Optional
+
+class HierarchicalIndex:
+    sizeX: int
+    sizeY: int
+    clusterSize: int
+    def __init__(self, graph: Graph[Any], sizeX: int, clusterSize: int = ...) -> None: ...
+    def clusterOf(self, index: int) -> int: ...
+    def entrancesOf(self, cluster: int) -> List[int]: ...
+    def shortestPath(self, indexFrom: int, indexTo: int) -> PathResult: ...
+    def addLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = ...,
+        weight: Optional[float] = ...,
+    ) -> None: ...
+    def removeLinkBetween(
+        self, indexFrom: int, indexTo: int, bidirectional: bool = ...
+    ) -> None: ...
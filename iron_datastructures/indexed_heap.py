@@ -0,0 +1,239 @@
+#!python3.9
+
+# flat arrays for the heap and the position of each key in it
+from array import array
+
+# support type hinting in editor and code
+from typing import Any, List, Tuple
+
+
+class IndexedHeap:
+    """A binary min-heap of the keys `0` to `capacity - 1`, each with a priority, that knows where each key is in the heap.
+
+    Knowing where each key is means a key's priority can be lowered in place (decrease-key) rather than pushing the key
+    again, so the heap never holds more than one entry per key, e.g. one per node of a graph for Dijkstra's algorithm.
+    Pushing, popping and decreasing a key each take `O(log n)` time.
+
+    Priorities can be anything comparable with `<`, e.g. numbers or tuples of numbers.
+
+    >>> heap = IndexedHeap(5)
+    >>> heap.push(3, 7.0)
+    True
+    >>> heap.push(1, 4.0)
+    True
+    >>> heap.push(3, 2.5)       # lowers 3's priority
+    True
+    >>> heap.push(1, 9.0)       # isn't lower, so nothing changes
+    False
+    >>> len(heap), 3 in heap, 0 in heap
+    (2, True, False)
+    >>> heap.pop(), heap.pop()
+    ((3, 2.5), (1, 4.0))
+    """
+
+    __heap: "array[int]"  # the keys, in heap order
+    __positions: "array[int]"  # where each key is in `__heap`, or -1 if it isn't in the heap
+    __priorities: List[Any]  # the priority of each key
+
+    def __init__(self, capacity: int) -> None:
+        """Constructor for an empty indexed heap.
+
+        Args:
+            capacity (int): The number of keys, i.e. one more than the largest key.
+
+        Raises:
+            ValueError: The capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError(f"Invalid capacity `{capacity}` given.")
+
+        self.__heap = array("i")
+        self.__positions = array("i", [-1]) * capacity
+        self.__priorities = [None] * capacity
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+    def __contains__(self, key: int) -> bool:
+        return self.__positions[key] != -1
+
+    def push(self, key: int, priority: Any) -> bool:
+        """Add a key to the heap, or lower its priority if it's already in the heap.
+
+        Args:
+            key (int): The key.
+            priority (Any): Its priority. Lower priorities are popped first.
+
+        Raises:
+            IndexError: The key is out of range.
+
+        Returns:
+            bool: Whether anything changed, i.e. the key was added or its priority was lowered.
+        """
+        if not (len(self.__positions) > key >= 0):
+            raise IndexError(f"Key {key} is out of range.")
+
+        position = self.__positions[key]
+        if position == -1:
+            # add it to the bottom of the heap...
+            self.__heap.append(key)
+            position = len(self.__heap) - 1
+            self.__positions[key] = position
+        elif not (priority < self.__priorities[key]):
+            # it's already in the heap with the same or a lower priority
+            return False
+
+        # ...and sift it up to where it belongs
+        self.__priorities[key] = priority
+        self.__siftUp(position)
+        return True
+
+    def decreaseKey(self, key: int, priority: Any) -> None:
+        """Lower the priority of a key that is in the heap.
+
+        Args:
+            key (int): The key.
+            priority (Any): Its new priority.
+
+        Raises:
+            IndexError: The key is out of range.
+            ValueError: The key isn't in the heap, or the new priority isn't lower.
+
+        >>> heap = IndexedHeap(2)
+        >>> heap.decreaseKey(0, 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: Key 0 is not in the heap.
+        """
+        if not (len(self.__positions) > key >= 0):
+            raise IndexError(f"Key {key} is out of range.")
+        if self.__positions[key] == -1:
+            raise ValueError(f"Key {key} is not in the heap.")
+        if not (priority < self.__priorities[key]):
+            raise ValueError(
+                f"The new priority of key {key} must be lower than its current priority."
+            )
+
+        self.__priorities[key] = priority
+        self.__siftUp(self.__positions[key])
+
+    def peek(self) -> Tuple[int, Any]:
+        """Get the key with the lowest priority, without removing it.
+
+        Raises:
+            IndexError: The heap is empty.
+
+        Returns:
+            Tuple[int, Any]: The key and its priority.
+        """
+        if len(self.__heap) == 0:
+            raise IndexError("The heap is empty.")
+        key = self.__heap[0]
+        return key, self.__priorities[key]
+
+    def pop(self) -> Tuple[int, Any]:
+        """Remove the key with the lowest priority.
+
+        Raises:
+            IndexError: The heap is empty.
+
+        Returns:
+            Tuple[int, Any]: The key and its priority.
+
+        >>> IndexedHeap(1).pop()
+        Traceback (most recent call last):
+        ...
+        IndexError: The heap is empty.
+        """
+        if len(self.__heap) == 0:
+            raise IndexError("The heap is empty.")
+
+        heap = self.__heap
+        top = heap[0]
+        # move the bottom of the heap to the top and sift it down to where it belongs
+        last = heap.pop()
+        self.__positions[top] = -1
+        if len(heap) > 0:
+            heap[0] = last
+            self.__positions[last] = 0
+            self.__siftDown(0)
+
+        priority = self.__priorities[top]
+        self.__priorities[top] = None
+        return top, priority
+
+    def priorityOf(self, key: int) -> Any:
+        """Get the priority of a key that is in the heap.
+
+        Args:
+            key (int): The key.
+
+        Raises:
+            ValueError: The key isn't in the heap.
+
+        Returns:
+            Any: Its priority.
+        """
+        if key not in self:
+            raise ValueError(f"Key {key} is not in the heap.")
+        return self.__priorities[key]
+
+    def __siftUp(self, position: int) -> None:
+        """Move the key at a position up the heap until its parent's priority isn't higher.
+
+        Args:
+            position (int): The position of the key in the heap.
+        """
+        heap = self.__heap
+        positions = self.__positions
+        priorities = self.__priorities
+        key = heap[position]
+        priority = priorities[key]
+
+        while position > 0:
+            parentPosition = (position - 1) >> 1
+            parent = heap[parentPosition]
+            if not (priority < priorities[parent]):
+                break
+            # move the parent down into the hole
+            heap[position] = parent
+            positions[parent] = position
+            position = parentPosition
+
+        heap[position] = key
+        positions[key] = position
+
+    def __siftDown(self, position: int) -> None:
+        """Move the key at a position down to where it belongs in the heap.
+
+        Like `heapq`, this moves the hole all the way down to the bottom along the path of lower-priority children, then
+        sifts the key back up from there. The key usually belongs near the bottom, so this makes about half as many
+        comparisons as stopping as soon as neither child's priority is lower.
+
+        Args:
+            position (int): The position of the key in the heap.
+        """
+        heap = self.__heap
+        positions = self.__positions
+        priorities = self.__priorities
+        size = len(heap)
+        key = heap[position]
+
+        childPosition = 2 * position + 1
+        while childPosition < size:
+            # pick the child with the lower priority
+            rightPosition = childPosition + 1
+            if (rightPosition < size) and (
+                priorities[heap[rightPosition]] < priorities[heap[childPosition]]
+            ):
+                childPosition = rightPosition
+            # move the child up into the hole
+            child = heap[childPosition]
+            heap[position] = child
+            positions[child] = position
+            position = childPosition
+            childPosition = 2 * position + 1
+
+        heap[position] = key
+        positions[key] = position
+        self.__siftUp(position)
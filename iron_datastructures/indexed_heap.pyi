@@ -0,0 +1,11 @@
+from typing import Any, Tuple
+
+class IndexedHeap:
+    def __init__(self, capacity: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, key: int) -> bool: ...
+    def push(self, key: int, priority: Any) -> bool: ...
+    def decreaseKey(self, key: int, priority: Any) -> None: ...
+    def peek(self) -> Tuple[int, Any]: ...
+    def pop(self) -> Tuple[int, Any]: ...
+    def priorityOf(self, key: int) -> Any: ...
@@ -0,0 +1,477 @@
+#!python3.9
+
+# seedable random numbers, so the same seed always picks the same landmarks
+import random
+
+# infinite distances, for the nodes that can't be reached
+import math
+
+# packing the file header, checking the machine's byte order, and fingerprinting the graph
+import struct
+import sys
+import zlib
+
+# flat arrays for the landmarks and their distance tables
+from array import array
+
+# support type hinting in editor and code
+from typing import Any, Callable, List, Optional, Sequence
+
+# the graph the distances are worked out on
+from graph import Graph
+
+
+class LandmarkOracle:
+    """A table of the distances from and to a few landmark nodes of a graph, worked out once, that gives instant bounds
+    on the distance between any two nodes: the ALT (A*, landmarks and the triangle inequality) technique.
+
+    For any landmark `L`, the triangle inequality means the distance from `u` to `v` is at least
+    `distance(L, v) - distance(L, u)` and at least `distance(u, L) - distance(v, L)`, and at most
+    `distance(u, L) + distance(L, v)`. The lower bound never overestimates, so it is a heuristic for `Graph.aStar` that
+    works on any graph, not just grids.
+
+    Distances are numbers of connections, in `int32` arrays, unless the graph's connections have weights, in which case
+    they are costs, in `float64` arrays. Connections are one-way, so the distances are worked out both from and to each
+    landmark.
+
+    The table is only right for as long as the graph doesn't change. Save it with `save`, and `load` it back for the same
+    graph to skip working it out again.
+
+    Bound the distances across a corridor, with a landmark at one end:
+    >>> corridor = Graph[None].createGraphFromEdges(5, [(0, 1), (1, 2), (2, 3), (3, 4)], bidirectional=True)
+    >>> oracle = LandmarkOracle(corridor, 1, seed=1)
+    >>> list(oracle.landmarks)
+    [4]
+    >>> oracle.lowerBound(1, 3), oracle.upperBound(1, 3)
+    (2, 4)
+
+    Use the bounds as a heuristic for A*:
+    >>> corridor.aStar(4, 1, oracle.heuristic(4, 1))
+    PathResult(path=[4, 3, 2, 1], cost=3, nodesExpanded=4)
+    """
+
+    MAGIC = b"IRONLMRK"
+    VERSION = 1
+    WEIGHTED = 1  # flag: the distances are costs, in float64, rather than numbers of connections, in int32
+
+    # magic, version, flags, node count, landmark count, graph fingerprint
+    __HEADER = struct.Struct("<8sIIQQI4x")
+
+    landmarks: "array[int]"  # the indices of the landmark nodes
+    __nodeCount: int
+    __weighted: bool  # whether the distances are costs rather than numbers of connections
+    # the distance from each landmark to each node, and from each node to each landmark, landmark by landmark:
+    # `__fromLandmarks[landmark * nodeCount + index]`. -1 (or infinity, if weighted) if there's no way there
+    __fromLandmarks: "array[Any]"
+    __toLandmarks: "array[Any]"
+    __fingerprint: int  # a checksum of the graph's connections, to tell whether a table is for a graph
+    __graph: Graph[Any]  # the graph the table is for
+    __version: int  # the graph's version when the table was worked out or loaded
+
+    def __init__(
+        self, graph: Graph[Any], landmarkCount: int = 16, seed: Optional[int] = None
+    ) -> None:
+        """Constructor for a landmark oracle. Picks the landmarks and works out the distances from and to each, with two
+        breadth-first searches (or two Dijkstra searches, if the connections have weights) per landmark.
+
+        The landmarks are picked far apart: the first is the node furthest from a random node, and each next one is the
+        node furthest from all the landmarks so far. Nodes that can't be reached from any landmark so far count as
+        furthest, so every part of a disconnected graph gets a landmark if there are enough.
+
+        Args:
+            graph (Graph[Any]): The graph to work out the distances on.
+            landmarkCount (int, optional): The number of landmarks. More landmarks give tighter bounds, but take more time
+            to work out and more memory to keep: two distances per node per landmark. Defaults to 16.
+            seed (Optional[int], optional): The seed for picking the random node to start from. Defaults to None.
+
+        Raises:
+            ValueError: The landmark count is negative.
+        """
+        if landmarkCount < 0:
+            raise ValueError(f"Invalid landmark count `{landmarkCount}` given.")
+
+        nodeCount = len(graph)
+        adjacency = graph._adjacency()
+        self.__nodeCount = nodeCount
+        self.__weighted = adjacency.weights is not None
+        self.__fingerprint = self.__fingerprintOf(graph)
+        self.__graph = graph
+        self.__version = graph.getVersion()
+        self.landmarks = array("i")
+        self.__fromLandmarks = array(self.__typecode())
+        self.__toLandmarks = array(self.__typecode())
+        if nodeCount == 0:
+            return
+
+        # the graph with every connection turned around, for the distances to each landmark
+        reverseEdges = [
+            (adjacency.targets[position], index)
+            for index in range(nodeCount)
+            for position in range(adjacency.offsets[index], adjacency.offsets[index + 1])
+        ]
+        reverse = Graph[None].createGraphFromEdges(
+            nodeCount, reverseEdges, weights=adjacency.weights
+        )
+
+        # how far each node is from its nearest landmark so far
+        nearest = [math.inf] * nodeCount
+        landmark = self.__furthest(
+            self.__distancesFrom(graph, random.Random(seed).randrange(nodeCount)),
+            nearest,
+        )
+        for _ in range(min(landmarkCount, nodeCount)):
+            self.landmarks.append(landmark)
+            fromLandmark = self.__distancesFrom(graph, landmark)
+            self.__fromLandmarks.extend(fromLandmark)
+            self.__toLandmarks.extend(self.__distancesFrom(reverse, landmark))
+
+            for index in range(nodeCount):
+                distance = self.__asDistance(fromLandmark[index])
+                if distance < nearest[index]:
+                    nearest[index] = distance
+            landmark = self.__furthest(fromLandmark, nearest)
+
+    def lowerBound(self, indexFrom: int, indexTo: int) -> float:
+        """Get a lower bound on the distance from one node to another: the distance is never less than this.
+
+        Its signature fits the heuristic of `Graph.aStar`, where it never overestimates. `heuristic` gives a quicker one.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to go to.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The graph has changed since the table was worked out.
+
+        Returns:
+            float: The lower bound, which is infinity if there's certainly no way from `indexFrom` to `indexTo`.
+        """
+        self.__checkIsUpToDate()
+        self.__checkIndices(indexFrom, indexTo)
+        return self.__lowerBound(range(len(self.landmarks)), indexFrom, indexTo)
+
+    def upperBound(self, indexFrom: int, indexTo: int) -> float:
+        """Get an upper bound on the distance from one node to another: the distance is never more than this. It's the
+        distance of going by way of the landmark that makes the shortest detour.
+
+        Args:
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to go to.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The graph has changed since the table was worked out.
+
+        Returns:
+            float: The upper bound, which is infinity if no landmark is on a way from `indexFrom` to `indexTo`.
+        """
+        self.__checkIsUpToDate()
+        self.__checkIndices(indexFrom, indexTo)
+        if indexFrom == indexTo:
+            return 0
+
+        best = math.inf
+        nodeCount = self.__nodeCount
+        for landmark in range(len(self.landmarks)):
+            toLandmark = self.__asDistance(self.__toLandmarks[landmark * nodeCount + indexFrom])
+            fromLandmark = self.__asDistance(self.__fromLandmarks[landmark * nodeCount + indexTo])
+            best = min(best, toLandmark + fromLandmark)
+        return best
+
+    def heuristic(
+        self, indexFrom: int, indexTo: int, activeCount: int = 4
+    ) -> Callable[[int, int], float]:
+        """Get an A* heuristic for a search from one node to another, that uses only the few landmarks that bound the
+        distance between them best, rather than all of them, so each estimate is quicker.
+
+        Args:
+            indexFrom (int): The index of the node the search starts from.
+            indexTo (int): The index of the node the search goes to.
+            activeCount (int, optional): The number of landmarks to use. Defaults to 4.
+
+        Raises:
+            IndexError: Either index is out of range.
+            ValueError: The graph has changed since the table was worked out.
+
+        Returns:
+            Callable[[int, int], float]: The heuristic, for `Graph.aStar`: a lower bound on the distance from a node to
+            another, given both indices.
+        """
+        self.__checkIsUpToDate()
+        self.__checkIndices(indexFrom, indexTo)
+
+        # the landmarks that give the highest lower bounds for the whole search
+        landmarks = sorted(
+            range(len(self.landmarks)),
+            key=lambda landmark: self.__lowerBound([landmark], indexFrom, indexTo),
+            reverse=True,
+        )[:activeCount]
+
+        # everything about `indexTo` is the same for the whole search, so look it up once
+        nodeCount = self.__nodeCount
+        asDistance = self.__asDistance
+        fromLandmarks = self.__fromLandmarks
+        toLandmarks = self.__toLandmarks
+        target = indexTo
+        terms = [
+            (
+                landmark * nodeCount,
+                asDistance(fromLandmarks[landmark * nodeCount + target]),
+                asDistance(toLandmarks[landmark * nodeCount + target]),
+            )
+            for landmark in landmarks
+        ]
+
+        def heuristic(index: int, indexTo: int) -> float:
+            if indexTo != target:
+                return self.__lowerBound(landmarks, index, indexTo)
+            best = 0
+            for offset, fromLandmarkToTo, toLandmarkFromTo in terms:
+                fromLandmarkToFrom = fromLandmarks[offset + index]
+                if 0 <= fromLandmarkToFrom < math.inf:
+                    bound = fromLandmarkToTo - fromLandmarkToFrom
+                    if bound > best:
+                        best = bound
+                if toLandmarkFromTo < math.inf:
+                    toLandmarkFromFrom = asDistance(toLandmarks[offset + index])
+                    bound = toLandmarkFromFrom - toLandmarkFromTo
+                    if bound > best:
+                        best = bound
+            return best
+
+        return heuristic
+
+    def isFor(self, graph: Graph[Any]) -> bool:
+        """Check whether this table is for a graph: whether the graph's connections are the same as those of the graph it
+        was worked out for.
+
+        Args:
+            graph (Graph[Any]): The graph.
+
+        Returns:
+            bool: Whether the table is for it.
+        """
+        return (len(graph) == self.__nodeCount) and (
+            self.__fingerprintOf(graph) == self.__fingerprint
+        )
+
+    def save(self, path: str) -> None:
+        """Save the table to a file, to be loaded back with `load` rather than worked out again.
+
+        The file is laid out as a 40 byte header (the magic bytes `IRONLMRK`, the format version, some flags, the number of
+        nodes and of landmarks, and a checksum of the graph's connections), then the landmarks' indices, then the distances
+        from the landmarks and then to them, landmark by landmark, all little-endian.
+
+        Args:
+            path (str): The path of the file to write, which is replaced if it exists.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "maze.landmarks")
+        >>> maze = Graph[None].createGraphFromEdges(4, [(0, 1), (1, 2), (2, 3)], bidirectional=True)
+        >>> LandmarkOracle(maze, 2).save(path)
+        >>> LandmarkOracle.load(path, maze).upperBound(0, 3)
+        3
+        >>> LandmarkOracle.load(path, Graph[None].createGraphFromEdges(4, [(0, 1)]))
+        Traceback (most recent call last):
+        ...
+        ValueError: This landmark file is for a different graph.
+        """
+        flags = LandmarkOracle.WEIGHTED if self.__weighted else 0
+        with open(path, "wb") as file:
+            file.write(
+                LandmarkOracle.__HEADER.pack(
+                    LandmarkOracle.MAGIC,
+                    LandmarkOracle.VERSION,
+                    flags,
+                    self.__nodeCount,
+                    len(self.landmarks),
+                    self.__fingerprint,
+                )
+            )
+            for table in (self.landmarks, self.__fromLandmarks, self.__toLandmarks):
+                file.write(self.__littleEndian(table))
+
+    @staticmethod
+    def load(path: str, graph: Graph[Any]) -> "LandmarkOracle":
+        """Load a table saved with `save`, for the graph it was saved for.
+
+        Args:
+            path (str): The path of the file to read.
+            graph (Graph[Any]): The graph the table is for.
+
+        Raises:
+            ValueError: The file isn't a landmark file, is from a newer version of the format, is cut short, or is for a
+            different graph.
+
+        Returns:
+            LandmarkOracle: The table.
+        """
+        with open(path, "rb") as file:
+            buffer = file.read()
+
+        header = LandmarkOracle.__HEADER
+        if len(buffer) < header.size:
+            raise ValueError("This is not a landmark file.")
+        magic, version, flags, nodeCount, landmarkCount, fingerprint = header.unpack_from(
+            buffer
+        )
+        if magic != LandmarkOracle.MAGIC:
+            raise ValueError("This is not a landmark file.")
+        if version > LandmarkOracle.VERSION:
+            raise ValueError(
+                f"This landmark file is version {version}, but only up to version {LandmarkOracle.VERSION} can be read."
+            )
+
+        oracle = LandmarkOracle.__new__(LandmarkOracle)
+        oracle.__nodeCount = nodeCount
+        oracle.__weighted = bool(flags & LandmarkOracle.WEIGHTED)
+        oracle.__fingerprint = fingerprint
+        if not oracle.isFor(graph):
+            raise ValueError("This landmark file is for a different graph.")
+        oracle.__graph = graph
+        oracle.__version = graph.getVersion()
+
+        # read the landmarks and the two tables out of the file, one after the other
+        start = header.size
+        tables = []
+        for typecode, size in (
+            ("i", landmarkCount),
+            (oracle.__typecode(), landmarkCount * nodeCount),
+            (oracle.__typecode(), landmarkCount * nodeCount),
+        ):
+            table = array(typecode)
+            end = start + size * table.itemsize
+            if len(buffer) < end:
+                raise ValueError("This landmark file is cut short.")
+            table.frombytes(buffer[start:end])
+            if sys.byteorder != "little":
+                table.byteswap()
+            tables.append(table)
+            start = end
+        oracle.landmarks, oracle.__fromLandmarks, oracle.__toLandmarks = tables
+        return oracle
+
+    def __lowerBound(self, landmarks: Sequence[int], indexFrom: int, indexTo: int) -> float:
+        """Get the best lower bound on the distance from one node to another that some of the landmarks give.
+
+        Args:
+            landmarks (Sequence[int]): The positions in `landmarks` of the landmarks to use.
+            indexFrom (int): The index of the node to start from.
+            indexTo (int): The index of the node to go to.
+
+        Returns:
+            float: The lower bound.
+        """
+        nodeCount = self.__nodeCount
+        asDistance = self.__asDistance
+        best = 0
+        for landmark in landmarks:
+            offset = landmark * nodeCount
+            fromLandmarkToFrom = asDistance(self.__fromLandmarks[offset + indexFrom])
+            fromLandmarkToTo = asDistance(self.__fromLandmarks[offset + indexTo])
+            toLandmarkFromFrom = asDistance(self.__toLandmarks[offset + indexFrom])
+            toLandmarkFromTo = asDistance(self.__toLandmarks[offset + indexTo])
+
+            if (fromLandmarkToFrom < math.inf) and (fromLandmarkToTo == math.inf):
+                # the landmark can get to `indexFrom` but not `indexTo`, so `indexFrom` can't get to `indexTo` either
+                return math.inf
+            if (toLandmarkFromTo < math.inf) and (toLandmarkFromFrom == math.inf):
+                # `indexTo` can get to the landmark but `indexFrom` can't, so `indexFrom` can't get to `indexTo` either
+                return math.inf
+            if fromLandmarkToFrom < math.inf:
+                best = max(best, fromLandmarkToTo - fromLandmarkToFrom)
+            if toLandmarkFromTo < math.inf:
+                best = max(best, toLandmarkFromFrom - toLandmarkFromTo)
+        return best
+
+    def __checkIsUpToDate(self) -> None:
+        """Check the graph hasn't changed since the table was worked out or loaded.
+
+        Raises:
+            ValueError: It has, so the table is out of date.
+        """
+        if self.__graph.getVersion() != self.__version:
+            raise ValueError("The graph has changed since its landmarks were worked out.")
+
+    def __checkIndices(self, *indices: int) -> None:
+        """Check some node indices are in range.
+
+        Raises:
+            IndexError: An index is out of range.
+        """
+        for index in indices:
+            if not (self.__nodeCount > index >= 0):
+                raise IndexError(f"Node at index {index} is out of range.")
+
+    def __typecode(self) -> str:
+        """Get the typecode of the distance tables: `"d"` for costs, or `"i"` for numbers of connections."""
+        return "d" if self.__weighted else "i"
+
+    @staticmethod
+    def __asDistance(distance: float) -> float:
+        """Turn a distance out of a table into a number, with infinity for -1, which is how the `int32` tables mark nodes
+        that can't be reached."""
+        return math.inf if distance < 0 else distance
+
+    def __distancesFrom(self, graph: Graph[Any], index: int) -> "array[Any]":
+        """Get the distance from a node to every other node of a graph.
+
+        Args:
+            graph (Graph[Any]): The graph.
+            index (int): The index of the node.
+
+        Returns:
+            array[Any]: The distances, in the typecode of the tables.
+        """
+        if self.__weighted:
+            return graph.dijkstraDistances(index)[0]
+        return graph.breadthFirstDistances(index)[0]
+
+    def __furthest(self, distances: "array[Any]", nearest: List[float]) -> int:
+        """Pick the node that is furthest from everywhere: the one furthest from its nearest landmark so far, or if there
+        are no landmarks yet, the one furthest from the node the distances are from.
+
+        Args:
+            distances (array[Any]): The distances from a node, in the typecode of the tables.
+            nearest (List[float]): The distance of each node from its nearest landmark so far.
+
+        Returns:
+            int: The index of the node.
+        """
+        asDistance = self.__asDistance
+        return max(
+            range(self.__nodeCount),
+            key=lambda index: min(nearest[index], asDistance(distances[index])),
+        )
+
+    @staticmethod
+    def __littleEndian(table: "array[Any]") -> bytes:
+        """Get the bytes of an array in little-endian order, whatever this machine's byte order is."""
+        if sys.byteorder != "little":
+            table = array(table.typecode, table)
+            table.byteswap()
+        return table.tobytes()
+
+    @staticmethod
+    def __fingerprintOf(graph: Graph[Any]) -> int:
+        """Get a checksum of a graph's connections, to tell whether a table is for it.
+
+        Args:
+            graph (Graph[Any]): The graph.
+
+        Returns:
+            int: The CRC-32 of its CSR offsets, targets and weights.
+        """
+        adjacency = graph._adjacency()
+        fingerprint = 0
+        for values, typecode in (
+            (adjacency.offsets, "q"),
+            (adjacency.targets, "i"),
+            (adjacency.weights, "d"),
+        ):
+            if values is not None:
+                fingerprint = zlib.crc32(
+                    LandmarkOracle.__littleEndian(array(typecode, values)), fingerprint
+                )
+        return fingerprint
@@ -0,0 +1,17 @@
+from array import array
+from graph import Graph as Graph
+from typing import Any, Callable, Optional
+
+class LandmarkOracle:
+    MAGIC: bytes
+    VERSION: int
+    WEIGHTED: int
+    landmarks: array[int]
+    def __init__(self, graph: Graph[Any], landmarkCount: int = ..., seed: Optional[int] = ...) -> None: ...
+    def lowerBound(self, indexFrom: int, indexTo: int) -> float: ...
+    def upperBound(self, indexFrom: int, indexTo: int) -> float: ...
+    def heuristic(self, indexFrom: int, indexTo: int, activeCount: int = ...) -> Callable[[int, int], float]: ...
+    def isFor(self, graph: Graph[Any]) -> bool: ...
+    def save(self, path: str) -> None: ...
+    @staticmethod
+    def load(path: str, graph: Graph[Any]) -> LandmarkOracle: ...
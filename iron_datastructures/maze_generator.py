@@ -0,0 +1,332 @@
+#!python3.9
+
+# seedable random numbers, so the same seed always carves the same maze
+import random
+
+# running the carving to completion without looping over it in Python
+from collections import deque
+
+# support type hinting in editor and code
+from typing import Iterator, List, Optional, Tuple, TypeVar
+
+# the graphs that mazes are carved into
+from graph import Graph
+from graph_node import Node
+from grid_graph import GridGraph
+
+# keeping track of which cells are connected, for Kruskal's algorithm
+from disjoint_set import DisjointSet
+
+# the algorithm to carve with
+from _maze_algorithm import MazeAlgorithm
+
+T = TypeVar("T")
+
+
+class MazeGenerator:
+    """Carves perfect mazes – mazes with exactly one path between any two cells – into grids of `sizeX` by `sizeY` cells.
+    The cell at `(x, y)` is the node at index `y * sizeX + x`, just like a graph made with `Graph.createGraph`.
+
+    Rather than adding each passage with `addLinkBetween`, the whole maze is carved into a buffer of walls and then written
+    into the graph in one go.
+
+    Generate a maze, and check there's exactly one path between every pair of cells (a connected graph with one fewer
+    connection than cells):
+    >>> maze = MazeGenerator(8, 6, seed=42).generate(MazeAlgorithm.kruskal)
+    >>> len(maze)
+    48
+    >>> sum(len(node.connections) for node in maze) // 2
+    47
+    >>> len(maze.shortestPath(0, 47).path) > 0
+    True
+
+    The same seed always gives the same maze:
+    >>> str(MazeGenerator(8, 6, seed=42).generate(MazeAlgorithm.kruskal)) == str(maze)
+    True
+    """
+
+    sizeX: int  # the X size of the grid
+    sizeY: int  # the Y size of the grid
+    __random: random.Random  # the source of randomness for this generator
+
+    def __init__(self, sizeX: int, sizeY: int, seed: Optional[int] = None) -> None:
+        """Constructor for a maze generator.
+
+        Args:
+            sizeX (int): The X size of the mazes to generate.
+            sizeY (int): The Y size of the mazes to generate.
+            seed (Optional[int], optional): The seed for the random numbers. Defaults to None, meaning a different maze each time.
+
+        Raises:
+            ValueError: A size is negative.
+        """
+        if (sizeX < 0) or (sizeY < 0):
+            raise ValueError(f"Invalid size `({sizeX}, {sizeY})` given.")
+
+        self.sizeX = sizeX
+        self.sizeY = sizeY
+        self.__random = random.Random(seed)
+
+    def carve(
+        self, algorithm: MazeAlgorithm = MazeAlgorithm.recursiveBacktracker
+    ) -> Iterator[Tuple[int, int]]:
+        """Stream the passages of a new maze as they are carved. Useful for animating the carving.
+
+        Args:
+            algorithm (MazeAlgorithm, optional): The algorithm to carve with. Defaults to `MazeAlgorithm.recursiveBacktracker`.
+
+        Raises:
+            Exception: Invalid MazeAlgorithm given
+
+        Yields:
+            Iterator[Tuple[int, int]]: The `(from, to)` indices of the cells either side of each passage, in the order they are carved.
+
+        >>> list(MazeGenerator(2, 2, seed=1).carve(MazeAlgorithm.recursiveBacktracker))
+        [(1, 0), (0, 2), (2, 3)]
+
+        >>> list(MazeGenerator(2, 2).carve("hula hoops"))
+        Traceback (most recent call last):
+            ...
+        Exception: Maze algorithm must be 'recursiveBacktracker', 'kruskal' or 'wilson'
+        """
+        # the walls are carved into a scratch buffer that nobody looks at
+        walls = bytearray([GridGraph.ALL_WALLS]) * (self.sizeX * self.sizeY)
+        yield from self.__carveInto(walls, algorithm)
+
+    def generate(
+        self,
+        algorithm: MazeAlgorithm = MazeAlgorithm.recursiveBacktracker,
+        graph: Optional[Graph[T]] = None,
+    ) -> Graph[T]:
+        """Generate a new maze.
+
+        Args:
+            algorithm (MazeAlgorithm, optional): The algorithm to carve with. Defaults to `MazeAlgorithm.recursiveBacktracker`.
+            graph (Optional[Graph[T]], optional): The graph to carve the maze into, replacing its connections but keeping its
+            nodes' data. It must have one node per cell. Defaults to None, meaning a new `GridGraph`.
+
+        Raises:
+            ValueError: `graph` is the wrong size.
+
+        Returns:
+            Graph[T]: The graph with the maze carved into it.
+
+        Carving a maze into a graph made with `Graph.createGraph`:
+        >>> graph = Graph[str].createGraph(3, 3)
+        >>> graph.setNodeData(0, 'Entrance')
+        >>> maze = MazeGenerator(3, 3, seed=7).generate(MazeAlgorithm.wilson, graph)
+        >>> maze is graph, graph[0]
+        (True, 'Entrance')
+        >>> sum(len(node.connections) for node in graph) // 2
+        8
+        """
+        walls = bytearray([GridGraph.ALL_WALLS]) * (self.sizeX * self.sizeY)
+        # carve the whole maze, letting `deque` throw away the passages without a Python loop
+        deque(self.__carveInto(walls, algorithm), maxlen=0)
+
+        if isinstance(graph, GridGraph):
+            if (graph.sizeX != self.sizeX) or (graph.sizeY != self.sizeY):
+                raise ValueError("The grid must be the same size as the maze.")
+            graph.setWalls(walls)
+            return graph
+
+        grid = GridGraph[T](self.sizeX, self.sizeY)
+        grid.setWalls(walls)
+        if graph is None:
+            return grid
+
+        if len(graph) != len(grid):
+            raise ValueError("The graph must have exactly one node for every cell.")
+        # swap each node for one with the same data and the maze's connections
+        graph.setNodesFromNodesList(
+            [
+                Node(node.data, list(grid._neighbours(index)))
+                for index, node in enumerate(graph)
+            ]
+        )
+        return graph
+
+    def __carveInto(
+        self, walls: bytearray, algorithm: MazeAlgorithm
+    ) -> Iterator[Tuple[int, int]]:
+        """Carve a maze into a buffer of walls, one byte per cell, with all the walls up to start with.
+
+        Args:
+            walls (bytearray): The walls to take down the maze's passages from.
+            algorithm (MazeAlgorithm): The algorithm to carve with.
+
+        Raises:
+            Exception: Invalid MazeAlgorithm given
+
+        Returns:
+            Iterator[Tuple[int, int]]: The passages, in the order they are carved.
+        """
+        if algorithm == MazeAlgorithm.recursiveBacktracker:
+            return self.__recursiveBacktracker(walls)
+        elif algorithm == MazeAlgorithm.kruskal:
+            return self.__kruskal(walls)
+        elif algorithm == MazeAlgorithm.wilson:
+            return self.__wilson(walls)
+        else:
+            raise Exception(
+                "Maze algorithm must be 'recursiveBacktracker', 'kruskal' or 'wilson'"
+            )
+
+    def __directions(self) -> List[Tuple[int, int, int]]:
+        """Get each direction from a cell to its neighbours: north, east, south and west.
+
+        Returns:
+            List[Tuple[int, int, int]]: For each direction, the difference in index to the neighbour, the mask that takes
+            down the wall on this side, and the mask that takes down the wall on the neighbour's side.
+        """
+        return [
+            (-self.sizeX, ~GridGraph.NORTH, ~GridGraph.SOUTH),
+            (1, ~GridGraph.EAST, ~GridGraph.WEST),
+            (self.sizeX, ~GridGraph.SOUTH, ~GridGraph.NORTH),
+            (-1, ~GridGraph.WEST, ~GridGraph.EAST),
+        ]
+
+    def __recursiveBacktracker(self, walls: bytearray) -> Iterator[Tuple[int, int]]:
+        """Carve a maze by walking randomly from cell to unvisited cell, backtracking when stuck.
+        The path back is kept on an explicit stack, so this doesn't actually recurse.
+
+        Args:
+            walls (bytearray): The walls to carve into.
+
+        Yields:
+            Iterator[Tuple[int, int]]: The passages, in the order they are carved.
+        """
+        sizeX = self.sizeX
+        cellCount = sizeX * self.sizeY
+        if cellCount == 0:
+            return
+        randomFraction = self.__random.random
+        directions = self.__directions()
+
+        visited = bytearray(cellCount)
+        start = self.__random.randrange(cellCount)
+        visited[start] = True
+        # a plain list as the stack: this loop runs a couple of times per cell, so every call counts
+        path = [start]
+
+        while len(path) > 0:
+            currentIndex = path[-1]
+            x = currentIndex % sizeX
+
+            # gather the directions of the unvisited cells to the north, east, south and west
+            unvisited: List[int] = []
+            if (currentIndex >= sizeX) and not visited[currentIndex - sizeX]:
+                unvisited.append(0)
+            if (x + 1 < sizeX) and not visited[currentIndex + 1]:
+                unvisited.append(1)
+            if (currentIndex + sizeX < cellCount) and not visited[currentIndex + sizeX]:
+                unvisited.append(2)
+            if (x > 0) and not visited[currentIndex - 1]:
+                unvisited.append(3)
+
+            if len(unvisited) > 0:
+                # carve into a random one of them
+                offset, wallFrom, wallTo = directions[
+                    unvisited[int(randomFraction() * len(unvisited))]
+                ]
+                nextIndex = currentIndex + offset
+                walls[currentIndex] &= wallFrom
+                walls[nextIndex] &= wallTo
+                visited[nextIndex] = True
+                yield (currentIndex, nextIndex)
+                path.append(nextIndex)
+            else:
+                # stuck, so go back a cell
+                path.pop()
+
+    def __kruskal(self, walls: bytearray) -> Iterator[Tuple[int, int]]:
+        """Carve a maze by taking down every wall in a random order, unless the cells either side are already connected.
+
+        Args:
+            walls (bytearray): The walls to carve into.
+
+        Yields:
+            Iterator[Tuple[int, int]]: The passages, in the order they are carved.
+        """
+        sizeX = self.sizeX
+        cellCount = sizeX * self.sizeY
+
+        # every wall inside the grid, as `2 * index` for the wall east of a cell and `2 * index + 1` for the wall south of it
+        insideWalls = [
+            2 * index for index in range(cellCount) if (index + 1) % sizeX != 0
+        ]
+        insideWalls.extend(2 * index + 1 for index in range(cellCount - sizeX))
+        self.__random.shuffle(insideWalls)
+
+        # which cells are already connected to each other
+        connectedCells = DisjointSet(cellCount)
+
+        for wall in insideWalls:
+            indexFrom = wall >> 1
+            if wall & 1:
+                indexTo = indexFrom + sizeX
+            else:
+                indexTo = indexFrom + 1
+
+            if connectedCells.union(indexFrom, indexTo):
+                # they weren't connected yet, so take the wall down
+                if wall & 1:
+                    walls[indexFrom] &= ~GridGraph.SOUTH
+                    walls[indexTo] &= ~GridGraph.NORTH
+                else:
+                    walls[indexFrom] &= ~GridGraph.EAST
+                    walls[indexTo] &= ~GridGraph.WEST
+                yield (indexFrom, indexTo)
+
+    def __wilson(self, walls: bytearray) -> Iterator[Tuple[int, int]]:
+        """Carve a maze with Wilson's algorithm: from each cell not yet in the maze, walk randomly until reaching the maze,
+        then carve the walk with its loops erased. Every possible maze is equally likely.
+
+        Args:
+            walls (bytearray): The walls to carve into.
+
+        Yields:
+            Iterator[Tuple[int, int]]: The passages, in the order they are carved.
+        """
+        sizeX = self.sizeX
+        cellCount = sizeX * self.sizeY
+        if cellCount == 0:
+            return
+        randomFraction = self.__random.random
+        directions = self.__directions()
+
+        inMaze = bytearray(cellCount)
+        inMaze[self.__random.randrange(cellCount)] = True
+        # the direction that the current walk last left each cell in. Revisiting a cell overwrites this, which erases the loop.
+        nextStep = bytearray(cellCount)
+
+        for start in range(cellCount):
+            # walk randomly from `start` until reaching the maze
+            currentIndex = start
+            while not inMaze[currentIndex]:
+                x = currentIndex % sizeX
+                possibleDirections: List[int] = []
+                if currentIndex >= sizeX:
+                    possibleDirections.append(0)
+                if x + 1 < sizeX:
+                    possibleDirections.append(1)
+                if currentIndex + sizeX < cellCount:
+                    possibleDirections.append(2)
+                if x > 0:
+                    possibleDirections.append(3)
+
+                direction = possibleDirections[
+                    int(randomFraction() * len(possibleDirections))
+                ]
+                nextStep[currentIndex] = direction
+                currentIndex += directions[direction][0]
+
+            # then follow the walk again, without its loops, carving it into the maze
+            currentIndex = start
+            while not inMaze[currentIndex]:
+                inMaze[currentIndex] = True
+                offset, wallFrom, wallTo = directions[nextStep[currentIndex]]
+                walls[currentIndex] &= wallFrom
+                walls[currentIndex + offset] &= wallTo
+                yield (currentIndex, currentIndex + offset)
+                currentIndex += offset
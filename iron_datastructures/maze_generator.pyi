@@ -0,0 +1,16 @@
+from graph import Graph as Graph
+from graph_node import Node as Node
+from grid_graph import GridGraph as GridGraph
+from _maze_algorithm import MazeAlgorithm as MazeAlgorithm
+from typing import Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class MazeGenerator:
+    sizeX: int
+    sizeY: int
+    def __init__(self, sizeX: int, sizeY: int, seed: Optional[int] = ...) -> None: ...
+    def carve(self, algorithm: MazeAlgorithm = ...) -> Iterator[Tuple[int, int]]: ...
+    def generate(
+        self, algorithm: MazeAlgorithm = ..., graph: Optional[Graph[T]] = ...
+    ) -> Graph[T]: ...
@@ -0,0 +1,52 @@
+from typing import List
+
+
+class PathResult:
+    """The result of a shortest path search through a graph: the path found, how much it costs, and how much work it took to find.
+
+    A path that couldn't be found is empty and costs infinity.
+
+    >>> PathResult([0, 1, 4], 2, 3)
+    PathResult(path=[0, 1, 4], cost=2, nodesExpanded=3)
+    >>> PathResult([0, 1, 4], 2, 3).found()
+    True
+    >>> PathResult([], float("inf"), 12).found()
+    False
+    """
+
+    path: List[int]  # the indices of the nodes along the path, from the source to the destination inclusive
+    cost: float  # the total cost of the path's connections
+    nodesExpanded: int  # the number of nodes the search had to expand to find the path
+
+    def __init__(self, path: List[int], cost: float, nodesExpanded: int) -> None:
+        """Constructor for a path result.
+
+        Args:
+            path (List[int]): The indices of the nodes along the path, from the source to the destination inclusive.
+            cost (float): The total cost of the path's connections.
+            nodesExpanded (int): The number of nodes the search had to expand to find the path.
+        """
+        self.path = path
+        self.cost = cost
+        self.nodesExpanded = nodesExpanded
+
+    def __repr__(self) -> str:
+        """Return a string representation of this object
+
+        Returns:
+            str: The string representation of the object, for example:
+        ```
+        "PathResult(path=[0, 1, 4], cost=2, nodesExpanded=3)"
+        ```
+        """
+        return "PathResult(path={}, cost={}, nodesExpanded={})".format(
+            str(self.path), str(self.cost), str(self.nodesExpanded)
+        )
+
+    def found(self) -> bool:
+        """Check whether a path was found.
+
+        Returns:
+            bool: Whether there is a path.
+        """
+        return len(self.path) > 0
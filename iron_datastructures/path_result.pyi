@@ -0,0 +1,8 @@
+from typing import List
+
+class PathResult:
+    path: List[int]
+    cost: float
+    nodesExpanded: int
+    def __init__(self, path: List[int], cost: float, nodesExpanded: int) -> None: ...
+    def found(self) -> bool: ...
@@ -6,8 +6,21 @@ T = TypeVar("T")
 
 
 class Stack(Generic[T]):
-    __stack: List[Optional[T]] = list()
-    __top = -1
+    __stack: List[Optional[T]]
+    __top: int
+
+    def __init__(self) -> None:
+        """Initialize an empty stack.
+
+        Each stack gets its own list of items, so pushing onto one stack doesn't affect any other:
+        >>> firstStack = Stack[int]()
+        >>> secondStack = Stack[int]()
+        >>> firstStack.push(1)
+        >>> len(firstStack), len(secondStack)
+        (1, 0)
+        """
+        self.__stack = list()
+        self.__top = -1
 
     def pop(self) -> T:
         if not self.isEmpty():
@@ -3,6 +3,7 @@ from typing import Generic, TypeVar
 T = TypeVar("T")
 
 class Stack(Generic[T]):
+    def __init__(self) -> None: ...
     def pop(self) -> T: ...
     def peek(self) -> T: ...
     def push(self, item: T) -> None: ...
@@ -0,0 +1,409 @@
+#!python3.9
+
+# measuring the memory taken up by the view
+import sys
+
+# support type hinting in editor and code
+from typing import Dict, Generator, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+# the graph a view looks into
+from graph import Graph
+
+# graph node
+from graph_node import Node
+
+T = TypeVar("T")
+
+
+class SubgraphView(Graph[T]):
+    """A view of some of the nodes of a graph, as a graph of its own, that looks up the graph's own storage rather than
+    copying it. Only the connections between nodes in the view are followed, worked out as they're needed.
+
+    A view's nodes are numbered from 0, in the order they're given, or row by row for a rectangular region of a grid.
+    `parentIndexOf` and `viewIndexOf` convert between the view's indices and the graph's.
+
+    It has the same traversal, link and query methods as `Graph`. Changing a node's data or links through the view changes
+    the graph's, and changes made to the graph show through the view straight away.
+
+    A view of a set of nodes: the middle of a corridor, cut off from its ends:
+    >>> corridor = Graph[str].createGraphFromEdges(5, [(0, 1), (1, 2), (2, 3), (3, 4)], bidirectional=True)
+    >>> middle = SubgraphView(corridor, [3, 2, 1])
+    >>> middle
+    ['None -> [1]', 'None -> [2, 0]', 'None -> [1]']
+    >>> middle.shortestPath(0, 2).path
+    [0, 1, 2]
+    >>> middle.parentIndexOf(2), middle.viewIndexOf(0)
+    (1, -1)
+
+    Changes go both ways:
+    >>> middle.setNodeData(1, 'Middle')
+    >>> corridor[2]
+    'Middle'
+    >>> corridor.removeLinkBetween(2, 3)
+    >>> middle.components()
+    [[0], [1, 2]]
+    """
+
+    __parent: Graph[T]  # the graph the view looks into
+    # the graph's indices of the nodes in the view, for a view of a set of nodes, and the view's index of each of them,
+    # worked out the first time it's needed
+    __indices: Optional[Sequence[int]]
+    __viewIndices: Optional[Dict[int, int]]
+    # the rectangle of the grid the view covers, for a view of a region
+    __sizeX: int
+    __x: int
+    __y: int
+    __width: int
+    __height: int
+
+    def __init__(self, parent: Graph[T], indices: Sequence[int]) -> None:
+        """Constructor for a view of a set of a graph's nodes. This takes constant time: `indices` isn't copied, and the
+        view's index of each node is only worked out the first time a node's connections are looked up.
+
+        Args:
+            parent (Graph[T]): The graph to look into.
+            indices (Sequence[int]): The graph's indices of the nodes in the view, in the order the view numbers them, each
+            only once. It must not change while the view is in use.
+        """
+        super().__init__()
+
+        self.__parent = parent
+        self.__indices = indices
+        self.__viewIndices = None
+        self.__sizeX = self.__x = self.__y = self.__width = self.__height = 0
+
+    @staticmethod
+    def region(
+        parent: Graph[T], sizeX: int, x: int, y: int, width: int, height: int
+    ) -> "SubgraphView[T]":
+        """Make a view of a rectangular region of a grid: a graph whose node at `(x, y)` is at index `y * sizeX + x`, like a
+        `GridGraph` or a graph made with `Graph.createGraph`. This takes constant time and memory, however big the region.
+
+        Args:
+            parent (Graph[T]): The grid to look into.
+            sizeX (int): The X size of the grid.
+            x (int): The X coordinate of the region's top-left cell.
+            y (int): The Y coordinate of the region's top-left cell.
+            width (int): The X size of the region.
+            height (int): The Y size of the region.
+
+        Raises:
+            ValueError: The region isn't all inside the grid.
+
+        Returns:
+            SubgraphView[T]: The view, with the region's cells numbered row by row.
+
+        >>> grid = Graph.createGraph(4, 4)
+        >>> grid.addLinks([(5, 6), (6, 10), (10, 11), (6, 7)])
+        >>> room = SubgraphView.region(grid, 4, 1, 1, 2, 2)
+        >>> room
+        ['None -> [1]', 'None -> [0, 3]', 'None -> []', 'None -> [1]']
+        >>> room.parentIndexOf(3), room.viewIndexOf(11)
+        (10, -1)
+        >>> SubgraphView.region(grid, 4, 3, 3, 2, 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: Invalid region `(3, 3, 2, 1)` given.
+        """
+        if (
+            (sizeX <= 0)
+            or (x < 0)
+            or (y < 0)
+            or (width < 0)
+            or (height < 0)
+            or (x + width > sizeX)
+            or ((y + height) * sizeX > len(parent))
+        ):
+            raise ValueError(f"Invalid region `({x}, {y}, {width}, {height})` given.")
+
+        view = SubgraphView[T](parent, [])
+        view.__indices = None
+        view.__sizeX = sizeX
+        view.__x = x
+        view.__y = y
+        view.__width = width
+        view.__height = height
+        return view
+
+    def __iter__(self) -> Generator[Node[T], None, None]:
+        """Make this class iterable
+
+        Yields:
+            Generator[Node[T], None, None]: A fresh node object for each node in the view, in index order.
+        """
+        for index in range(len(self)):
+            weights = self._neighbourWeights(index)
+            yield Node[T](
+                self._dataAt(index),
+                list(self._neighbours(index)),
+                None if weights is None else list(weights),
+            )
+
+    def __len__(self) -> int:
+        if self.__indices is not None:
+            return len(self.__indices)
+        return self.__width * self.__height
+
+    def _neighbours(self, index: int) -> Sequence[int]:
+        if self.__indices is None:
+            # work the region's indices out inline, as this is called once per node by every traversal
+            sizeX, left, top = self.__sizeX, self.__x, self.__y
+            width, height = self.__width, self.__height
+            y, x = divmod(index, width)
+            connections = []
+            for connection in self.__parent._neighbours((top + y) * sizeX + left + x):
+                connectionY, connectionX = divmod(connection, sizeX)
+                connectionX -= left
+                connectionY -= top
+                if (width > connectionX >= 0) and (height > connectionY >= 0):
+                    connections.append(connectionY * width + connectionX)
+            return connections
+
+        viewIndexOf = self.__viewIndexOf
+        viewIndices = (
+            viewIndexOf(connection)
+            for connection in self.__parent._neighbours(self.__parentIndexOf(index))
+        )
+        return [viewIndex for viewIndex in viewIndices if viewIndex != -1]
+
+    def _neighbourWeights(self, index: int) -> Optional[Sequence[float]]:
+        parentIndex = self.__parentIndexOf(index)
+        weights = self.__parent._neighbourWeights(parentIndex)
+        if weights is None:
+            return None
+        # the weights of the connections that stay in the view, in the same order as `_neighbours`
+        viewIndexOf = self.__viewIndexOf
+        return [
+            weight
+            for connection, weight in zip(self.__parent._neighbours(parentIndex), weights)
+            if viewIndexOf(connection) != -1
+        ]
+
+    def _dataAt(self, index: int) -> Optional[T]:
+        return self.__parent._dataAt(self.__parentIndexOf(index))
+
+    def _setDataAt(self, index: int, newValue: Optional[T]) -> None:
+        self.__parent._setDataAt(self.__parentIndexOf(index), newValue)
+
+    def parentIndexOf(self, index: int) -> int:
+        """Get the graph's index of a node in the view.
+
+        Args:
+            index (int): The view's index of the node.
+
+        Raises:
+            IndexError: The index is out of range.
+
+        Returns:
+            int: The graph's index of the node.
+        """
+        self.__checkIndexIsValidWithException(index)
+        return self.__parentIndexOf(index)
+
+    def viewIndexOf(self, parentIndex: int) -> int:
+        """Get the view's index of one of the graph's nodes.
+
+        Args:
+            parentIndex (int): The graph's index of the node.
+
+        Returns:
+            int: The view's index of the node, or -1 if it isn't in the view.
+        """
+        return self.__viewIndexOf(parentIndex)
+
+    def getVersion(self) -> int:
+        """Get the version of the graph the view looks into, which goes up every time its connections are changed, whether
+        through the view or not.
+
+        Returns:
+            int: The version.
+        """
+        return self.__parent.getVersion()
+
+    def snapshot(self) -> "SubgraphView[T]":
+        """Take a snapshot of the view as it is now: the same view of a snapshot of the graph it looks into. This takes
+        constant time, as the graph only copies what it changes afterwards.
+
+        Returns:
+            SubgraphView[T]: The snapshot, which can't be changed.
+
+        >>> corridor = Graph[None].createGraphFromEdges(4, [(0, 1), (1, 2), (2, 3)], bidirectional=True)
+        >>> middle = SubgraphView(corridor, [1, 2])
+        >>> frozen = middle.snapshot()
+        >>> corridor.removeLinkBetween(1, 2)
+        >>> middle.sameComponent(0, 1), frozen.sameComponent(0, 1)
+        (False, True)
+        """
+        if self.isSnapshot():
+            return self
+
+        view: SubgraphView[T] = super().snapshot()  # type: ignore
+        view.__parent = self.__parent.snapshot()
+        return view
+
+    def isSnapshot(self) -> bool:
+        """Check whether the view is of a snapshot of a graph, and so can't be changed.
+
+        Returns:
+            bool: Whether the view is of a snapshot.
+        """
+        return self.__parent.isSnapshot()
+
+    def setNodesFromNodesList(self, nodes: list[Node[T]]) -> None:
+        """A view's nodes can't be replaced, as they are the graph's.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("A subgraph view's nodes can't be replaced.")
+
+    def setNodesFromValuesAndConnections(
+        self,
+        values: list[T],
+        connectionsPointers: list[list[int]],
+        compact: bool = False,
+    ) -> None:
+        """A view's nodes can't be replaced, as they are the graph's.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("A subgraph view's nodes can't be replaced.")
+
+    def connectionExistsFrom(self, indexA: int, indexB: int) -> bool:
+        if not self._exists(indexA):
+            raise IndexError("Node at index {} is nonexistent.".format(str(indexA)))
+        return indexB in self._neighbours(indexA % len(self))
+
+    def isCompact(self) -> bool:
+        """Check whether the graph the view looks into is stored compactly.
+
+        Returns:
+            bool: Whether the graph is compact.
+        """
+        return self.__parent.isCompact()
+
+    def compact(self) -> None:
+        """Does nothing, as the view has no storage of its own to pack; compact the graph instead."""
+        return
+
+    def memoryUsage(self) -> int:
+        """Estimate the number of bytes the view takes up, not counting the graph it looks into, or `indices`, which belongs
+        to whoever made the view.
+
+        Returns:
+            int: The estimated number of bytes.
+        """
+        total = sys.getsizeof(self)
+        if self.__viewIndices is not None:
+            total += sys.getsizeof(self.__viewIndices)
+        return total
+
+    def _exists(self, nodePointer: int) -> bool:
+        return len(self) > nodePointer >= -len(self)
+
+    def removeLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = True,
+    ) -> None:
+        """Removes a link between two nodes in the view, from the graph.
+
+        Args:
+            indexFrom (int): The `from` node to disconnect from the `to`
+            indexTo (int): The `to` node
+            bidirectional (bool, optional): Whether or not to remove the link both ways. Defaults to True.
+        """
+        self.__parent.removeLinkBetween(
+            self.parentIndexOf(indexFrom), self.parentIndexOf(indexTo), bidirectional
+        )
+
+    def addLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = True,
+        weight: Optional[float] = None,
+    ) -> None:
+        """Add a link between two nodes in the view, to the graph.
+
+        Args:
+            indexFrom (int): the 'from' node to connect to the 'to'
+            indexTo (int): the 'to' node
+            bidirectional (bool, optional): Whether or not to connect the link both ways. Defaults to True.
+            weight (Optional[float], optional): The cost of the link. Defaults to None, meaning it costs 1.
+        """
+        self.__parent.addLinkBetween(
+            self.parentIndexOf(indexFrom),
+            self.parentIndexOf(indexTo),
+            bidirectional,
+            weight,
+        )
+
+    def addLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = True,
+        weights: Optional[Iterable[float]] = None,
+    ) -> None:
+        """Add many links between nodes in the view at once, to the graph.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of the view's node indices to link.
+            bidirectional (bool, optional): Whether or not to also link each `to` node back to its `from` node. Defaults to True.
+            weights (Optional[Iterable[float]], optional): The cost of each link. Defaults to None, meaning each costs 1.
+        """
+        self.__parent.addLinks(self.__parentEdges(edges), bidirectional, weights)
+
+    def removeLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = True,
+    ) -> None:
+        """Remove many links between nodes in the view at once, from the graph.
+
+        Args:
+            edges (Iterable[Tuple[int, int]]): The `(from, to)` pairs of the view's node indices to unlink.
+            bidirectional (bool, optional): Whether or not to also remove the link from each `to` node back to its `from` node. Defaults to True.
+        """
+        self.__parent.removeLinks(self.__parentEdges(edges), bidirectional)
+
+    def __parentEdges(self, edges: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Turn pairs of the view's node indices into pairs of the graph's.
+
+        Raises:
+            IndexError: An index is out of range.
+        """
+        return [
+            (self.parentIndexOf(indexFrom), self.parentIndexOf(indexTo))
+            for indexFrom, indexTo in edges
+        ]
+
+    def __parentIndexOf(self, index: int) -> int:
+        """Get the graph's index of a node in the view. The index is not bounds-checked."""
+        if self.__indices is not None:
+            return self.__indices[index]
+        y, x = divmod(index, self.__width)
+        return (self.__y + y) * self.__sizeX + self.__x + x
+
+    def __viewIndexOf(self, parentIndex: int) -> int:
+        """Get the view's index of one of the graph's nodes, or -1 if it isn't in the view."""
+        if self.__indices is None:
+            y, x = divmod(parentIndex, self.__sizeX)
+            x -= self.__x
+            y -= self.__y
+            if (self.__width > x >= 0) and (self.__height > y >= 0):
+                return y * self.__width + x
+            return -1
+
+        if self.__viewIndices is None:
+            self.__viewIndices = {
+                parentIndex: index for index, parentIndex in enumerate(self.__indices)
+            }
+        return self.__viewIndices.get(parentIndex, -1)
+
+    def __checkIndexIsValidWithException(self, index: int) -> bool:
+        if not (len(self) > index >= 0):
+            raise IndexError("Node at index {} is out of range.".format(str(index)))
+        return True
@@ -0,0 +1,49 @@
+from graph import Graph as Graph
+from graph_node import Node as Node
+from typing import Generator, Iterable, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class SubgraphView(Graph[T]):
+    def __init__(self, parent: Graph[T], indices: Sequence[int]) -> None: ...
+    @staticmethod
+    def region(
+        parent: Graph[T], sizeX: int, x: int, y: int, width: int, height: int
+    ) -> SubgraphView[T]: ...
+    def __iter__(self) -> Generator[Node[T], None, None]: ...
+    def __len__(self) -> int: ...
+    def parentIndexOf(self, index: int) -> int: ...
+    def viewIndexOf(self, parentIndex: int) -> int: ...
+    def getVersion(self) -> int: ...
+    def snapshot(self) -> SubgraphView[T]: ...
+    def isSnapshot(self) -> bool: ...
+    def setNodesFromNodesList(self, nodes: list[Node[T]]) -> None: ...
+    def setNodesFromValuesAndConnections(
+        self,
+        values: list[T],
+        connectionsPointers: list[list[int]],
+        compact: bool = ...,
+    ) -> None: ...
+    def connectionExistsFrom(self, indexA: int, indexB: int) -> bool: ...
+    def isCompact(self) -> bool: ...
+    def compact(self) -> None: ...
+    def memoryUsage(self) -> int: ...
+    def removeLinkBetween(
+        self, indexFrom: int, indexTo: int, bidirectional: bool = ...
+    ) -> None: ...
+    def addLinkBetween(
+        self,
+        indexFrom: int,
+        indexTo: int,
+        bidirectional: bool = ...,
+        weight: Optional[float] = ...,
+    ) -> None: ...
+    def addLinks(
+        self,
+        edges: Iterable[Tuple[int, int]],
+        bidirectional: bool = ...,
+        weights: Optional[Iterable[float]] = ...,
+    ) -> None: ...
+    def removeLinks(
+        self, edges: Iterable[Tuple[int, int]], bidirectional: bool = ...
+    ) -> None: ...
@@ -26,8 +26,25 @@ setup(
             "linked_list_node.pyi",
             "graph.pyi",
             "graph_node.pyi",
+            "grid_graph.pyi",
+            "subgraph_view.pyi",
+            "maze_generator.pyi",
+            "disjoint_set.pyi",
+            "csr_adjacency.pyi",
+            "graph_file.pyi",
+            "edge_list_reader.pyi",
+            "graph_query_pool.pyi",
+            "indexed_heap.pyi",
+            "corridor_contraction.pyi",
+            "hierarchical_index.pyi",
+            "landmark_oracle.pyi",
+            "path_result.pyi",
+            "biconnectivity.pyi",
             "circular_queue.pyi",
             "_queue_position.pyi",
+            "_traversal_order.pyi",
+            "_search_checkpoint.pyi",
+            "_maze_algorithm.pyi",
         ]
     },
     packages=["iron_datastructures"],